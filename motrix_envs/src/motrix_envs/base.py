@@ -32,6 +32,14 @@ class EnvCfg:
     max_episode_seconds: float = None
     ctrl_dt: float = 0.01
     render_spacing: float = 1.0
+    # When enabled, ``NpEnv.step`` always returns the obs/reward/terminated/truncated arrays allocated at
+    # ``init_state``, so callers may hold references to them across steps. When disabled, every step returns
+    # new arrays, which later steps never overwrite. Tasks write through ``out=`` into the arrays of the state
+    # passed to them in both modes.
+    inplace_state: bool = False
+    # When enabled, the envs created from the same model file and ``sim_dt`` share one scene model loaded once per
+    # process, see ``motrix_envs.np.model_cache``. Disable it to get a model that may be modified.
+    cache_model: bool = True
 
     @property
     def max_episode_steps(self) -> Optional[int]:
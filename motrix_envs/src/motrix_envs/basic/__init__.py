@@ -12,20 +12,3 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-
-from . import (  # noqa: F401 import to register envs
-    acrobot,
-    bounce_ball,
-    cartpole,
-    cheetah,
-    finger,
-    hopper,
-    humanoid,
-    lqr,
-    manipulator,
-    pendulum,
-    point_mass,
-    quadruped,
-    reacher,
-    walker,
-)
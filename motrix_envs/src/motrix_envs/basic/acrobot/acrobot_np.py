@@ -129,10 +129,8 @@ class AcrobotEnv(NpEnv):
         data.reset(self._model)
         num_reset = data.shape[0]
 
-        shoulder_angle = np.random.uniform(-np.pi, np.pi, size=num_reset).astype(np.float32)
-        elbow_angle = np.random.uniform(-np.pi, np.pi, size=num_reset).astype(np.float32)
-
-        dof_pos = np.stack([shoulder_angle, elbow_angle], axis=-1)
+        # shoulder and elbow angles
+        dof_pos = self._rng.uniform(-np.pi, np.pi, size=(num_reset, 2)).astype(np.float32)
         dof_vel = np.zeros((*data.shape, self._num_dof_vel), dtype=np.float32)
 
         data.set_dof_vel(dof_vel)
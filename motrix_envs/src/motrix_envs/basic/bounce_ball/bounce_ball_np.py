@@ -550,23 +550,19 @@ class BounceBallEnv(NpEnv):
         # Randomize target heights for the environments being reset
         if cfg.randomize_target_height:
             min_height, max_height = cfg.target_height_range
-            new_target_heights = np.random.uniform(min_height, max_height, num_reset).astype(np.float32)
+            new_target_heights = self._rng.uniform(min_height, max_height, num_reset).astype(np.float32)
         else:
             # Use mean of target_height_range when not randomizing
             default_height = np.mean(cfg.target_height_range)
             new_target_heights = np.full(num_reset, default_height, dtype=np.float32)
 
-        # Add noise to initial arm joint positions only (not ball)
-        arm_noise_pos = np.random.uniform(
-            -cfg.reset_noise_scale,
-            cfg.reset_noise_scale,
-            (num_reset, 6),  # Only 6 arm joints
-        )
-        noise_vel = np.random.uniform(
-            -cfg.reset_noise_scale,
-            cfg.reset_noise_scale,
-            (num_reset, self._num_dof_vel),
-        )
+        # Add noise to initial arm joint positions (only 6 arm joints), all velocities and the ball position
+        noise_scale = np.full(6 + self._num_dof_vel + 3, cfg.reset_noise_scale)
+        noise_scale[-3:] = 0.01
+        noise = self._rng.uniform(-noise_scale, noise_scale, (num_reset, noise_scale.shape[0]))
+        arm_noise_pos = noise[:, :6]
+        noise_vel = noise[:, 6:-3]
+        ball_noise_pos = noise[:, -3:]
 
         # Reset simulation first to get proper DOF structure
         data.reset(self._model)
@@ -579,7 +575,6 @@ class BounceBallEnv(NpEnv):
         current_dof_pos[:, :6] = np.tile(self._init_arm_qpos, (num_reset, 1)) + arm_noise_pos
 
         # Set ball position in DOF (indices 6-8 for x, y, z positions)
-        ball_noise_pos = np.random.uniform(-0.01, 0.01, (num_reset, 3))
         ball_pos = self._ball_init_pos + ball_noise_pos
         current_dof_pos[:, 6:9] = ball_pos
 
@@ -56,36 +56,30 @@ class CartPoleEnv(NpEnv):
         data = state.data
         dof_pos = data.dof_pos
         dof_vel = data.dof_vel
-        obs = np.concatenate([dof_pos, dof_vel], axis=-1)
-        assert obs.shape == (self._num_envs, 4)
+        np.concatenate([dof_pos, dof_vel], axis=-1, out=state.obs)
 
         # compute reward
-        reward = np.ones((self._num_envs,), dtype=np.float32)
+        state.reward.fill(1.0)
 
         # compute terminated
         cart_pos = dof_pos[:, 0]
         angle = dof_pos[:, 1]
-        terminated = np.logical_or(np.isnan(angle), np.abs(angle) > 0.2)
-        terminated = np.logical_or(cart_pos < -0.8, terminated)
-        terminated = np.logical_or(cart_pos > 0.8, terminated)
-
-        state.obs = obs
-        state.reward = reward
-        state.terminated = terminated
+        terminated = state.terminated
+        np.greater(np.abs(angle), 0.2, out=terminated)
+        terminated |= np.isnan(angle)
+        terminated |= cart_pos < -0.8
+        terminated |= cart_pos > 0.8
         return state
 
     def reset(self, data: mtx.SceneData):
         cfg: CartPoleEnvCfg = self._cfg
-        noise_pos = np.random.uniform(
-            -cfg.reset_noise_scale,
-            cfg.reset_noise_scale,
-            (*data.shape, self._num_dof_pos),
-        )
-        noise_vel = np.random.uniform(
+        noise = self._rng.uniform(
             -cfg.reset_noise_scale,
             cfg.reset_noise_scale,
-            (*data.shape, self._num_dof_vel),
+            (*data.shape, self._num_dof_pos + self._num_dof_vel),
         )
+        noise_pos = noise[:, : self._num_dof_pos]
+        noise_vel = noise[:, self._num_dof_pos :]
 
         dof_pos = np.tile(self._init_dof_pos, (*data.shape, 1)) + noise_pos
         dof_vel = np.tile(self._init_dof_vel, (*data.shape, 1)) + noise_vel
@@ -109,7 +109,7 @@ class CheetahEnv(NpEnv):
         high = self._joint_limits[1, limited_idx]
 
         qpos = data.dof_pos
-        qpos[:, limited_idx] = np.random.uniform(low, high, size=(num, len(limited_idx)))
+        qpos[:, limited_idx] = self._rng.uniform(low, high, size=(num, len(limited_idx)))
         data.set_dof_pos(qpos, self._model)
 
         for _ in range(200):
@@ -71,6 +71,12 @@ class FingerBaseCfg(EnvCfg):
 
     # Reset sampling
     reset_collision_free_attempts: int = 200
+    # Pool of collision-free joint angles sampled by reset instead of running the rejection sampler, see
+    # ``motrix_envs.np.reset_pool``. 0 disables it. A state serves ``reset_pool_max_uses`` resets before it is
+    # regenerated; refilling in the background makes the sampled states depend on its timing.
+    reset_pool_size: int = 0
+    reset_pool_max_uses: int = 1
+    reset_pool_async: bool = True
 
 
 @registry.envcfg("dm-finger-spin")
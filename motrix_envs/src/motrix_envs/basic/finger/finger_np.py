@@ -13,6 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 
+from typing import Optional
+
 import gymnasium as gym
 import motrixsim as mtx
 import numpy as np
@@ -20,6 +22,8 @@ import numpy as np
 from motrix_envs import registry
 from motrix_envs.basic.finger.cfg import FingerBaseCfg
 from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.reset_pool import ResetPool
+from motrix_envs.np.rng import EnvRng
 
 
 def _sanitize_joint_limits(low: np.ndarray, high: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -32,6 +36,8 @@ class FingerEnv(NpEnv):
     _cfg: FingerBaseCfg
     _observation_space: gym.spaces.Box
     _action_space: gym.spaces.Box
+    # collision-free joint angles, created on the first reset when cfg.reset_pool_size > 0
+    _reset_pool: ResetPool = None
 
     def __init__(self, cfg: FingerBaseCfg, num_envs: int = 1):
         super().__init__(cfg, num_envs=num_envs)
@@ -132,28 +138,25 @@ class FingerEnv(NpEnv):
             return None
 
     def _reset_collision_free_joint_angles(
-        self, data: mtx.SceneData, dof_pos: np.ndarray, target_free_pos: slice | None
+        self, data: mtx.SceneData, dof_pos: np.ndarray, target_free_pos: slice | None, rng: EnvRng
     ):
         # Randomize joint angles with a collision-free rejection sampler (dm_control-style).
         # The MotrixSim joint_limits are per-joint (not per-DOF), so we explicitly fill each DOF.
         num = int(data.shape[0])
         max_attempts = int(getattr(self._cfg, "reset_collision_free_attempts", 200))
         pending = np.ones((num,), dtype=bool)
+        joints = [self._model.get_joint_index(joint_name) for joint_name in ("proximal", "distal")]
+        dof_indices = np.array([self._joint_pos_index("proximal"), self._joint_pos_index("distal"), self._hinge_qpos_i])
+        low = np.array([*self._joint_limit_low[joints], -np.pi])
+        high = np.array([*self._joint_limit_high[joints], np.pi])
         for _ in range(max_attempts):
             if not pending.any():
                 break
 
-            num_pending = int(pending.sum())
-            for joint_name in ("proximal", "distal"):
-                j = self._model.get_joint_index(joint_name)
-                dof_i = self._joint_pos_index(joint_name)
-                low = float(self._joint_limit_low[j])
-                high = float(self._joint_limit_high[j])
-                dof_pos[pending, dof_i] = np.random.uniform(low=low, high=high, size=(num_pending,)).astype(np.float32)
-
-            # Sample hinge position (unlimited in model)
-            dof_pos[pending, self._hinge_qpos_i] = np.random.uniform(
-                low=-np.pi, high=np.pi, size=(num_pending,)
+            # Sample proximal, distal and hinge positions (hinge unlimited in model) of the pending envs at once
+            rows = np.flatnonzero(pending)
+            dof_pos[rows[:, None], dof_indices] = rng.uniform(
+                low=low, high=high, size=(rows.shape[0], dof_indices.shape[0]), rows=rows
             ).astype(np.float32)
 
             if target_free_pos is not None:
@@ -164,6 +167,43 @@ class FingerEnv(NpEnv):
             self._model.forward_kinematic(data)
             pending = self._model.get_contact_query(data).num_contacts > 0
 
+    def _generate_reset_states(self, data: mtx.SceneData, rng: EnvRng) -> dict[str, np.ndarray]:
+        dof_pos = np.zeros((int(data.shape[0]), self._model.num_dof_pos), dtype=np.float32)
+        target_free_pos = self._maybe_init_target_freejoint(dof_pos)
+        self._reset_collision_free_joint_angles(data, dof_pos, target_free_pos, rng)
+        return {"dof_pos": dof_pos}
+
+    def _get_reset_pool(self) -> Optional[ResetPool]:
+        cfg = self._cfg
+        if self._reset_pool is None and cfg.reset_pool_size > 0:
+            # a background refill must not touch the model this env steps meanwhile
+            generator = self._detached_copy() if cfg.reset_pool_async else self
+            self._reset_pool = ResetPool(
+                generator.model,
+                generator._generate_reset_states,
+                size=cfg.reset_pool_size,
+                max_uses=cfg.reset_pool_max_uses,
+                refill_async=cfg.reset_pool_async,
+                rng=self._rng.derive(cfg.reset_pool_size),
+            )
+        return self._reset_pool
+
+    def _reset_joint_angles(self, data: mtx.SceneData) -> tuple[np.ndarray, slice | None]:
+        # Reset to collision-free joint angles, copied in from the reset pool when enabled.
+        data.reset(self._model)
+        num = int(data.shape[0])
+        dof_pos = np.zeros((num, self._model.num_dof_pos), dtype=np.float32)
+        target_free_pos = self._maybe_init_target_freejoint(dof_pos)
+        pool = self._get_reset_pool()
+        if pool is not None and num <= pool.size:
+            dof_pos[:] = pool.sample(num)["dof_pos"]
+            data.set_dof_pos(dof_pos, self._model)
+            data.set_dof_vel(np.zeros((num, self._model.num_dof_vel), dtype=np.float32))
+            self._model.forward_kinematic(data)
+        else:
+            self._reset_collision_free_joint_angles(data, dof_pos, target_free_pos, self._rng)
+        return dof_pos, target_free_pos
+
     def reset(self, data: mtx.SceneData) -> tuple[np.ndarray, dict]:
         raise NotImplementedError
 
@@ -250,11 +290,8 @@ class FingerSpinEnv(FingerEnv):
         return state.replace(obs=obs, reward=rwd, terminated=terminated)
 
     def reset(self, data: mtx.SceneData) -> tuple[np.ndarray, dict]:
-        data.reset(self._model)
         num = int(data.shape[0])
-        dof_pos = np.zeros((num, self._model.num_dof_pos), dtype=np.float32)
-        target_free_pos = self._maybe_init_target_freejoint(dof_pos)
-        self._reset_collision_free_joint_angles(data, dof_pos, target_free_pos)
+        self._reset_joint_angles(data)
 
         info: dict = {"Reward": {}}
         info["actions"] = np.zeros((num, self._model.num_actuators), dtype=np.float32)
@@ -381,16 +418,13 @@ class FingerTurnEnv(FingerEnv):
         return state.replace(obs=obs, reward=rwd, terminated=terminated)
 
     def reset(self, data: mtx.SceneData) -> tuple[np.ndarray, dict]:
-        data.reset(self._model)
         num = int(data.shape[0])
-        dof_pos = np.zeros((num, self._model.num_dof_pos), dtype=np.float32)
-        target_free_pos = self._maybe_init_target_freejoint(dof_pos)
-        self._reset_collision_free_joint_angles(data, dof_pos, target_free_pos)
+        dof_pos, target_free_pos = self._reset_joint_angles(data)
 
         hinge_xyz = self._spinner.get_position(data)
         # Match dm_control: radius = cap1.geom_size.sum() for capsule (radius + half-length).
         radius = float(np.sum(self._cap1.size[:2]))
-        target_angle = np.random.uniform(-np.pi, np.pi, size=(num,))
+        target_angle = self._rng.uniform(-np.pi, np.pi, size=(num,))
         target_x = hinge_xyz[:, 0] + radius * np.sin(target_angle)
         target_z = hinge_xyz[:, 2] + radius * np.cos(target_angle)
         self._target_xyz = np.stack([target_x, hinge_xyz[:, 1], target_z], axis=-1).astype(np.float32)
@@ -182,7 +182,7 @@ class HopperEnv(NpEnv):
         dof_pos[:, 2] = 0
 
         if self._model.num_dof_pos > 3:
-            dof_pos[:, 3:] = np.random.uniform(
+            dof_pos[:, 3:] = self._rng.uniform(
                 low=self._joint_limits[0, 3:],
                 high=self._joint_limits[1, 3:],
                 size=(num_env, self._model.num_dof_pos - 3),
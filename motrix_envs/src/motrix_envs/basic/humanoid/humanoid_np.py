@@ -29,6 +29,7 @@ from motrix_envs.np.env import NpEnv, NpEnvState
 class Humanoid3DEnv(NpEnv):
     _observation_space: gym.spaces.Box
     _action_space: gym.spaces.Box
+    profile_methods = ("update_observation", "update_terminated", "update_reward")
 
     def __init__(self, cfg: HumanoidWalkCfg, num_envs=1):
         super().__init__(cfg, num_envs)
@@ -42,6 +43,9 @@ class Humanoid3DEnv(NpEnv):
         self._right_hand = self._model.get_link("right_hand")
         self._left_foot = self._model.get_link("left_foot")
         self._right_foot = self._model.get_link("right_foot")
+        # in observation order
+        self._extremities = (self._left_hand, self._left_foot, self._right_hand, self._right_foot)
+        self._com_velocimeter = self.sensor_group(["torso_subtreelinvel"])
 
         self._move_speed = float(cfg.move_speed)
         self._stand_height = float(cfg.stand_height)
@@ -175,7 +179,7 @@ class Humanoid3DEnv(NpEnv):
         torso_rot = self._torso.get_rotation_mat(data)
         torso_vertical = torso_rot[:, 2, :]
 
-        com_vel = self._model.get_sensor_value("torso_subtreelinvel", data)
+        com_vel = self._com_velocimeter.read(data)
 
         qvel = data.dof_vel
         target_direction_local = self._get_target_direction_local(data)
@@ -199,20 +203,11 @@ class Humanoid3DEnv(NpEnv):
         torso_rot = self._torso.get_rotation_mat(data)
         torso_pos = self._torso.get_position(data)
 
-        parts = [
-            self._left_hand.get_position(data),
-            self._left_foot.get_position(data),
-            self._right_hand.get_position(data),
-            self._right_foot.get_position(data),
-        ]
-        out = []
-
-        for p in parts:
-            torso_to_limb = p - torso_pos
-            v_body = np.einsum("ni,nij->nj", torso_to_limb, torso_rot)
-            out.append(v_body)
-
-        return np.concatenate(out, axis=-1)
+        limb_pos = np.stack([limb.get_position(data) for limb in self._extremities], axis=1)
+        limb_pos -= torso_pos[:, None, :]
+        # (n, limbs, 3) @ (n, 3, 3), the limb offsets in the torso frame
+        v_body = np.matmul(limb_pos, torso_rot)
+        return v_body.reshape(data.shape[0], -1)
 
     def _get_target_direction_local(self, data: mtx.SceneData) -> np.ndarray:
         n = int(data.shape[0])
@@ -277,7 +272,7 @@ class Humanoid3DEnv(NpEnv):
         target_dir_xy = self._target_direction_xy
 
         ctrls = data.actuator_ctrls
-        com_vel = self._model.get_sensor_value("torso_subtreelinvel", data)
+        com_vel = self._com_velocimeter.read(data)
 
         if self._move_speed <= 0.0:
             energy_reward = np.exp(-1.0 * np.mean(np.square(ctrls), axis=-1))
@@ -388,6 +383,8 @@ class Humanoid3DEnv(NpEnv):
         self._hip_yaw_range = tuple(np.deg2rad(x) for x in init_cfg.hip_yaw_range)
         self._hip_roll_range = tuple(np.deg2rad(x) for x in init_cfg.hip_roll_range)
         self._hip_pitch_range = tuple(np.deg2rad(x) for x in init_cfg.hip_pitch_range)
+        # (low, high) of qpos 7-9 in qpos order: abdomen_z (yaw), abdomen_y (pitch), abdomen_x (roll)
+        self._abdomen_range = np.array([self._hip_yaw_range, self._hip_pitch_range, self._hip_roll_range]).T
 
         self._symmetric_leg_pairs_rad = [
             (left_idx, right_idx, tuple(np.deg2rad(x) for x in deg_range))
@@ -415,18 +412,16 @@ class Humanoid3DEnv(NpEnv):
         qpos[:, 3] = 1.0
 
         # qpos 7=abdomen_z (yaw), 8=abdomen_y (pitch), 9=abdomen_x (roll) per humanoid.xml
-        qpos[:, 7] = np.random.uniform(self._hip_yaw_range[0], self._hip_yaw_range[1], size=(n,))
-        qpos[:, 8] = np.random.uniform(self._hip_pitch_range[0], self._hip_pitch_range[1], size=(n,))
-        qpos[:, 9] = np.random.uniform(self._hip_roll_range[0], self._hip_roll_range[1], size=(n,))
+        qpos[:, 7:10] = self._rng.uniform(self._abdomen_range[0], self._abdomen_range[1], size=(n, 3))
 
         self._randomize_symmetric_legs(qpos, n, num_dof_pos, low, high)
         self._randomize_symmetric_arms(qpos, n, num_dof_pos, low, high)
         self._randomize_remaining_joints(qpos, n, num_dof_pos, low, high)
 
-        qvel = np.random.uniform(-self._reset_qvel_range, self._reset_qvel_range, size=(n, num_dof_vel)).astype(
+        qvel = self._rng.uniform(-self._reset_qvel_range, self._reset_qvel_range, size=(n, num_dof_vel)).astype(
             np.float32
         )
-        actuator_ctrls = np.random.uniform(
+        actuator_ctrls = self._rng.uniform(
             -self._reset_actuator_range, self._reset_actuator_range, size=(n, num_actuators)
         ).astype(np.float32)
 
@@ -442,7 +437,7 @@ class Humanoid3DEnv(NpEnv):
     ) -> None:
         for left_idx, right_idx, (min_rad, max_rad) in self._symmetric_leg_pairs_rad:
             if left_idx < num_dof_pos:
-                qpos[:, left_idx] = np.random.uniform(
+                qpos[:, left_idx] = self._rng.uniform(
                     np.clip(min_rad, low[left_idx], high[left_idx]),
                     np.clip(max_rad, low[left_idx], high[left_idx]),
                     size=(n,),
@@ -450,7 +445,7 @@ class Humanoid3DEnv(NpEnv):
             if right_idx < num_dof_pos:
                 right_min_rad = -max_rad
                 right_max_rad = -min_rad
-                qpos[:, right_idx] = np.random.uniform(
+                qpos[:, right_idx] = self._rng.uniform(
                     np.clip(right_min_rad, low[right_idx], high[right_idx]),
                     np.clip(right_max_rad, low[right_idx], high[right_idx]),
                     size=(n,),
@@ -460,7 +455,7 @@ class Humanoid3DEnv(NpEnv):
         self, qpos: np.ndarray, n: int, num_dof_pos: int, low: np.ndarray, high: np.ndarray
     ) -> None:
         # Default range when model joint_limits are missing (low/high are ±inf);
-        # np.random.uniform requires finite bounds.
+        # uniform draws require finite bounds.
         default_lo, default_hi = -np.pi, np.pi
         for left_idx, right_idx in self._symmetric_arm_pairs:
             if left_idx < num_dof_pos and right_idx < num_dof_pos:
@@ -482,14 +477,14 @@ class Humanoid3DEnv(NpEnv):
                 right_max_clipped = min(right_max, hi_r)
 
                 if left_min < left_max:
-                    qpos[:, left_idx] = np.random.uniform(left_min, left_max, size=(n,))
+                    qpos[:, left_idx] = self._rng.uniform(left_min, left_max, size=(n,))
                 else:
-                    qpos[:, left_idx] = np.random.uniform(lo_l, hi_l, size=(n,))
+                    qpos[:, left_idx] = self._rng.uniform(lo_l, hi_l, size=(n,))
 
                 if right_min_clipped < right_max_clipped:
-                    qpos[:, right_idx] = np.random.uniform(right_min_clipped, right_max_clipped, size=(n,))
+                    qpos[:, right_idx] = self._rng.uniform(right_min_clipped, right_max_clipped, size=(n,))
                 else:
-                    qpos[:, right_idx] = np.random.uniform(lo_r, hi_r, size=(n,))
+                    qpos[:, right_idx] = self._rng.uniform(lo_r, hi_r, size=(n,))
 
     def _randomize_remaining_joints(
         self, qpos: np.ndarray, n: int, num_dof_pos: int, low: np.ndarray, high: np.ndarray
@@ -503,4 +498,4 @@ class Humanoid3DEnv(NpEnv):
             if i not in used_indices:
                 lo = low[i] if np.isfinite(low[i]) else default_lo
                 hi = high[i] if np.isfinite(high[i]) else default_hi
-                qpos[:, i] = np.random.uniform(lo, hi, size=(n,))
+                qpos[:, i] = self._rng.uniform(lo, hi, size=(n,))
@@ -145,7 +145,7 @@ class LqrEnv(NpEnv):
         data.reset(self._model)
         num_envs = int(data.shape[0])
 
-        qpos = np.random.standard_normal((num_envs, self._nq)).astype(np.float32)
+        qpos = self._rng.standard_normal((num_envs, self._nq)).astype(np.float32)
         norms = np.linalg.norm(qpos, axis=-1, keepdims=True)
         zero_norm = norms[:, 0] < 1e-8
         if np.any(zero_norm):
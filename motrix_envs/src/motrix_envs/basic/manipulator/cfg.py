@@ -54,6 +54,12 @@ class BringBallCfg(EnvCfg):
     # Internally this will be converted to `settle_steps * sim_substeps` physics steps.
     settle_steps: int = 80
     settle_zero_vel: bool = True
+    # Pool of settled initial states sampled by reset instead of settling each reset batch, see
+    # ``motrix_envs.np.reset_pool``. 0 disables it. A state serves ``reset_pool_max_uses`` resets before it is
+    # regenerated; refilling in the background makes the sampled states depend on its timing.
+    reset_pool_size: int = 0
+    reset_pool_max_uses: int = 1
+    reset_pool_async: bool = True
 
     # BringBall reward shaping.
     lift_height_threshold: float = 0.04
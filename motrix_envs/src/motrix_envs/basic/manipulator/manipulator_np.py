@@ -13,6 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 
+from typing import Optional
+
 import gymnasium as gym
 import motrixsim as mtx
 import numpy as np
@@ -22,6 +24,8 @@ from motrix_envs.basic.manipulator.cfg import BringBallCfg
 from motrix_envs.math import quaternion
 from motrix_envs.np import reward as reward_utils
 from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.reset_pool import ResetPool
+from motrix_envs.np.rng import EnvRng
 
 _ARM_JOINTS = (
     "arm_root",
@@ -84,6 +88,8 @@ class ManipulatorBase(NpEnv):
     _cfg: BringBallCfg
     _observation_space: gym.spaces.Box
     _action_space: gym.spaces.Box
+    # settled initial states, created on the first reset when cfg.reset_pool_size > 0
+    _reset_pool: ResetPool = None
 
     def __init__(self, cfg: BringBallCfg, num_envs: int = 1):
         super().__init__(cfg, num_envs=num_envs)
@@ -100,6 +106,7 @@ class ManipulatorBase(NpEnv):
         self._fingertip_qpos_i = self._joint_pos_index("fingertip")
 
         self._grasp_site = self._model.get_site("grasp")
+        self._touch_sensors = self.sensor_group(_TOUCH_SENSORS)
         # Ensure correct actuator index is retrieved from base model
         self._grasp_act_i = int(self._model.get_actuator_index("grasp"))
 
@@ -170,11 +177,7 @@ class ManipulatorBase(NpEnv):
         return state
 
     def _touch_raw(self, data: mtx.SceneData) -> np.ndarray:
-        values = []
-        for name in _TOUCH_SENSORS:
-            v = np.asarray(self._model.get_sensor_value(name, data)).reshape(data.shape[0], -1)[:, 0]
-            values.append(v)
-        return np.stack(values, axis=-1).astype(np.float32)
+        return self._touch_sensors.read(data)
 
     def _touch_log(self, data: mtx.SceneData) -> np.ndarray:
         return np.log1p(self._touch_raw(data))
@@ -209,20 +212,17 @@ class ManipulatorBase(NpEnv):
         assert obs.shape == (data.shape[0], self._observation_space.shape[0])
         return obs.astype(np.float32)
 
-    def _sample_arm_joint_angles(self, num: int) -> np.ndarray:
+    def _sample_arm_joint_angles(self, num: int, rng: EnvRng) -> np.ndarray:
         joint_indices = np.array([self._model.get_joint_index(n) for n in _ARM_JOINTS], dtype=np.int32)
         low = self._joint_limit_low[joint_indices]
         high = self._joint_limit_high[joint_indices]
-        return np.random.uniform(low=low, high=high, size=(num, joint_indices.shape[0])).astype(np.float32)
+        return rng.uniform(low=low, high=high, size=(num, joint_indices.shape[0])).astype(np.float32)
 
-    def _sample_target_pose(self, num: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def _sample_target_pose(self, num: int, rng: EnvRng) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         cfg = self._cfg
-        target_x = np.random.uniform(cfg.target_x_range[0], cfg.target_x_range[1], size=(num,)).astype(np.float32)
-        target_z = np.random.uniform(cfg.target_z_range[0], cfg.target_z_range[1], size=(num,)).astype(np.float32)
-        target_angle = np.random.uniform(cfg.target_angle_range[0], cfg.target_angle_range[1], size=(num,)).astype(
-            np.float32
-        )
-        return target_x, target_z, target_angle
+        ranges = np.array([cfg.target_x_range, cfg.target_z_range, cfg.target_angle_range], dtype=np.float64)
+        target = rng.uniform(ranges[:, 0], ranges[:, 1], size=(num, 3)).astype(np.float32)
+        return target[:, 0], target[:, 1], target[:, 2]
 
     def _set_target_mocap(
         self,
@@ -230,13 +230,14 @@ class ManipulatorBase(NpEnv):
         target_x: np.ndarray,
         target_z: np.ndarray,
         target_angle: np.ndarray,
-    ):
+    ) -> np.ndarray:
         pose = np.zeros((data.shape[0], 7), dtype=np.float32)
         pose[:, 0] = target_x
         pose[:, 1] = float(self._cfg.target_y)
         pose[:, 2] = target_z
         pose[:, 3:7] = _quat_from_y_angle(target_angle)
         self._target_mocap.set_pose(data, pose)
+        return pose
 
     def _set_object_state(
         self,
@@ -246,19 +247,19 @@ class ManipulatorBase(NpEnv):
         target_z: np.ndarray,
         target_angle: np.ndarray,
         grasp_pos: np.ndarray,
+        rng: EnvRng,
     ):
         cfg = self._cfg
         num = dof_pos.shape[0]
 
-        # Default: uniform in workspace.
-        object_x = np.random.uniform(cfg.object_x_range[0], cfg.object_x_range[1], size=(num,)).astype(np.float32)
-        object_z = np.random.uniform(cfg.object_z_range[0], cfg.object_z_range[1], size=(num,)).astype(np.float32)
-        object_angle = np.random.uniform(cfg.object_angle_range[0], cfg.object_angle_range[1], size=(num,)).astype(
-            np.float32
+        # Default: uniform in workspace, drawn together with the dm_control-style init selector.
+        ranges = np.array(
+            [cfg.object_x_range, cfg.object_z_range, cfg.object_angle_range, (0.0, 1.0)], dtype=np.float64
         )
+        spawn = rng.uniform(ranges[:, 0], ranges[:, 1], size=(num, 4)).astype(np.float32)
+        object_x, object_z, object_angle, r = (np.ascontiguousarray(spawn[:, i]) for i in range(4))
 
         # dm_control-style object init distribution.
-        r = np.random.uniform(0.0, 1.0, size=(num,)).astype(np.float32)
         in_hand = r < float(cfg.p_in_hand)
         in_target = (r >= float(cfg.p_in_hand)) & (r < float(cfg.p_in_hand + cfg.p_in_target))
         uniform = ~(in_hand | in_target)
@@ -278,13 +279,10 @@ class ManipulatorBase(NpEnv):
                 pending = pending & too_close
                 if not pending.any():
                     break
-                n = int(pending.sum())
-                object_x[pending] = np.random.uniform(cfg.object_x_range[0], cfg.object_x_range[1], size=(n,)).astype(
-                    np.float32
-                )
-                object_z[pending] = np.random.uniform(cfg.object_z_range[0], cfg.object_z_range[1], size=(n,)).astype(
-                    np.float32
-                )
+                rows = np.flatnonzero(pending)
+                resample = rng.uniform(ranges[:2, 0], ranges[:2, 1], rows=rows).astype(np.float32)
+                object_x[rows] = resample[:, 0]
+                object_z[rows] = resample[:, 1]
 
         object_x[in_target] = target_x[in_target]
         object_z[in_target] = target_z[in_target]
@@ -298,8 +296,8 @@ class ManipulatorBase(NpEnv):
 
         dof_vel[:, self._object_qvel_indices] = 0.0
         if uniform.any():
-            dof_vel[uniform, self._object_x_qvel_i] = np.random.uniform(
-                cfg.object_x_vel_range[0], cfg.object_x_vel_range[1], size=(int(uniform.sum()),)
+            dof_vel[uniform, self._object_x_qvel_i] = rng.uniform(
+                cfg.object_x_vel_range[0], cfg.object_x_vel_range[1], rows=np.flatnonzero(uniform)
             ).astype(np.float32)
 
     def _settle(self, data: mtx.SceneData):
@@ -315,15 +313,16 @@ class ManipulatorBase(NpEnv):
             data.set_dof_vel(np.zeros((data.shape[0], self._model.num_dof_vel), dtype=np.float32))
             self._model.forward_kinematic(data)
 
-    def initialize_episode(self, data: mtx.SceneData) -> None:
-        """Episode initialization with optional physics settling (dm_control-style)."""
+    def initialize_episode(self, data: mtx.SceneData, rng: Optional[EnvRng] = None) -> np.ndarray:
+        """Episode initialization with optional physics settling (dm_control-style), returns the target pose."""
+        rng = self._rng if rng is None else rng
         num = int(data.shape[0])
         dof_pos = np.tile(self._init_dof_pos, (num, 1))
         dof_vel = np.tile(self._init_dof_vel, (num, 1))
 
         # Optionally randomize arm joint angles and symmetrize the hand.
         if getattr(self._cfg, "randomize_arm", True):
-            arm_angles = self._sample_arm_joint_angles(num)
+            arm_angles = self._sample_arm_joint_angles(num, rng)
             dof_pos[:, self._arm_joint_pos_indices] = arm_angles
         dof_pos[:, self._finger_qpos_i] = dof_pos[:, self._thumb_qpos_i]
         dof_pos[:, self._fingertip_qpos_i] = dof_pos[:, self._thumbtip_qpos_i]
@@ -333,12 +332,12 @@ class ManipulatorBase(NpEnv):
         data.set_dof_pos(dof_pos, self._model)
         self._model.forward_kinematic(data)
 
-        target_x, target_z, target_angle = self._sample_target_pose(num)
-        self._set_target_mocap(data, target_x, target_z, target_angle)
+        target_x, target_z, target_angle = self._sample_target_pose(num, rng)
+        target_pose = self._set_target_mocap(data, target_x, target_z, target_angle)
         self._model.forward_kinematic(data)
 
         grasp_pos = self._grasp_site.get_position(data)
-        self._set_object_state(dof_pos, dof_vel, target_x, target_z, target_angle, grasp_pos)
+        self._set_object_state(dof_pos, dof_vel, target_x, target_z, target_angle, grasp_pos, rng)
         data.set_dof_vel(dof_vel)
         data.set_dof_pos(dof_pos, self._model)
         self._model.forward_kinematic(data)
@@ -353,10 +352,40 @@ class ManipulatorBase(NpEnv):
             data.set_dof_pos(dof_pos_after, self._model)
             data.set_dof_vel(dof_vel_after)
             self._model.forward_kinematic(data)
+        return target_pose
+
+    def _generate_reset_states(self, data: mtx.SceneData, rng: EnvRng) -> dict[str, np.ndarray]:
+        target_pose = self.initialize_episode(data, rng)
+        return {"dof_pos": data.dof_pos.copy(), "dof_vel": data.dof_vel.copy(), "target_pose": target_pose}
+
+    def _get_reset_pool(self) -> Optional[ResetPool]:
+        cfg = self._cfg
+        if self._reset_pool is None and cfg.reset_pool_size > 0:
+            # a background refill must not touch the model this env steps meanwhile
+            generator = self._detached_copy() if cfg.reset_pool_async else self
+            self._reset_pool = ResetPool(
+                generator.model,
+                generator._generate_reset_states,
+                size=cfg.reset_pool_size,
+                max_uses=cfg.reset_pool_max_uses,
+                refill_async=cfg.reset_pool_async,
+                rng=self._rng.derive(cfg.reset_pool_size),
+            )
+        return self._reset_pool
 
     def reset(self, data: mtx.SceneData) -> tuple[np.ndarray, dict]:
         num = int(data.shape[0])
-        self.initialize_episode(data)
+        pool = self._get_reset_pool()
+        if pool is not None and num <= pool.size:
+            # copy in settled states instead of settling the batch
+            states = pool.sample(num)
+            data.reset(self._model)
+            data.set_dof_vel(states["dof_vel"])
+            data.set_dof_pos(states["dof_pos"], self._model)
+            self._target_mocap.set_pose(data, states["target_pose"])
+            self._model.forward_kinematic(data)
+        else:
+            self.initialize_episode(data)
 
         obs = self._get_obs(data)
         info = {
@@ -376,9 +405,9 @@ class BringBall(ManipulatorBase):
         # 1. Sensors setup
         self._fingertip_site = self._model.get_site("fingertip_touch")
         self._thumbtip_site = self._model.get_site("thumbtip_touch")
-        self._touch_idx_palm = _TOUCH_SENSORS.index("palm_touch")
-        self._touch_idx_fingertip = _TOUCH_SENSORS.index("fingertip_touch")
-        self._touch_idx_thumbtip = _TOUCH_SENSORS.index("thumbtip_touch")
+        self._touch_idx_palm = self._touch_sensors.slice("palm_touch").start
+        self._touch_idx_fingertip = self._touch_sensors.slice("fingertip_touch").start
+        self._touch_idx_thumbtip = self._touch_sensors.slice("thumbtip_touch").start
 
     def _compute_hand_direction(self, data: mtx.SceneData) -> np.ndarray:
         """Calculates the Z-axis vector of the hand (grasp site)."""
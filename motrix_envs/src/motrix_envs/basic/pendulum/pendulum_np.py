@@ -104,9 +104,9 @@ class PendulumEnv(NpEnv):
         num_reset = data.shape[0]
         dof_pos = np.zeros((num_reset, self._num_dof_pos), dtype=np.float32)
         dof_vel = np.zeros((num_reset, self._num_dof_vel), dtype=np.float32)
-        dof_pos[:, 0] = np.random.uniform(-np.pi, np.pi, size=(num_reset,))
+        dof_pos[:, 0] = self._rng.uniform(-np.pi, np.pi, size=(num_reset,))
         if reset_noise_scale > 0.0:
-            dof_vel[:, 0] = np.random.uniform(-reset_noise_scale, reset_noise_scale, size=(num_reset,))
+            dof_vel[:, 0] = self._rng.uniform(-reset_noise_scale, reset_noise_scale, size=(num_reset,))
 
         data.reset(self._model)
         data.set_dof_vel(dof_vel)
@@ -142,27 +142,20 @@ class PointMassEnv(NpEnv):
         num_dof_pos = self._model.num_dof_pos
         num_dof_vel = self._model.num_dof_vel
 
-        # Random initial position within a range for the point mass (only x, y)
-        x_pos = np.random.uniform(-1.0, 1.0, size=num_reset).astype(np.float32)
-        y_pos = np.random.uniform(-1.0, 1.0, size=num_reset).astype(np.float32)
+        # Random initial position of the point mass (x, y) and of the target (x, y) within their ranges
+        positions = self._rng.uniform([-1.0, -1.0, -1.5, -1.5], [1.0, 1.0, 1.5, 1.5], size=(num_reset, 4))
 
         # Create dof_pos with the correct length (point mass x, y and target x, y)
         dof_pos = np.zeros((num_reset, num_dof_pos), dtype=np.float32)
-        dof_pos[:, 0] = x_pos  # point_mass_x
-        dof_pos[:, 1] = y_pos  # point_mass_y
+        dof_pos[:, 0:2] = positions[:, 0:2]  # point_mass_x, point_mass_y
 
         dof_vel = np.zeros((num_reset, num_dof_vel), dtype=np.float32)
 
         data.set_dof_vel(dof_vel)
         data.set_dof_pos(dof_pos, self._model)
 
-        # Randomize target position using its slide joints
-        target_x = np.random.uniform(-1.5, 1.5, size=num_reset).astype(np.float32)
-        target_y = np.random.uniform(-1.5, 1.5, size=num_reset).astype(np.float32)
-
         # Set target position via its slide joints (indices 2 and 3)
-        dof_pos[:, 2] = target_x  # target_x
-        dof_pos[:, 3] = target_y  # target_y
+        dof_pos[:, 2:4] = positions[:, 2:4]  # target_x, target_y
         data.set_dof_pos(dof_pos, self._model)
 
         self._model.forward_kinematic(data)
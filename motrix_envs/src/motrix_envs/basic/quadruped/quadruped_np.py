@@ -26,6 +26,24 @@ from motrix_envs.np.env import NpEnv, NpEnvState
 _RANGEFINDER_SENSORS = [f"rf_{row}{col}" for row in range(4) for col in range(5)]
 
 
+def _rotate_components(qx, qy, qz, qw, v: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rotate the (3, k) vectors ``v`` by the (..., k) quaternion components, component-wise
+
+    The cross products of ``quaternion.rotate_vector`` written out on whole arrays, which avoids the small
+    strided last axis that dominates its cost on (num_envs, k, 3) batches.
+    """
+    vx, vy, vz = v
+    tx = 2.0 * (qy * vz - qz * vy)
+    ty = 2.0 * (qz * vx - qx * vz)
+    tz = 2.0 * (qx * vy - qy * vx)
+    return (
+        vx + qw * tx + (qy * tz - qz * ty),
+        vy + qw * ty + (qz * tx - qx * tz),
+        vz + qw * tz + (qx * ty - qy * tx),
+    )
+
+
 class QuadrupedEnv(NpEnv):
     _cfg: QuadrupedBaseCfg
     _observation_space: gym.spaces.Box
@@ -36,6 +54,9 @@ class QuadrupedEnv(NpEnv):
         self._cfg = cfg
         self._torso = self._model.get_link("torso")
         self._floor_geom = self._model.get_geom("floor")
+        self._velocimeter = self.sensor_group(["velocimeter"])
+        self._imu_sensors = self.sensor_group(["imu_accel", "imu_gyro"])
+        self._rangefinder_sensors = self.sensor_group(_RANGEFINDER_SENSORS) if cfg.include_rangefinder else None
 
         self._workspace_site = None
         if cfg.include_origin:
@@ -80,6 +101,7 @@ class QuadrupedEnv(NpEnv):
                     self._leg_ball_geom_count = len(leg_geoms)
             except Exception:
                 self._leg_ball_geom_slices = []
+        self._init_leg_ball_geometry()
 
         self._body_dof_pos = self._model.num_dof_pos - 7 - (7 if cfg.include_ball else 0)
         self._body_dof_vel = self._model.num_dof_vel - 6 - (6 if cfg.include_ball else 0)
@@ -146,16 +168,6 @@ class QuadrupedEnv(NpEnv):
         state.data.actuator_ctrls = actions
         return state
 
-    def _sensor_value(self, data: mtx.SceneData, name: str) -> np.ndarray:
-        value = np.asarray(self._model.get_sensor_value(name, data))
-        return value.reshape(data.shape[0], -1)
-
-    def _sensor_vector(self, data: mtx.SceneData, names: list[str]) -> np.ndarray:
-        if not names:
-            return np.zeros((data.shape[0], 0), dtype=np.float32)
-        values = [self._sensor_value(data, name) for name in names]
-        return np.concatenate(values, axis=-1)
-
     def _egocentric_state(self, data: mtx.SceneData) -> np.ndarray:
         dof_pos = data.dof_pos[:, self._dof_pos_slice]
         dof_vel = data.dof_vel[:, self._dof_vel_slice]
@@ -166,15 +178,13 @@ class QuadrupedEnv(NpEnv):
         return self._torso.get_rotation_mat(data)[:, 2, 2]
 
     def _torso_velocity(self, data: mtx.SceneData) -> np.ndarray:
-        return self._sensor_value(data, "velocimeter")
+        return self._velocimeter.read(data)
 
     def _imu(self, data: mtx.SceneData) -> np.ndarray:
-        accel = self._sensor_value(data, "imu_accel")
-        gyro = self._sensor_value(data, "imu_gyro")
-        return np.concatenate([accel, gyro], axis=-1)
+        return self._imu_sensors.read(data)
 
     def _rangefinder(self, data: mtx.SceneData) -> np.ndarray:
-        readings = self._sensor_vector(data, _RANGEFINDER_SENSORS)
+        readings = self._rangefinder_sensors.read(data)
         no_intersection = -1.0
         return np.where(readings == no_intersection, 1.0, np.tanh(readings))
 
@@ -214,47 +224,72 @@ class QuadrupedEnv(NpEnv):
         target_pos = self._target_site.get_position(data)
         return np.linalg.norm((target_pos - ball_pos)[:, :2], axis=-1)
 
-    def _aggregate_leg_ball_proximity(self, geom_penalties: np.ndarray) -> np.ndarray:
-        num_legs = len(self._leg_ball_geom_slices)
-        if num_legs == 0:
-            return np.zeros((geom_penalties.shape[0], 0), dtype=np.float32)
-
-        leg_penalties = []
-        for geom_slice in self._leg_ball_geom_slices:
-            if geom_slice.start == geom_slice.stop:
-                leg_penalties.append(np.zeros((geom_penalties.shape[0],), dtype=np.float32))
-            else:
-                leg_penalties.append(geom_penalties[:, geom_slice].max(axis=-1))
-        return np.stack(leg_penalties, axis=-1)
-
-    def _point_to_segment_distance(self, point: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
-        segment = end - start
-        segment_sq_norm = np.sum(segment * segment, axis=-1)
-        safe_norm = np.where(segment_sq_norm > 1e-8, segment_sq_norm, 1.0)
-        t = np.sum((point - start) * segment, axis=-1) / safe_norm
-        t = np.where(segment_sq_norm > 1e-8, np.clip(t, 0.0, 1.0), 0.0)
-        closest = start + t[:, None] * segment
-        return np.linalg.norm(point - closest, axis=-1)
-
-    def _geom_ball_surface_clearance(
-        self, geom: mtx.Geom, ball_pos: np.ndarray, ball_radius: float, data: mtx.SceneData
-    ) -> np.ndarray:
-        geom_pose = geom.get_pose(data)
-        geom_pos = geom_pose[:, :3]
-        geom_quat = geom_pose[:, 3:]
-        geom_size = np.atleast_1d(np.asarray(geom.size, dtype=np.float32))
-        geom_radius = float(geom_size[0])
-
-        if getattr(geom, "shape", None) == mtx.Shape.Capsule and geom_size.shape[0] > 1 and geom_size[1] > 0.0:
-            half_length = float(geom_size[1])
-            axis = quaternion.rotate_vector(geom_quat, np.array([0.0, 0.0, 1.0], dtype=np.float32))
-            start = geom_pos - axis * half_length
-            end = geom_pos + axis * half_length
-            center_distance = self._point_to_segment_distance(ball_pos, start, end)
-        else:
-            center_distance = np.linalg.norm(ball_pos - geom_pos, axis=-1)
+    def _init_leg_ball_geometry(self):
+        """
+        Precompute the leg geoms as segments in the frame of their link, a center and a half axis, a sphere
+        having a zero half axis, so that the clearances to the ball of all the geoms take one link pose read
+        """
+        num_geoms = self._leg_ball_geom_count
+        self._leg_ball_link_ids = np.zeros((num_geoms,), dtype=np.intp)
+        # component-major (xyz, geoms), so that the per-step math runs on contiguous (num_envs, geoms) arrays
+        self._leg_ball_centers = np.zeros((3, num_geoms), dtype=np.float32)
+        self._leg_ball_half_axes = np.zeros((3, num_geoms), dtype=np.float32)
+        self._leg_ball_radii = np.zeros((num_geoms,), dtype=np.float32)
+        for i, geom in enumerate(self._leg_ball_geoms):
+            geom_size = np.atleast_1d(np.asarray(geom.size, dtype=np.float32))
+            local_pose = np.asarray(geom.local_pose, dtype=np.float32)
+            self._leg_ball_link_ids[i] = geom.link.index
+            self._leg_ball_centers[:, i] = local_pose[:3]
+            if getattr(geom, "shape", None) == mtx.Shape.Capsule and geom_size.shape[0] > 1 and geom_size[1] > 0.0:
+                axis = quaternion.rotate_vector(local_pose[None, 3:], np.array([0.0, 0.0, 1.0], dtype=np.float32))
+                self._leg_ball_half_axes[:, i] = axis[0] * geom_size[1]
+            self._leg_ball_radii[i] = geom_size[0]
+        # rotations keep the length of the half axes
+        half_axis_sq_norm = np.sum(np.square(self._leg_ball_half_axes), axis=0)
+        self._leg_ball_inv_half_axis_sq_norm = np.divide(
+            1.0, half_axis_sq_norm, out=np.zeros_like(half_axis_sq_norm), where=half_axis_sq_norm > 1e-8
+        )
+
+        # the geoms of a leg are contiguous, reduced from the first geom of each leg having some
+        self._leg_ball_legs_with_geoms = np.array(
+            [leg for leg, geom_slice in enumerate(self._leg_ball_geom_slices) if geom_slice.stop > geom_slice.start],
+            dtype=np.intp,
+        )
+        self._leg_ball_leg_starts = np.array(
+            [self._leg_ball_geom_slices[leg].start for leg in self._leg_ball_legs_with_geoms], dtype=np.intp
+        )
 
-        return center_distance - (ball_radius + geom_radius)
+    def _aggregate_leg_ball_proximity(self, geom_penalties: np.ndarray) -> np.ndarray:
+        """
+        The largest penalty of the geoms of each leg, (num_envs, num_legs), zero for the legs without geom
+        """
+        leg_penalties = np.zeros((geom_penalties.shape[0], len(self._leg_ball_geom_slices)), dtype=np.float32)
+        if self._leg_ball_leg_starts.size:
+            leg_penalties[:, self._leg_ball_legs_with_geoms] = np.maximum.reduceat(
+                geom_penalties, self._leg_ball_leg_starts, axis=1
+            )
+        return leg_penalties
+
+    def _leg_ball_surface_clearance(self, ball_pos: np.ndarray, ball_radius: float, data: mtx.SceneData) -> np.ndarray:
+        """
+        Distance between the surface of the ball and the surface of every leg geom, (num_envs, num_geoms)
+        """
+        link_poses = self._model.get_link_poses(data)[:, self._leg_ball_link_ids]
+        px, py, pz, qx, qy, qz, qw = np.ascontiguousarray(np.moveaxis(link_poses, -1, 0))
+        cx, cy, cz = _rotate_components(qx, qy, qz, qw, self._leg_ball_centers)
+        hx, hy, hz = _rotate_components(qx, qy, qz, qw, self._leg_ball_half_axes)
+
+        # from the geom centers to the ball, then to the closest point of the segments
+        dx = ball_pos[:, 0:1] - px - cx
+        dy = ball_pos[:, 1:2] - py - cy
+        dz = ball_pos[:, 2:3] - pz - cz
+        t = (dx * hx + dy * hy + dz * hz) * self._leg_ball_inv_half_axis_sq_norm
+        np.clip(t, -1.0, 1.0, out=t)
+        dx -= t * hx
+        dy -= t * hy
+        dz -= t * hz
+        center_distance = np.sqrt(dx * dx + dy * dy + dz * dz)
+        return center_distance - (ball_radius + self._leg_ball_radii)
 
     def _leg_body_ball_penalty(self, data: mtx.SceneData) -> np.ndarray:
         num_legs = len(self._leg_ball_geom_slices)
@@ -263,20 +298,14 @@ class QuadrupedEnv(NpEnv):
 
         ball_pos = self._ball_geom.get_pose(data)[:, :3]
         ball_radius = float(np.atleast_1d(self._ball_geom.size)[0])
-        geom_penalties = []
-        for geom in self._leg_ball_geoms:
-            clearance = self._geom_ball_surface_clearance(geom, ball_pos, ball_radius, data)
-            geom_penalties.append(
-                reward.tolerance(
-                    -clearance,
-                    bounds=(0.0, float("inf")),
-                    margin=self._cfg.fetch_leg_ball_penalty_margin,
-                    value_at_margin=0.0,
-                    sigmoid="linear",
-                )
-            )
-
-        proximity = np.stack(geom_penalties, axis=-1).astype(np.float32)
+        clearance = self._leg_ball_surface_clearance(ball_pos, ball_radius, data)
+        proximity = reward.tolerance(
+            -clearance,
+            bounds=(0.0, float("inf")),
+            margin=self._cfg.fetch_leg_ball_penalty_margin,
+            value_at_margin=0.0,
+            sigmoid="linear",
+        ).astype(np.float32)
         leg_penalties = self._aggregate_leg_ball_proximity(proximity)
         return leg_penalties.sum(axis=-1).astype(np.float32)
 
@@ -569,7 +598,7 @@ class QuadrupedEnv(NpEnv):
         }
 
     def _random_quaternion(self, num: int) -> np.ndarray:
-        q = np.random.randn(num, 4).astype(np.float32)
+        q = self._rng.standard_normal((num, 4)).astype(np.float32)
         q /= np.linalg.norm(q, axis=-1, keepdims=True)
         return q
 
@@ -873,12 +902,16 @@ class QuadrupedFetchEnv(QuadrupedEnv):
         if floor_radius <= 0.0:
             floor_radius = self._terrain_size
         spawn_radius = 0.12 * floor_radius
-        yaw = np.random.uniform(0.0, 2 * np.pi, size=(num,))
-        dof_pos[:, 0] = np.random.uniform(-spawn_radius, spawn_radius, size=(num,))
-        dof_pos[:, 1] = np.random.uniform(-spawn_radius, spawn_radius, size=(num,))
-        dof_pos[:, 3:7] = self._yaw_quaternion(yaw)
+        # yaw, x, y of the quadruped and x, y of the ball
+        spawn = self._rng.uniform(
+            [0.0, -spawn_radius, -spawn_radius, -spawn_radius, -spawn_radius],
+            [2 * np.pi, spawn_radius, spawn_radius, spawn_radius, spawn_radius],
+            size=(num, 5),
+        )
+        dof_pos[:, 0:2] = spawn[:, 1:3]
+        dof_pos[:, 3:7] = self._yaw_quaternion(spawn[:, 0])
 
-        ball_xy = np.random.uniform(-spawn_radius, spawn_radius, size=(num, 2))
+        ball_xy = spawn[:, 3:5]
         ball_qpos = self._ball_pos_slice
         dof_pos[:, ball_qpos.start : ball_qpos.start + 2] = ball_xy
         ball_radius = float(self._ball_geom.size[0]) if self._ball_geom is not None else 0.15
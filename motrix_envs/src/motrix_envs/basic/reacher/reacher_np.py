@@ -89,15 +89,11 @@ class Reacher2DEnv(NpEnv):
         num_reset = data.shape[0]
 
         dof_pos = np.zeros((num_reset, self._model.num_dof_pos))
-        dof_pos[:, 0] = np.random.uniform(-np.pi, np.pi, size=(num_reset,))
-        dof_pos[:, 1] = np.random.uniform(-np.pi, np.pi, size=(num_reset,))
+        dof_pos[:, :2] = self._rng.uniform(-np.pi, np.pi, size=(num_reset, 2))
         data.set_dof_pos(dof_pos, self._model)
         self._model.forward_kinematic(data)
 
-        target_x = np.random.uniform(-0.15, 0.15, size=(num_reset,))
-        target_y = np.random.uniform(0.15, 0.15, size=(num_reset,))
-
-        target_dof_pos = np.stack([target_x, target_y], axis=-1)
+        target_dof_pos = self._rng.uniform([-0.15, 0.15], [0.15, 0.15], size=(num_reset, 2))
 
         self._target_body.set_dof_pos(data, target_dof_pos)
 
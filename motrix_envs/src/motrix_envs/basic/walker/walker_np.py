@@ -135,12 +135,12 @@ class Walker2DEnv(NpEnv):
         num_reset = data.shape[0]
 
         dof_pos = np.zeros((num_reset, self._model.num_dof_pos))
-        dof_pos[:, 2] = np.random.uniform(low=-np.pi, high=np.pi, size=(num_reset,))  # randomize root yaw
-        dof_pos[:, 3:] = np.random.uniform(
-            low=self._joint_limits[0, 3:],
-            high=self._joint_limits[1, 3:],
-            size=(num_reset, self._model.num_dof_pos - 3),
-        )  # randomize other joint angles
+        # randomize root yaw and other joint angles
+        dof_pos[:, 2:] = self._rng.uniform(
+            low=np.concatenate([[-np.pi], self._joint_limits[0, 3:]]),
+            high=np.concatenate([[np.pi], self._joint_limits[1, 3:]]),
+            size=(num_reset, self._model.num_dof_pos - 2),
+        )
         data.set_dof_pos(dof_pos, self._model)
         self._model.forward_kinematic(data)
         obs = self._get_obs(data)
@@ -12,5 +12,3 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-
-from . import anymal_c, go1, go2  # noqa: F401 register envs
@@ -19,11 +19,14 @@ import motrixsim as mtx
 import numpy as np
 
 from motrix_envs import registry
-from motrix_envs.math import quaternion
+from motrix_envs.math import quaternion, rotation
 from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.obs import ObsSpec, ObsTerm
 
 from .cfg import AnymalCEnvCfg
 
+_GRAVITY_DIRECTION = np.array([0.0, 0.0, -1.0], dtype=np.float32)
+
 
 @registry.env("anymal_c_navigation_flat", "np")
 class AnymalCEnv(NpEnv):
@@ -53,6 +56,7 @@ class AnymalCEnv(NpEnv):
         )
 
         self._init_buffer()
+        self._init_obs_spec()
 
     def _init_buffer(self):
         cfg = self._cfg
@@ -72,6 +76,28 @@ class AnymalCEnv(NpEnv):
 
         self._init_dof_pos[-self._num_action :] = self.default_angles
 
+    def _init_obs_spec(self):
+        cfg = self._cfg
+        self._obs_spec = ObsSpec(
+            [
+                ObsTerm("linvel", 3, scale=cfg.normalization.lin_vel),
+                ObsTerm("gyro", 3, scale=cfg.normalization.ang_vel),
+                ObsTerm("gravity", 3),
+                ObsTerm("dof_pos", self._num_action, scale=cfg.normalization.dof_pos, offset=self.default_angles),
+                ObsTerm("dof_vel", self._num_action, scale=cfg.normalization.dof_vel),
+                ObsTerm("last_actions", self._num_action),
+                ObsTerm("commands", 3, scale=self.commands_scale),
+                # Position error vector to target, normalized to a reasonable range
+                ObsTerm("position_error", 2, scale=1.0 / 5.0),
+                # Heading error, normalized to [-1, 1]
+                ObsTerm("heading_error", 1, scale=1.0 / np.pi),
+                ObsTerm("distance", 1),
+                ObsTerm("reached", 1),
+                ObsTerm("stop_ready", 1),
+            ]
+        )
+        assert self._obs_spec.size == self._observation_space.shape[0]
+
     def _init_contact_geometry(self):
         """Initialize geometry indices required for contact detection"""
         cfg = self._cfg
@@ -80,6 +106,7 @@ class AnymalCEnv(NpEnv):
         # Initialize contact detection matrix
         self._init_termination_contact()
         self._init_foot_contact()
+        self._contacts.register("termination", self.termination_contact)
 
     def _init_termination_contact(self):
         """Initialize termination contact detection"""
@@ -175,7 +202,6 @@ class AnymalCEnv(NpEnv):
         # Joint states (leg joints)
         joint_pos = self.get_dof_pos(data)  # [num_envs, 12]
         joint_vel = self.get_dof_vel(data)  # [num_envs, 12]
-        joint_pos_rel = joint_pos - self.default_angles
 
         # Get sensor data
         base_lin_vel = root_vel[:, :3]
@@ -185,7 +211,7 @@ class AnymalCEnv(NpEnv):
         # Get commands - convert to relative velocity commands
         pose_commands = state.info["pose_commands"]
         robot_position = root_pos[:, :2]
-        robot_heading = quaternion.get_yaw(root_quat)
+        robot_heading = rotation.yaw(root_quat)
         target_position = pose_commands[:, :2]
         target_heading = pose_commands[:, 2]
 
@@ -221,42 +247,24 @@ class AnymalCEnv(NpEnv):
         # Combine into velocity commands
         velocity_commands = np.concatenate([desired_vel_xy, desired_yaw_rate[:, np.newaxis]], axis=-1)
 
-        # Normalize observations
-        noisy_linvel = base_lin_vel * self._cfg.normalization.lin_vel
-        noisy_gyro = gyro * self._cfg.normalization.ang_vel
-        noisy_joint_angle = joint_pos_rel * self._cfg.normalization.dof_pos
-        noisy_joint_vel = joint_vel * self._cfg.normalization.dof_vel
-        command_normalized = velocity_commands * self.commands_scale
-        last_actions = state.info["current_actions"]
-
-        # Calculate task-related observations
-        position_error_normalized = position_error / 5.0  # Normalize to reasonable range
-        heading_error_normalized = heading_diff / np.pi  # Normalize to [-1, 1]
-        distance_normalized = np.clip(distance_to_target / 5.0, 0, 1)  # Normalize distance
-        reached_flag = reached_all.astype(np.float32)  # Whether target is reached
-
         # Calculate if zero_ang standard is met: reached and angular velocity close to zero
         stop_ready = np.logical_and(reached_all, np.abs(gyro[:, 2]) < 5e-2)
-        stop_ready_flag = stop_ready.astype(np.float32)
 
-        obs = np.concatenate(
-            [
-                noisy_linvel,  # 3
-                noisy_gyro,  # 3
-                projected_gravity,  # 3
-                noisy_joint_angle,  # 12
-                noisy_joint_vel,  # 12
-                last_actions,  # 12
-                command_normalized,  # 3
-                position_error_normalized,  # 2 - Position error vector to target
-                heading_error_normalized[:, np.newaxis],  # 1 - Heading error
-                distance_normalized[:, np.newaxis],  # 1 - Distance to target
-                reached_flag[:, np.newaxis],  # 1 - Whether reached
-                stop_ready_flag[:, np.newaxis],  # 1 - Whether stop standard is met
-            ],
-            axis=-1,
+        self._obs_spec.build(
+            state.obs,
+            linvel=base_lin_vel,
+            gyro=gyro,
+            gravity=projected_gravity,
+            dof_pos=joint_pos,
+            dof_vel=joint_vel,
+            last_actions=state.info["current_actions"],
+            commands=velocity_commands,
+            position_error=position_error,
+            heading_error=heading_diff,
+            distance=np.clip(distance_to_target / 5.0, 0, 1),
+            reached=reached_all,
+            stop_ready=stop_ready,
         )
-        assert obs.shape == (data.shape[0], 54)
 
         # Update target position marker
         self._update_target_marker(data, pose_commands)
@@ -271,7 +279,6 @@ class AnymalCEnv(NpEnv):
         terminated_state = self._compute_terminated(state)
         terminated = terminated_state.terminated
 
-        state.obs = obs
         state.reward = reward
         state.terminated = terminated
 
@@ -322,10 +329,7 @@ class AnymalCEnv(NpEnv):
         termination_penalty = np.where(vel_overflow | vel_extreme, -20.0, termination_penalty)
 
         # Robot base contacts ground penalty
-        cquerys = self._model.get_contact_query(data)
-        termination_check = cquerys.is_colliding(self.termination_contact)
-        termination_check = termination_check.reshape((self._num_envs, self.num_termination_check))
-        base_contact = termination_check.any(axis=1)
+        base_contact = self._contacts.any("termination", data)
         termination_penalty = np.where(base_contact, -20.0, termination_penalty)
 
         # Side flip penalty
@@ -350,7 +354,7 @@ class AnymalCEnv(NpEnv):
 
         # Get robot position and heading for arrival determination
         robot_position = pose[:, :2]
-        robot_heading = quaternion.get_yaw(root_quat)
+        robot_heading = rotation.yaw(root_quat)
         target_position = info["pose_commands"][:, :2]
         target_heading = info["pose_commands"][:, 2]
         position_error = target_position - robot_position
@@ -472,10 +476,7 @@ class AnymalCEnv(NpEnv):
         terminated = np.logical_or(terminated, vel_extreme)
 
         # Robot base contacts ground termination
-        cquerys = self._model.get_contact_query(data)
-        termination_check = cquerys.is_colliding(self.termination_contact)
-        termination_check = termination_check.reshape((self._num_envs, self.num_termination_check))
-        base_contact = termination_check.any(axis=1)
+        base_contact = self._contacts.any("termination", data)
         terminated = np.logical_or(terminated, base_contact)
 
         # Side flip termination: tilt angle exceeds 75°
@@ -494,31 +495,16 @@ class AnymalCEnv(NpEnv):
         cfg: AnymalCEnvCfg = self._cfg
         num_envs = data.shape[0]
 
-        # First generate robot initial position (in world coordinates)
+        # Robot initial position (world coordinates), target offset relative to it and absolute target heading,
+        # drawn together as [init_x, init_y, offset_x, offset_y, heading]
         pos_range = cfg.init_state.pos_randomization_range
-        robot_init_x = np.random.uniform(
-            pos_range[0],
-            pos_range[2],  # x_min, x_max
-            num_envs,
-        ).astype(np.float32)
-        robot_init_y = np.random.uniform(
-            pos_range[1],
-            pos_range[3],  # y_min, y_max
-            num_envs,
-        ).astype(np.float32)
-        robot_init_pos = np.stack([robot_init_x, robot_init_y], axis=1)  # [num_envs, 2]
-
-        # Generate target position: offset relative to robot initial position
-        # pose_command_range now represents offset range relative to robot
-        target_offset = np.random.uniform(
-            low=cfg.commands.pose_command_range[:2], high=cfg.commands.pose_command_range[3:5], size=(num_envs, 2)
-        ).astype(np.float32)
-        target_positions = robot_init_pos + target_offset  # Target position in world coordinates
-
-        # Generate target heading (absolute heading, random in horizontal direction)
-        target_headings = np.random.uniform(
-            low=cfg.commands.pose_command_range[2], high=cfg.commands.pose_command_range[5], size=(num_envs, 1)
-        ).astype(np.float32)
+        pose_range = cfg.commands.pose_command_range
+        low = np.array([pos_range[0], pos_range[1], pose_range[0], pose_range[1], pose_range[2]], dtype=np.float64)
+        high = np.array([pos_range[2], pos_range[3], pose_range[3], pose_range[4], pose_range[5]], dtype=np.float64)
+        spawn = self._rng.uniform(low, high, size=(num_envs, 5)).astype(np.float32)
+        robot_init_pos = spawn[:, 0:2]  # [num_envs, 2]
+        target_positions = robot_init_pos + spawn[:, 2:4]  # Target position in world coordinates
+        target_headings = spawn[:, 4:5]
 
         pose_commands = np.concatenate([target_positions, target_headings], axis=1)
 
@@ -530,8 +516,8 @@ class AnymalCEnv(NpEnv):
         noise_pos = np.zeros((*data.shape, self._num_dof_pos), dtype=np.float32)
 
         # Base position (DOF 0-2): use the generated random initial position
-        noise_pos[:, 0] = robot_init_x - cfg.init_state.pos[0]  # Offset from default position
-        noise_pos[:, 1] = robot_init_y - cfg.init_state.pos[1]
+        noise_pos[:, 0] = robot_init_pos[:, 0] - cfg.init_state.pos[0]  # Offset from default position
+        noise_pos[:, 1] = robot_init_pos[:, 1] - cfg.init_state.pos[1]
         # No noise on Z axis, maintain fixed height to avoid falling feeling
 
         # All velocities set to 0, ensure completely stationary
@@ -554,7 +540,6 @@ class AnymalCEnv(NpEnv):
         # Joint states (leg joints)
         joint_pos = self.get_dof_pos(data)
         joint_vel = self.get_dof_vel(data)
-        joint_pos_rel = joint_pos - self.default_angles
 
         # Get sensor data
         base_lin_vel = root_vel[:, :3]
@@ -563,7 +548,7 @@ class AnymalCEnv(NpEnv):
 
         # Calculate velocity commands (consistent with update_state)
         robot_position = root_pos[:, :2]
-        robot_heading = quaternion.get_yaw(root_quat)
+        robot_heading = rotation.yaw(root_quat)
         target_position = pose_commands[:, :2]
         target_heading = pose_commands[:, 2]
 
@@ -602,42 +587,24 @@ class AnymalCEnv(NpEnv):
 
         velocity_commands = np.concatenate([desired_vel_xy, desired_yaw_rate[:, np.newaxis]], axis=-1)
 
-        # Normalize observations (consistent with update_state)
-        noisy_linvel = base_lin_vel * self._cfg.normalization.lin_vel
-        noisy_gyro = gyro * self._cfg.normalization.ang_vel
-        noisy_joint_angle = joint_pos_rel * self._cfg.normalization.dof_pos
-        noisy_joint_vel = joint_vel * self._cfg.normalization.dof_vel
-        command_normalized = velocity_commands * self.commands_scale
-        last_actions = np.zeros((num_envs, self._num_action), dtype=np.float32)
-
-        # Calculate task-related observations (consistent with update_state)
-        position_error_normalized = position_error / 5.0
-        heading_error_normalized = heading_diff / np.pi
-        distance_normalized = np.clip(distance_to_target / 5.0, 0, 1)
-        reached_flag = reached_all.astype(np.float32)
-
         # Calculate if zero_ang standard is met
         stop_ready = np.logical_and(reached_all, np.abs(gyro[:, 2]) < 5e-2)
-        stop_ready_flag = stop_ready.astype(np.float32)
 
-        obs = np.concatenate(
-            [
-                noisy_linvel,  # 3
-                noisy_gyro,  # 3
-                projected_gravity,  # 3
-                noisy_joint_angle,  # 12
-                noisy_joint_vel,  # 12
-                last_actions,  # 12
-                command_normalized,  # 3
-                position_error_normalized,  # 2
-                heading_error_normalized[:, np.newaxis],  # 1
-                distance_normalized[:, np.newaxis],  # 1
-                reached_flag[:, np.newaxis],  # 1
-                stop_ready_flag[:, np.newaxis],  # 1
-            ],
-            axis=-1,
+        # Observations (consistent with update_state)
+        obs = self._obs_spec.build(
+            linvel=base_lin_vel,
+            gyro=gyro,
+            gravity=projected_gravity,
+            dof_pos=joint_pos,
+            dof_vel=joint_vel,
+            last_actions=0.0,
+            commands=velocity_commands,
+            position_error=position_error,
+            heading_error=heading_diff,
+            distance=np.clip(distance_to_target / 5.0, 0, 1),
+            reached=reached_all,
+            stop_ready=stop_ready,
         )
-        assert obs.shape == (num_envs, 54)
 
         info = {
             "pose_commands": pose_commands,
@@ -650,5 +617,4 @@ class AnymalCEnv(NpEnv):
         return obs, info
 
     def _compute_projected_gravity(self, quat: np.ndarray) -> np.ndarray:
-        gravity = np.array([0.0, 0.0, -1.0], dtype=np.float32)
-        return quaternion.rotate_vector(quat, gravity)
+        return rotation.rotate(quat, _GRAVITY_DIRECTION)
@@ -117,6 +117,8 @@ class RewardConfig:
     )
 
     tracking_sigma: float = 0.25
+    # keep the scaled value of each reward term in info["Reward"]
+    log_terms: bool = False
     max_foot_height: float = 0.1
 
 
@@ -185,6 +187,8 @@ class Go1WalkNpStairsEnvCfg(Go1WalkNpEnvCfg):
         )
 
         tracking_sigma: float = 0.25
+        # keep the scaled value of each reward term in info["Reward"]
+        log_terms: bool = False
         max_foot_height: float = 0.1
 
     commands: Commands = field(default_factory=Commands)
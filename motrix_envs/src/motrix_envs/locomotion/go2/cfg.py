@@ -124,6 +124,8 @@ class RewardConfig:
     )
 
     tracking_sigma: float = 0.25
+    # keep the scaled value of each reward term in info["Reward"]
+    log_terms: bool = False
     max_foot_height: float = 0.1
 
 
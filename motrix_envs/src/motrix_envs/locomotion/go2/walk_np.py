@@ -13,20 +13,25 @@
 # limitations under the License.
 # ==============================================================================
 
+from typing import Callable
+
 import gymnasium as gym
 import motrixsim as mtx
 import numpy as np
 
 from motrix_envs import registry
 from motrix_envs.locomotion.go2.cfg import Go2WalkNpEnvCfg
-from motrix_envs.math import quaternion
+from motrix_envs.math import rotation
 from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.obs import ObsSpec, ObsTerm
+from motrix_envs.np.reward import RewardPlan
 
 
 @registry.env("go2-flat-terrain-walk", sim_backend="np")
 class Go2WalkTask(NpEnv):
     _init_dof_pos: np.ndarray
     _init_dof_vel: np.ndarray
+    profile_methods = ("update_observation", "update_terminated", "update_reward")
 
     def __init__(self, cfg: Go2WalkNpEnvCfg, num_envs=1):
         super().__init__(cfg, num_envs)
@@ -44,6 +49,8 @@ class Go2WalkTask(NpEnv):
         )
         self._init_dof_pos = self._model.compute_init_dof_pos()
         self._init_buffer()
+        self._init_obs_spec()
+        self._init_reward_plan()
 
     def _init_obs_space(self):
         model = self.model
@@ -76,10 +83,10 @@ class Go2WalkTask(NpEnv):
         return self._observation_space
 
     def get_dof_pos(self, data: mtx.SceneModel):
-        return self._body.get_joint_dof_pos(data)
+        return self._step_view.joint_dof_pos(self._body, data)
 
     def get_dof_vel(self, data: mtx.SceneModel):
-        return self._body.get_joint_dof_vel(data)
+        return self._step_view.joint_dof_vel(self._body, data)
 
     def _init_buffer(self):
         cfg = self._cfg
@@ -150,6 +157,8 @@ class Go2WalkTask(NpEnv):
         self.foot_check = self.foot
 
         self.termination_check = self.termination_contact
+        self._contacts.register("feet", self.foot_check)
+        self._contacts.register("termination", self.termination_check)
 
     def apply_action(self, actions, state):
         state.info["last_dof_vel"] = self.get_dof_vel(state.data)
@@ -164,10 +173,10 @@ class Go2WalkTask(NpEnv):
         return target_jq
 
     def get_local_linvel(self, data: mtx.SceneData) -> np.ndarray:
-        return self._model.get_sensor_value(self.cfg.sensor.local_linvel, data)
+        return self._step_view.sensor(self._model, self.cfg.sensor.local_linvel, data)
 
     def get_gyro(self, data: mtx.SceneData) -> np.ndarray:
-        return self._model.get_sensor_value(self.cfg.sensor.gyro, data)
+        return self._step_view.sensor(self._model, self.cfg.sensor.gyro, data)
 
     def update_state(self, state):
         state = self.update_observation(state)
@@ -175,52 +184,53 @@ class Go2WalkTask(NpEnv):
         state = self.update_reward(state)
         return state
 
-    def _get_obs(self, data: mtx.SceneData, info: dict) -> np.ndarray:
-        linear_vel = self.get_local_linvel(data)
-        gyro = self.get_gyro(data)
-        pose = self._body.get_pose(data)
-        base_quat = pose[:, 3:7]
-        local_gravity = quaternion.rotate_inverse(base_quat, self.gravity_vec)
-        diff = self.get_dof_pos(data) - self.default_angles
-        noisy_linvel = linear_vel * self.cfg.normalization.lin_vel
-        noisy_gyro = gyro * self.cfg.normalization.ang_vel
-        noisy_joint_angle = diff * self.cfg.normalization.dof_pos
-        noisy_joint_vel = self.get_dof_vel(data) * self.cfg.normalization.dof_vel
-        command = info["commands"] * self.commands_scale
-        last_actions = info["current_actions"]
-
-        obs = np.hstack(
+    def _init_obs_spec(self):
+        cfg = self._cfg
+        self._obs_spec = ObsSpec(
             [
-                noisy_linvel,
-                noisy_gyro,
-                local_gravity,
-                noisy_joint_angle,
-                noisy_joint_vel,
-                last_actions,
-                command,
+                ObsTerm("linvel", 3, scale=cfg.normalization.lin_vel),
+                ObsTerm("gyro", 3, scale=cfg.normalization.ang_vel),
+                ObsTerm("gravity", 3),
+                ObsTerm("dof_pos", self._num_action, scale=cfg.normalization.dof_pos, offset=self.default_angles),
+                ObsTerm("dof_vel", self._num_action, scale=cfg.normalization.dof_vel),
+                ObsTerm("last_actions", self._num_action),
+                ObsTerm("commands", 3, scale=self.commands_scale),
             ]
         )
-        return obs
+        assert self._obs_spec.size == self._num_observation
+
+    def _init_reward_plan(self):
+        reward_cfg = self.cfg.reward_config
+        self._reward_plan = RewardPlan(self._reward_terms(), reward_cfg.scales, log_terms=reward_cfg.log_terms)
+        self._termination_scale = reward_cfg.scales.get("termination", 0.0)
+
+    def _get_obs(self, data: mtx.SceneData, info: dict, out: np.ndarray = None) -> np.ndarray:
+        pose = self._step_view.pose(self._body, data)
+        base_quat = pose[:, 3:7]
+        local_gravity = rotation.projected_gravity(base_quat)
+        return self._obs_spec.build(
+            out,
+            linvel=self.get_local_linvel(data),
+            gyro=self.get_gyro(data),
+            gravity=local_gravity,
+            dof_pos=self.get_dof_pos(data),
+            dof_vel=self.get_dof_vel(data),
+            last_actions=info["current_actions"],
+            commands=info["commands"],
+        )
 
     def update_observation(self, state: NpEnvState):
         data = state.data
-        obs = self._get_obs(data, state.info)
-        cquerys = self._model.get_contact_query(data)
-        foot_contact = cquerys.is_colliding(self.foot_check)
-        state.info["contacts"] = foot_contact.reshape((self._num_envs, self.foot_check_num))
+        self._get_obs(data, state.info, out=state.obs)
+        state.info["contacts"] = self._contacts.get("feet", data)
         state.info["feet_air_time"] = self.update_feet_air_time(state.info)
-        return state.replace(obs=obs)
+        return state
 
     def update_terminated(self, state: NpEnvState) -> NpEnvState:
         data = state.data
-        cquerys = self._model.get_contact_query(data)
-        termination_check = cquerys.is_colliding(self.termination_check)
-        termination_check.reshape((self._num_envs, self.num_check))
-        terminated = termination_check.any(axis=1)
+        self._contacts.any("termination", data, out=state.terminated)
 
-        return state.replace(
-            terminated=terminated,
-        )
+        return state
 
     def update_feet_air_time(self, info: dict):
         feet_air_time = info["feet_air_time"]
@@ -229,7 +239,7 @@ class Go2WalkTask(NpEnv):
         return feet_air_time
 
     def resample_commands(self, num_envs: int):
-        commands = np.random.uniform(
+        commands = self._rng.uniform(
             low=self.cfg.commands.vel_limit[0],
             high=self.cfg.commands.vel_limit[1],
             size=(num_envs, 3),
@@ -240,18 +250,16 @@ class Go2WalkTask(NpEnv):
         data = state.data
         terminated = state.terminated
 
-        reward_dict = self._get_reward(data, state.info)
-
-        rewards = {k: v * self.cfg.reward_config.scales[k] for k, v in reward_dict.items()}
-        rwd = sum(rewards.values())
-        rwd = np.clip(rwd, 0.0, 10000.0)
-        if "termination" in self.cfg.reward_config.scales:
-            termination = self._reward_termination(terminated) * self.cfg.reward_config.scales["termination"]
-            rwd += termination
+        rwd = self._reward_plan.compute(data, state.info, out=state.reward)
+        np.clip(rwd, 0.0, 10000.0, out=rwd)
+        if self._termination_scale:
+            rwd += self._reward_termination(terminated) * self._termination_scale
 
-        rwd = np.where(terminated, np.array(0.0), rwd)
+        np.putmask(rwd, terminated, 0.0)
+        if self._reward_plan.log_terms:
+            state.info["Reward"] = dict(self._reward_plan.values)
 
-        return state.replace(reward=rwd)
+        return state
 
     def reset(self, data) -> tuple[np.ndarray, dict]:
         num_reset = data.shape[0]
@@ -275,26 +283,21 @@ class Go2WalkTask(NpEnv):
         obs = self._get_obs(data, info)
         return obs, info
 
-    def _get_reward(
-        self,
-        data: mtx.SceneData,
-        info: dict,
-    ) -> dict[str, np.ndarray]:
-        commands = info["commands"]
+    def _reward_terms(self) -> dict[str, Callable[[mtx.SceneData, dict], np.ndarray]]:
         return {
-            "lin_vel_z": self._reward_lin_vel_z(data),
-            "ang_vel_xy": self._reward_ang_vel_xy(data),
-            "orientation": self._reward_orientation(data),
-            "torques": self._reward_torques(data),
-            "dof_vel": self._reward_dof_vel(data),
-            "dof_acc": self._reward_dof_acc(data, info),
-            "action_rate": self._reward_action_rate(info),
-            "tracking_lin_vel": self._reward_tracking_lin_vel(data, commands),
-            "tracking_ang_vel": self._reward_tracking_ang_vel(data, commands),
-            "stand_still": self._reward_stand_still(data, commands),
-            "hip_pos": self._reward_hip_pos(data, commands),
-            "calf_pos": self._reward_calf_pos(data, commands),
-            "feet_air_time": self._reward_feet_air_time(commands, info),
+            "lin_vel_z": lambda data, info: self._reward_lin_vel_z(data),
+            "ang_vel_xy": lambda data, info: self._reward_ang_vel_xy(data),
+            "orientation": lambda data, info: self._reward_orientation(data),
+            "torques": lambda data, info: self._reward_torques(data),
+            "dof_vel": lambda data, info: self._reward_dof_vel(data),
+            "dof_acc": lambda data, info: self._reward_dof_acc(data, info),
+            "action_rate": lambda data, info: self._reward_action_rate(info),
+            "tracking_lin_vel": lambda data, info: self._reward_tracking_lin_vel(data, info["commands"]),
+            "tracking_ang_vel": lambda data, info: self._reward_tracking_ang_vel(data, info["commands"]),
+            "stand_still": lambda data, info: self._reward_stand_still(data, info["commands"]),
+            "hip_pos": lambda data, info: self._reward_hip_pos(data, info["commands"]),
+            "calf_pos": lambda data, info: self._reward_calf_pos(data, info["commands"]),
+            "feet_air_time": lambda data, info: self._reward_feet_air_time(info["commands"], info),
         }
 
     # ------------ reward functions----------------
@@ -308,9 +311,9 @@ class Go2WalkTask(NpEnv):
 
     def _reward_orientation(self, data):
         # Penalize non flat base orientation
-        pose = self._body.get_pose(data)
+        pose = self._step_view.pose(self._body, data)
         base_quat = pose[:, 3:7]
-        gravity = quaternion.rotate_inverse(base_quat, self.gravity_vec)
+        gravity = rotation.projected_gravity(base_quat)
         return np.sum(np.square(gravity[:, :2]), axis=1)
 
     def _reward_torques(self, data: mtx.SceneData):
@@ -12,10 +12,3 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-
-from . import (
-    franka_lift_cube,
-    franka_open_cabinet,
-    rm65_open_cabinet,
-    shadow_hand,
-)
@@ -32,6 +32,7 @@ END_STEP = 12000
 @registry.env("franka-lift-cube", "np")
 class FrankaLiftCubeEnv(NpEnv):
     _cfg: FrankaLiftCubeEnvCfg
+    profile_methods = ("_compute_observation", "_check_termination", "_compute_reward")
 
     def __init__(self, cfg: FrankaLiftCubeEnvCfg, num_envs: int = 1):
         super().__init__(cfg, num_envs=num_envs)
@@ -81,9 +82,9 @@ class FrankaLiftCubeEnv(NpEnv):
         # 1. Map to probability p (using Sigmoid)
         probabilities = 1 / (1 + np.exp(-actions[:, -1]))
         # 2. Bernoulli sampling - probability always has chance to sample different results
-        # np.random.uniform(0, 1, size) generates a random number r ~ U(0, 1) for each environment
+        # self._rng.random() generates a random number r ~ U(0, 1) for each environment
         # If r < p, result is 1 (success/grasp), otherwise 0 (failure/release)
-        sampled_gripper_action = np.where(probabilities > np.random.rand(*probabilities.shape), 0, 0.04)[
+        sampled_gripper_action = np.where(probabilities > self._rng.random(probabilities.shape), 0, 0.04)[
             :, None
         ]  # Close 0, Open 0.04
         state.info["current_gripper_action"] = sampled_gripper_action.squeeze(axis=-1)
@@ -121,26 +122,18 @@ class FrankaLiftCubeEnv(NpEnv):
     def reset(self, data: mtx.SceneData):
         num_reset = data.shape[0]
 
-        # Robot arm initial joint angle noise
-        noise_pos = np.random.uniform(
-            -self._cfg.init_state.joint_pos_reset_noise_scale,
-            self._cfg.init_state.joint_pos_reset_noise_scale,
-            self._num_dof_pos,
-        )
-        robot_dof_pos = self._init_dof_pos + noise_pos
-
-        # Domain randomization for cube position
+        # Robot arm initial joint angle noise and domain randomization for cube position, drawn per env
         # x -0.1, 0.1
         # y -0.25, 0.25
-        x_low, x_high = -0.1, 0.1
-        y_low, y_high = -0.25, 0.25
-        pos_x = np.random.uniform(x_low, x_high)
-        pos_y = np.random.uniform(y_low, y_high)
+        noise_scale = self._cfg.init_state.joint_pos_reset_noise_scale
+        low = np.concatenate([np.full(self._num_dof_pos, -noise_scale), [-0.1, -0.25]])
+        high = np.concatenate([np.full(self._num_dof_pos, noise_scale), [0.1, 0.25]])
+        noise = self._rng.uniform(low, high, size=(num_reset, self._num_dof_pos + 2))
+        robot_dof_pos = self._init_dof_pos + noise[:, : self._num_dof_pos]
 
-        scene_dof_pos = np.concatenate(
-            [robot_dof_pos, np.array([pos_x, pos_y, 0.05, 1, 0, 0, 0], dtype=np.float32)]
-        )  # Added cube
-        scene_dof_pos = np.tile(scene_dof_pos, (num_reset, 1))
+        cube_pose = np.tile(np.array([0.0, 0.0, 0.05, 1, 0, 0, 0], dtype=np.float32), (num_reset, 1))
+        cube_pose[:, :2] = noise[:, self._num_dof_pos :]
+        scene_dof_pos = np.concatenate([robot_dof_pos, cube_pose], axis=-1).astype(np.float32)  # Added cube
 
         scene_dof_vel = np.concatenate([self._init_dof_vel, np.zeros(6, dtype=np.float32)])
         scene_dof_vel = np.tile(scene_dof_vel, (num_reset, 1))
@@ -282,10 +275,7 @@ class FrankaLiftCubeEnv(NpEnv):
         y_low, y_high = self._cfg.command_config.target_pos_y
         z_low, z_high = self._cfg.command_config.target_pos_z
 
-        pos_x = np.random.uniform(x_low, x_high, num_envs)
-        pos_y = np.random.uniform(y_low, y_high, num_envs)
-        pos_z = np.random.uniform(z_low, z_high, num_envs)
-        command_cube_target_pos = np.stack([pos_x, pos_y, pos_z], axis=-1)
+        command_cube_target_pos = self._rng.uniform([x_low, y_low, z_low], [x_high, y_high, z_high], size=(num_envs, 3))
 
         assert not np.isnan(command_cube_target_pos).any(), "command_cube_target_pos contain nan"
         return command_cube_target_pos
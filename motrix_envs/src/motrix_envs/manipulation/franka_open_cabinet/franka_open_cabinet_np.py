@@ -18,7 +18,7 @@ import motrixsim as mtx
 import numpy as np
 
 from motrix_envs import registry
-from motrix_envs.math import quaternion
+from motrix_envs.math import rotation
 from motrix_envs.np.env import NpEnv, NpEnvState
 
 from .cfg import FrankaOpenCabinetEnvCfg
@@ -27,6 +27,7 @@ from .cfg import FrankaOpenCabinetEnvCfg
 @registry.env("franka-open-cabinet", "np")
 class FrankaOpenCabinetEnv(NpEnv):
     _cfg: FrankaOpenCabinetEnvCfg
+    profile_methods = ("_compute_observation", "_check_termination", "_compute_reward")
 
     def __init__(self, cfg: FrankaOpenCabinetEnvCfg, num_envs: int = 1):
         super().__init__(cfg, num_envs=num_envs)
@@ -102,9 +103,9 @@ class FrankaOpenCabinetEnv(NpEnv):
         # 1. Map to probability p using Sigmoid
         probabilities = 1 / (1 + np.exp(-actions[:, -1]))
         # 2. Bernoulli sampling - probability can sample different results
-        # np.random.uniform(0, 1, size) generates random number r ~ U(0, 1) for each environment
+        # self._rng.random() generates random number r ~ U(0, 1) for each environment
         # If r < p, result is 1 (success/grasp), otherwise 0 (failure/release)
-        sampled_gripper_action = np.where(probabilities > np.random.rand(*probabilities.shape), 0, 0.04)[
+        sampled_gripper_action = np.where(probabilities > self._rng.random(probabilities.shape), 0, 0.04)[
             :, None
         ]  # 0 for closed, 0.04 for open
         state.info["current_gripper_action"] = sampled_gripper_action.squeeze()
@@ -141,7 +142,7 @@ class FrankaOpenCabinetEnv(NpEnv):
     def reset(self, data: mtx.SceneData):
         num_reset = data.shape[0]
 
-        noise_pos = np.random.uniform(
+        noise_pos = self._rng.uniform(
             -0.125,  # -cfg.reset_noise_scale,
             0.125,  # cfg.reset_noise_scale,
             (num_reset, self._num_dof_pos),
@@ -206,7 +207,7 @@ class FrankaOpenCabinetEnv(NpEnv):
         dist_reward *= 10
 
         ## matching orientation reward
-        quat_reward = quaternion.similarity(robot_grasp_pose[:, -4:], drawer_grasp_pose[:, -4:])
+        quat_reward = rotation.similarity(robot_grasp_pose[:, -4:], drawer_grasp_pose[:, -4:])
 
         ## close gripper reward
         # When gripper distance < 0.025, closing gripper gets reward
@@ -18,8 +18,11 @@ import motrixsim as mtx
 import numpy as np
 
 from motrix_envs import registry
-from motrix_envs.math import quaternion
+from motrix_envs.math import quaternion, rotation
 from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.history import HistoryBuffer
+from motrix_envs.np.info import InfoField, InfoGroup, InfoSchema
+from motrix_envs.np.obs import ObsSpec, ObsTerm
 
 from .cfg import RM65OpenCabinetEnvCfg
 from .gripper_logic import binary_hysteresis_step, raw_action_to_close_ratio
@@ -28,6 +31,7 @@ from .gripper_logic import binary_hysteresis_step, raw_action_to_close_ratio
 @registry.env("rm65-open-cabinet", "np")
 class RM65OpenCabinetEnv(NpEnv):
     _cfg: RM65OpenCabinetEnvCfg
+    profile_methods = ("_compute_observation", "_check_termination", "_compute_reward")
 
     def __init__(self, cfg: RM65OpenCabinetEnvCfg, num_envs: int = 1):
         super().__init__(cfg, num_envs=num_envs)
@@ -64,6 +68,7 @@ class RM65OpenCabinetEnv(NpEnv):
         self._init_dof_pos = self.robot_default_joint_pos
         self._init_dof_vel = np.zeros(self._num_dof_vel, dtype=np.float32)
         self._init_model_handles()
+        self._init_obs_spec()
 
         self.count = 0
         np.set_printoptions(precision=2)
@@ -166,6 +171,107 @@ class RM65OpenCabinetEnv(NpEnv):
         self.drawer_top_joint = self._model.get_joint("drawer_bottom_joint")
         self.drawer_top_handle = self._model.get_site("drawer_bottom_handle")
 
+    def _init_obs_spec(self) -> None:
+        # dof_pos is mapped from the actuator limits to [-1, 1]: 2 * (x - min) / range - 1
+        terms = [
+            ObsTerm(
+                "dof_pos",
+                self._action_dim,
+                scale=2.0 / self._obs_joint_pos_range,
+                offset=self._obs_joint_pos_min_limit + 0.5 * self._obs_joint_pos_range,
+            ),
+            ObsTerm("dof_vel", self._action_dim, scale=0.5),
+            ObsTerm("pos_delta", 3),
+            ObsTerm("quat_rel", 4),
+        ]
+        if self._action_history_len > 0:
+            terms.append(ObsTerm("action_history", self._action_dim * self._action_history_len))
+        self._obs_spec = ObsSpec(terms)
+        assert self._obs_spec.size == self._obs_dim
+
+    def info_schema(self) -> InfoSchema:
+        action_dim = self._action_dim
+        arm_dim = self._arm_action_dim
+        fields = [
+            InfoField("current_actions", (action_dim,)),
+            InfoField("last_actions", (action_dim,)),
+            InfoField("phase2_mask", dtype=bool),
+            InfoField("grasped", dtype=bool),
+            InfoField("grasp_hold_steps", dtype=np.int32),
+            InfoField("current_gripper_action", default=self.gripper_open_pos),
+            InfoField("obs_handle_bias_pos", (3,)),
+            InfoField("obs_handle_bias_quat", (4,)),
+            InfoField("obs_handle_pose_last", (7,)),
+            InfoField("obs_prev_dof_pos_abs_raw", (action_dim,)),
+            InfoField("handle_pose_override", (7,)),
+            InfoField("handle_pose_override_mask", dtype=bool),
+            InfoField("arm_action_delay_steps", dtype=np.int32),
+            InfoField("arm_actuator_lag_alpha"),
+            InfoField("arm_max_step"),
+            InfoField("arm_max_acc_step"),
+            InfoField("arm_target_smooth", (arm_dim,)),
+            InfoField("arm_prev_delta", (arm_dim,)),
+            InfoField("arm_actuator_target", (arm_dim,)),
+            InfoField("gripper_target_smooth"),
+            InfoField("gripper_binary_closed", dtype=bool),
+            InfoField("gripper_closed_cmd", dtype=bool),
+            InfoField("gripper_steps_since_switch", dtype=np.int32),
+            InfoField("gripper_close_ratio"),
+            InfoField("prev_gripper_closed_cmd", dtype=bool),
+            InfoField("prev_open_dist"),
+            InfoField("open_bonus_progress", dtype=np.int32),
+            *HistoryBuffer.fields("action_delay_buffer", max(int(self._arm_action_delay_buffer_len), 1), (action_dim,)),
+            InfoGroup(
+                "Reward",
+                tuple(
+                    InfoField(name)
+                    for name in (
+                        "dist",
+                        "quat",
+                        "close_gripper",
+                        "open_reward",
+                        "open_delta_reward",
+                        "grasp_hold_reward",
+                        "open_bonus_reward",
+                        "slip_penalty",
+                        "finger_penalty",
+                        "finger_align_reward",
+                        "gripper_switch_penalty",
+                        "grasped_rate",
+                        "action_penalty",
+                        "joint_vel_penalty",
+                        "truncation_penalty",
+                    )
+                ),
+            ),
+            InfoGroup(
+                "metrics",
+                tuple(
+                    InfoField(name)
+                    for name in (
+                        "open_dist",
+                        "gripper_drawer_dist",
+                        "gripper_close_rate",
+                        "grasp_dist_hit_rate",
+                        "grasp_close_hit_rate",
+                        "grasp_align_hit_rate",
+                        "close_amount",
+                        "wrong_open",
+                        "gripper_switch",
+                        "grasped_rate",
+                        "action_penalty_rate",
+                        "joint_vel_penalty_rate",
+                    )
+                ),
+            ),
+        ]
+        if self._action_history_len > 0:
+            fields.extend(HistoryBuffer.fields("action_history", self._action_history_len, (action_dim,)))
+        latency_steps = max(int(self._obs_noise_cfg.latency_steps), 0)
+        if latency_steps > 0:
+            fields.extend(HistoryBuffer.fields("obs_handle_pose_buffer", latency_steps + 1, (7,)))
+        return InfoSchema(fields)
+
     def _compute_hold_action(self, dof_pos: np.ndarray) -> np.ndarray:
         num_envs = dof_pos.shape[0]
         arm_pos = dof_pos[:, : self._arm_action_dim]
@@ -220,12 +326,12 @@ class RM65OpenCabinetEnv(NpEnv):
 
     def _sample_arm_delay_lag(self, num_envs: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         if self._arm_delay_lag_randomization_enabled:
-            delay_steps = np.random.randint(
+            delay_steps = self._rng.integers(
                 self._arm_action_delay_steps_min,
                 self._arm_action_delay_steps_max + 1,
                 size=(num_envs,),
             ).astype(np.int32)
-            lag_alpha = np.random.uniform(
+            lag_alpha = self._rng.uniform(
                 self._arm_actuator_lag_alpha_min,
                 self._arm_actuator_lag_alpha_max,
                 size=(num_envs,),
@@ -234,12 +340,12 @@ class RM65OpenCabinetEnv(NpEnv):
             delay_steps = np.full((num_envs,), int(self._arm_action_delay_steps), dtype=np.int32)
             lag_alpha = np.full((num_envs,), float(self._arm_actuator_lag_alpha), dtype=np.float32)
         if self._arm_speed_acc_randomization_enabled:
-            max_step = np.random.uniform(
+            max_step = self._rng.uniform(
                 self._arm_max_step_min,
                 self._arm_max_step_max,
                 size=(num_envs,),
             ).astype(np.float32)
-            max_acc_step = np.random.uniform(
+            max_acc_step = self._rng.uniform(
                 self._arm_max_acc_step_min,
                 self._arm_max_acc_step_max,
                 size=(num_envs,),
@@ -260,38 +366,35 @@ class RM65OpenCabinetEnv(NpEnv):
         buffer_len = max(int(self._arm_action_delay_buffer_len), 1)
         delay_steps = np.minimum(delay_steps, buffer_len - 1)
 
-        buffer = info.get("action_delay_buffer")
-        expected_shape = (num_envs, buffer_len, actions.shape[1])
-        if buffer is None or buffer.shape != expected_shape:
-            buffer = np.repeat(actions[:, None, :], buffer_len, axis=1)
-        else:
-            buffer = np.roll(buffer, 1, axis=1)
-            buffer[:, 0, :] = actions
-            steps = info.get("steps")
-            if isinstance(steps, np.ndarray) and steps.shape == (num_envs,):
-                reset_mask = steps == 0
-                if np.any(reset_mask):
-                    buffer[reset_mask] = np.repeat(actions[reset_mask][:, None, :], buffer_len, axis=1)
-        info["action_delay_buffer"] = buffer
-        return buffer[np.arange(num_envs), delay_steps, :]
+        buffer = self._history(info, "action_delay_buffer", actions, buffer_len)
+        return buffer.get(delay_steps)
+
+    @staticmethod
+    def _history(info: dict, name: str, value: np.ndarray, length: int) -> HistoryBuffer:
+        """
+        Push ``value`` to the history ``name`` of the info, filling it for the envs at their first step
+        """
+        num_envs = value.shape[0]
+        buffer = HistoryBuffer.from_info(info, name)
+        if buffer is None or buffer.values.shape != (num_envs, length, *value.shape[1:]):
+            buffer = HistoryBuffer.allocate(num_envs, length, value.shape[1:])
+            buffer.fill(value)
+            for key, item in buffer.to_info(name).items():
+                info[key] = item
+            return buffer
+        buffer.push(value)
+        steps = info.get("steps")
+        if isinstance(steps, np.ndarray) and steps.shape == (num_envs,):
+            reset_mask = steps == 0
+            if np.any(reset_mask):
+                buffer.fill(value[reset_mask], reset_mask)
+        return buffer
 
     def _update_action_history(self, raw_actions: np.ndarray, delayed_actions: np.ndarray, info: dict) -> None:
         if self._action_history_len <= 0:
             return
 
-        hist = info.get("action_history")
-        expected_shape = (delayed_actions.shape[0], self._action_history_len, delayed_actions.shape[1])
-        if hist is None or hist.shape != expected_shape:
-            hist = np.repeat(raw_actions[:, None, :], self._action_history_len, axis=1)
-        else:
-            hist = np.roll(hist, 1, axis=1)
-            hist[:, 0, :] = raw_actions
-            steps = info.get("steps")
-            if isinstance(steps, np.ndarray) and steps.shape == (delayed_actions.shape[0],):
-                reset_mask = steps == 0
-                if np.any(reset_mask):
-                    hist[reset_mask] = np.repeat(raw_actions[reset_mask][:, None, :], self._action_history_len, axis=1)
-        info["action_history"] = hist
+        self._history(info, "action_history", raw_actions, self._action_history_len)
 
     def _apply_arm_action(self, arm_action: np.ndarray, old_joint_pos: np.ndarray, info: dict) -> np.ndarray:
         arm_min_limit = self.robot_joint_pos_min_limit[: self._arm_action_dim]
@@ -454,14 +557,13 @@ class RM65OpenCabinetEnv(NpEnv):
     def update_state(self, state: NpEnvState):
         self._enforce_drawer_grasp_constraint(state)
         # compute obs
-        obs = self._compute_observation(state.data, state.info)
+        self._compute_observation(state.data, state.info, out=state.obs)
         # compute truncated
         truncated = self._check_termination(state)
 
         # compute reward
         reward = self._compute_reward(state, truncated)
 
-        state.obs = obs
         state.reward = reward
         state.terminated = truncated
 
@@ -506,7 +608,7 @@ class RM65OpenCabinetEnv(NpEnv):
         num_reset = data.shape[0]
 
         noise_scale = self._cfg.reset.joint_pos_noise_scale
-        noise_pos = np.random.uniform(-noise_scale, noise_scale, (num_reset, self._action_dim))
+        noise_pos = self._rng.uniform(-noise_scale, noise_scale, (num_reset, self._action_dim))
 
         dof_pos = np.tile(self._init_dof_pos, (num_reset, 1))
         dof_pos[:, : self._action_dim] += noise_pos  # Add noise in range [-0.125, 0.125]
@@ -526,7 +628,7 @@ class RM65OpenCabinetEnv(NpEnv):
         obs_noise_cfg = self._obs_noise_cfg
         bias_pos = np.zeros((num_reset, 3), dtype=np.float32)
         if obs_noise_cfg.target_pos_bias_std > 0.0:
-            bias_pos = np.random.normal(0.0, obs_noise_cfg.target_pos_bias_std, size=(num_reset, 3)).astype(np.float32)
+            bias_pos = self._rng.normal(0.0, obs_noise_cfg.target_pos_bias_std, size=(num_reset, 3)).astype(np.float32)
         bias_quat = self._sample_quat_bias(num_reset, obs_noise_cfg.target_rot_bias_std)
         handle_pose = self.drawer_top_handle.get_pose(data).astype(np.float32)
         info = {
@@ -584,17 +686,20 @@ class RM65OpenCabinetEnv(NpEnv):
                 "joint_vel_penalty_rate": np.zeros(num_reset, dtype=np.float32),
             },
         }
-        buffer_len = max(int(self._arm_action_delay_buffer_len), 1)
-        info["action_delay_buffer"] = np.repeat(hold_action[:, None, :], buffer_len, axis=1)
+        histories = [("action_delay_buffer", hold_action, max(int(self._arm_action_delay_buffer_len), 1))]
         if self._action_history_len > 0:
-            info["action_history"] = np.repeat(hold_action[:, None, :], self._action_history_len, axis=1)
+            histories.append(("action_history", hold_action, self._action_history_len))
         latency_steps = max(int(obs_noise_cfg.latency_steps), 0)
         if latency_steps > 0:
-            info["obs_handle_pose_buffer"] = np.repeat(handle_pose[:, None, :], latency_steps + 1, axis=1)
+            histories.append(("obs_handle_pose_buffer", handle_pose, latency_steps + 1))
+        for name, value, length in histories:
+            buffer = HistoryBuffer.allocate(num_reset, length, value.shape[1:])
+            buffer.fill(value)
+            info.update(buffer.to_info(name))
         obs = self._compute_observation(data, info)
         return obs, info
 
-    def _compute_observation(self, data: mtx.SceneData, info: dict):
+    def _compute_observation(self, data: mtx.SceneData, info: dict, out: np.ndarray = None):
         num_envs = data.shape[0]
         obs_noise_cfg = self._obs_noise_cfg
 
@@ -603,13 +708,12 @@ class RM65OpenCabinetEnv(NpEnv):
         dof_pos_rel_raw = self._get_robot_joint_pos_rel(dof_pos)[:, : self._action_dim]
         dof_pos_rel = dof_pos_rel_raw.copy()
         if obs_noise_cfg.enabled and obs_noise_cfg.joint_noise_enabled and obs_noise_cfg.joint_pos_std > 0.0:
-            dof_pos_rel = dof_pos_rel + np.random.normal(
+            dof_pos_rel = dof_pos_rel + self._rng.normal(
                 0.0, obs_noise_cfg.joint_pos_std, size=dof_pos_rel.shape
             ).astype(np.float32)
 
         dof_pos_abs = dof_pos_rel + self.robot_default_joint_pos[: self._action_dim]
         dof_pos_abs_raw = dof_pos_rel_raw + self.robot_default_joint_pos[: self._action_dim]
-        dof_pos_scaled = 2.0 * (dof_pos_abs - self._obs_joint_pos_min_limit) / self._obs_joint_pos_range - 1.0
         # relative vel: finite-difference from consecutive joint positions
         # to reduce dependency on simulator/driver-specific velocity channels.
         dt = max(float(self._cfg.ctrl_dt), 1e-6)
@@ -627,10 +731,9 @@ class RM65OpenCabinetEnv(NpEnv):
         info["obs_prev_dof_pos_abs_raw"] = dof_pos_abs_raw.astype(np.float32, copy=True)
 
         if obs_noise_cfg.enabled and obs_noise_cfg.joint_noise_enabled and obs_noise_cfg.joint_vel_std > 0.0:
-            dof_vel_rel = dof_vel_rel + np.random.normal(
+            dof_vel_rel = dof_vel_rel + self._rng.normal(
                 0.0, obs_noise_cfg.joint_vel_std, size=dof_vel_rel.shape
             ).astype(np.float32)
-        dof_vel_rel = dof_vel_rel / 2
 
         # relative pose: position delta + relative quaternion (target * current.inverse)
         robot_grasp_pose = self.gripper_tcp.get_pose(data)
@@ -640,27 +743,28 @@ class RM65OpenCabinetEnv(NpEnv):
         pos_delta = drawer_grasp_pose[:, :3] - robot_grasp_pose[:, :3]
         quat_target = drawer_grasp_pose[:, 3:]
         quat_current = robot_grasp_pose[:, 3:]
-        q_rel = quaternion.mul(quat_target, quaternion.inverse(quat_current))
-        q_norm = np.linalg.norm(q_rel, axis=-1, keepdims=True)
-        q_rel = q_rel / np.maximum(q_norm, 1e-6)
-        # Enforce a consistent hemisphere to avoid sign flips.
-        sign = np.where(q_rel[:, 3:4] < 0.0, -1.0, 1.0)
-        q_rel = q_rel * sign
-        to_target = np.concatenate([pos_delta, q_rel], axis=-1)
-
-        obs = np.concatenate([dof_pos_scaled, dof_vel_rel, to_target], axis=-1)
+        # relative rotation in a consistent hemisphere to avoid sign flips
+        q_rel = rotation.relative(quat_target, quat_current)
+        q_rel /= np.maximum(np.linalg.norm(q_rel, axis=-1, keepdims=True), 1e-6)
+
+        terms = {
+            "dof_pos": dof_pos_abs,
+            "dof_vel": dof_vel_rel,
+            "pos_delta": pos_delta,
+            "quat_rel": q_rel,
+        }
         if self._action_history_len > 0:
-            history = info.get("action_history")
+            history = HistoryBuffer.from_info(info, "action_history")
             expected_shape = (num_envs, self._action_history_len, self._action_dim)
-            if history is None or history.shape != expected_shape:
-                history = np.zeros(expected_shape, dtype=np.float32)
+            if history is None or history.values.shape != expected_shape:
+                terms["action_history"] = 0.0
             else:
-                history = history.astype(np.float32, copy=False)
-            obs = np.concatenate([obs, history.reshape(num_envs, -1)], axis=-1)
+                terms["action_history"] = history.ordered()
 
+        obs = self._obs_spec.build(out, **terms)
         assert obs.shape == (num_envs, self._obs_dim)
         assert not np.isnan(obs).any(), "obs contain nan"
-        return np.clip(obs, -5, 5)
+        return np.clip(obs, -5, 5, out=obs)
 
     def _resolve_handle_pose(self, data: mtx.SceneData, info: dict):
         handle_pose = self.drawer_top_handle.get_pose(data)
@@ -684,21 +788,23 @@ class RM65OpenCabinetEnv(NpEnv):
             return override_pose
         return handle_pose
 
-    def _sample_quat_bias(self, num_envs: int, rot_std: float):
+    def _sample_quat_bias(self, num_envs: int, rot_std: float, rows: np.ndarray = None):
         identity = np.array([0.0, 0.0, 0.0, 1.0], dtype=np.float32)
         base = np.tile(identity, (num_envs, 1))
         if rot_std <= 0.0:
             return base
-        return self._apply_quat_noise(base, rot_std)
+        return self._apply_quat_noise(base, rot_std, rows)
 
-    def _apply_quat_noise(self, quat: np.ndarray, rot_std: float):
+    def _apply_quat_noise(self, quat: np.ndarray, rot_std: float, rows: np.ndarray = None):
         num_envs = quat.shape[0]
-        axes = np.random.normal(0.0, 1.0, (num_envs, 3)).astype(np.float32)
+        # Axis and angle come from one draw: columns 0-2 are the axis, column 3 the unit angle.
+        axis_angle = self._rng.standard_normal((num_envs, 4), rows=rows).astype(np.float32)
+        axes = axis_angle[:, :3]
         axis_norm = np.linalg.norm(axes, axis=-1, keepdims=True)
         safe_axis = np.array([1.0, 0.0, 0.0], dtype=np.float32)
         axes = np.where(axis_norm < 1e-6, safe_axis, axes)
         axes = axes / np.maximum(axis_norm, 1e-6)
-        angles = np.random.normal(0.0, rot_std, (num_envs,)).astype(np.float32)
+        angles = axis_angle[:, 3] * np.float32(rot_std)
         half_angles = angles * 0.5
         sin_half = np.sin(half_angles).astype(np.float32)
         cos_half = np.cos(half_angles).astype(np.float32)
@@ -719,12 +825,13 @@ class RM65OpenCabinetEnv(NpEnv):
         if cfg.target_pos_bias_std > 0.0:
             bias_pos = info.get("obs_handle_bias_pos")
             if not isinstance(bias_pos, np.ndarray) or bias_pos.shape != (num_envs, 3):
-                bias_pos = np.random.normal(0.0, cfg.target_pos_bias_std, size=(num_envs, 3)).astype(np.float32)
+                bias_pos = self._rng.normal(0.0, cfg.target_pos_bias_std, size=(num_envs, 3)).astype(np.float32)
             if bias_resample_prob > 0.0:
-                resample_mask = np.random.rand(num_envs) < bias_resample_prob
+                resample_mask = self._rng.random(num_envs) < bias_resample_prob
                 if np.any(resample_mask):
-                    bias_pos[resample_mask] = np.random.normal(
-                        0.0, cfg.target_pos_bias_std, size=(resample_mask.sum(), 3)
+                    rows = np.flatnonzero(resample_mask)
+                    bias_pos[rows] = self._rng.normal(
+                        0.0, cfg.target_pos_bias_std, size=(len(rows), 3), rows=rows
                     ).astype(np.float32)
             info["obs_handle_bias_pos"] = bias_pos
             noisy_pose[:, :3] = noisy_pose[:, :3] + bias_pos
@@ -734,14 +841,15 @@ class RM65OpenCabinetEnv(NpEnv):
             if not isinstance(bias_quat, np.ndarray) or bias_quat.shape != (num_envs, 4):
                 bias_quat = self._sample_quat_bias(num_envs, cfg.target_rot_bias_std)
             if bias_resample_prob > 0.0:
-                resample_mask = np.random.rand(num_envs) < bias_resample_prob
+                resample_mask = self._rng.random(num_envs) < bias_resample_prob
                 if np.any(resample_mask):
-                    bias_quat[resample_mask] = self._sample_quat_bias(int(resample_mask.sum()), cfg.target_rot_bias_std)
+                    rows = np.flatnonzero(resample_mask)
+                    bias_quat[rows] = self._sample_quat_bias(len(rows), cfg.target_rot_bias_std, rows)
             info["obs_handle_bias_quat"] = bias_quat
             noisy_pose[:, 3:] = quaternion.mul(bias_quat, noisy_pose[:, 3:])
 
         if cfg.target_pos_std > 0.0:
-            noisy_pose[:, :3] = noisy_pose[:, :3] + np.random.normal(
+            noisy_pose[:, :3] = noisy_pose[:, :3] + self._rng.normal(
                 0.0, cfg.target_pos_std, size=(num_envs, 3)
             ).astype(np.float32)
         if cfg.target_rot_std > 0.0:
@@ -749,7 +857,7 @@ class RM65OpenCabinetEnv(NpEnv):
 
         dropout_prob = float(np.clip(cfg.dropout_prob, 0.0, 1.0))
         if dropout_prob > 0.0:
-            dropout_mask = np.random.rand(num_envs) < dropout_prob
+            dropout_mask = self._rng.random(num_envs) < dropout_prob
             if np.any(dropout_mask):
                 last_pose = info.get("obs_handle_pose_last")
                 if cfg.hold_last_on_dropout and isinstance(last_pose, np.ndarray):
@@ -761,15 +869,15 @@ class RM65OpenCabinetEnv(NpEnv):
 
         latency_steps = max(int(cfg.latency_steps), 0)
         if latency_steps > 0:
-            buffer = info.get("obs_handle_pose_buffer")
-            expected_shape = (num_envs, latency_steps + 1, noisy_pose.shape[1])
-            if buffer is None or buffer.shape != expected_shape:
-                buffer = np.repeat(noisy_pose[:, None, :], latency_steps + 1, axis=1)
+            buffer = HistoryBuffer.from_info(info, "obs_handle_pose_buffer")
+            if buffer is None or buffer.values.shape != (num_envs, latency_steps + 1, noisy_pose.shape[1]):
+                buffer = HistoryBuffer.allocate(num_envs, latency_steps + 1, noisy_pose.shape[1:])
+                buffer.fill(noisy_pose)
+                for key, item in buffer.to_info("obs_handle_pose_buffer").items():
+                    info[key] = item
             else:
-                buffer = np.roll(buffer, 1, axis=1)
-                buffer[:, 0, :] = noisy_pose
-            info["obs_handle_pose_buffer"] = buffer
-            return buffer[:, -1, :]
+                buffer.push(noisy_pose)
+            return buffer.get(latency_steps)
 
         return noisy_pose
 
@@ -784,7 +892,7 @@ class RM65OpenCabinetEnv(NpEnv):
         dist_reward = 1 - np.tanh(gripper_drawer_dist / reward_cfg.dist_std)
         dist_reward *= reward_cfg.dist_scale
 
-        quat_reward = quaternion.similarity(robot_grasp_pose[:, -4:], drawer_grasp_pose[:, -4:])
+        quat_reward = rotation.similarity(robot_grasp_pose[:, -4:], drawer_grasp_pose[:, -4:])
         if reward_cfg.quat_reward_dist_thresh > 0.0:
             quat_reward = np.where(gripper_drawer_dist < reward_cfg.quat_reward_dist_thresh, quat_reward, 0.0)
         quat_reward = quat_reward * reward_cfg.quat_reward_scale
@@ -65,6 +65,9 @@ class ShadowHandReposeEnvCfg(EnvCfg):
         "rh_lfdistal",  # Little finger distal
         "rh_thdistal",  # Thumb distal
     )
+    # Fingertip velocities: "sim" reads the exact link velocities, "finite_difference" differentiates the
+    # fingertip poses between control steps, see ``motrix_envs.np.link_states``
+    fingertip_velocity: str = "sim"
 
     # ====================
     # Object Configuration
@@ -28,6 +28,7 @@ import numpy as np
 from motrix_envs import registry
 from motrix_envs.math import quaternion, utils
 from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.link_states import LinkStateReader
 
 from .cfg import ShadowHandReposeEnvCfg
 
@@ -52,6 +53,7 @@ class ShadowHandReposeEnv(NpEnv):
     """
 
     _cfg: ShadowHandReposeEnvCfg
+    profile_methods = ("_compute_observation", "_compute_reward")
 
     def __init__(self, cfg: ShadowHandReposeEnvCfg, num_envs: int = 1):
         super().__init__(cfg, num_envs=num_envs)
@@ -78,6 +80,9 @@ class ShadowHandReposeEnv(NpEnv):
             link_id = self._model.get_link_index(name)
             self._fingertip_link_ids.append(link_id)
         self._num_fingertips = len(self._fingertip_link_ids)
+        self._fingertip_states = LinkStateReader(
+            self._model, self._fingertip_link_ids, cfg.ctrl_dt, velocity=cfg.fingertip_velocity
+        )
 
         # Get cube and target link indices
         self._cube_link_id = self._model.get_link_index("cube")
@@ -103,50 +108,21 @@ class ShadowHandReposeEnv(NpEnv):
     def _extract_cube_states(self, data: mtx.SceneData, body: mtx.Body):
         return body.get_position(data), body.get_rotation(data), data.dof_vel[:, body.get_dof_vel_indices()]
 
-    def _extract_link_states(self, data: mtx.SceneData, link_ids):
+    def _extract_fingertip_states(self, data: mtx.SceneData, info: dict) -> np.ndarray:
         """
-        Extract position, quaternion, and velocity for specified links.
+        Read the fingertip states in one batched read.
 
         Args:
             data: SceneData object
-            link_ids: List of link indices or single int
+            info: The episode info, whose ``steps`` tell the envs restarted since the previous read. Without
+                ``steps``, the info of ``reset``, all the envs of ``data`` restart.
 
         Returns:
-            Tuple of (positions, quaternions, velocities)
-            - positions: (batch, num_links, 3)
-            - quaternions: (batch, num_links, 4) in (x, y, z, w) format
-            - velocities: (batch, num_links, 6) [linear_vel, angular_vel]
+            (batch, num_fingertips, 13) states [pos, quat (x, y, z, w), linear_vel, angular_vel]
         """
-        # Ensure link_ids is a list
-        if isinstance(link_ids, int):
-            link_ids = [link_ids]
-
-        # Get all link poses: shape (batch, num_links_total, 7) [x, y, z, qx, qy, qz, qw]
-        all_poses = self._model.get_link_poses(data)
-
-        # Extract poses for requested links
-        poses = all_poses[:, link_ids, :]  # (batch, num_requested_links, 7)
-
-        # Split into position and quaternion
-        positions = poses[:, :, :3]
-        quaternions = poses[:, :, 3:]  # (qx, qy, qz, qw)
-
-        # TODO: Velocity computation - MotrixSim doesn't expose link velocities yet
-        # Temporary solution: use zero velocities
-        # Future options:
-        # 1. Finite differences (requires storing previous poses)
-        # 2. Compute from DOF velocities via Jacobian (if available)
-        # 3. Wait for API: model.get_link_velocities(data)
-        batch_size = data.shape[0]
-        num_links = len(link_ids)
-        velocities = np.zeros((batch_size, num_links, 6), dtype=np.float32)
-        for j in np.arange(num_links):
-            link = self._model.get_link(link_ids[j])
-            velocities[:, j] = np.concatenate(
-                (link.get_linear_velocity(data), link.get_angular_velocity(data)), axis=-1
-            )
-
-        return positions, quaternions, velocities
+        steps = info.get("steps")
+        restart = np.ones(data.shape[0], dtype=bool) if steps is None else steps == 0
+        return self._fingertip_states.read(data, restart=restart)
 
     def apply_action(self, actions: np.ndarray, state: NpEnvState):
         """Apply actions to the hand actuators."""
@@ -203,15 +179,15 @@ class ShadowHandReposeEnv(NpEnv):
         cube_linvel = cube_vel[:, :3]
         cube_angvel = cube_vel[:, 3:]
 
-        # Get fingertip states using link poses
-        fingertip_pos, fingertip_quat, fingertip_vel = self._extract_link_states(data, self._fingertip_link_ids)
+        # Get fingertip states in one batched read
+        fingertip_states = self._extract_fingertip_states(data, info)
 
         # Flatten fingertip states (5 × 13 = 65)
         fingertip_state = np.concatenate(
             [
-                fingertip_pos.reshape(num_envs, -1),  # 15
-                fingertip_quat.reshape(num_envs, -1),  # 20
-                fingertip_vel.reshape(num_envs, -1),  # 30
+                fingertip_states[..., :3].reshape(num_envs, -1),  # 15
+                fingertip_states[..., 3:7].reshape(num_envs, -1),  # 20
+                fingertip_states[..., 7:].reshape(num_envs, -1),  # 30
             ],
             axis=-1,
         )  # Total: 65
@@ -328,17 +304,11 @@ class ShadowHandReposeEnv(NpEnv):
         init_dof_pos = self._model.compute_init_dof_pos()
         init_dof_vel = np.zeros(self._model.num_dof_vel, dtype=np.float32)
 
-        # Add noise to DOF positions
-        dof_pos_noise = np.random.uniform(
-            -cfg.reset_dof_pos_noise,
-            cfg.reset_dof_pos_noise,
-            (num_resets, self._num_hand_dofs),
-        ).astype(np.float32)
-
-        # Add noise to DOF velocities
-        dof_vel_noise = np.random.uniform(
-            -cfg.reset_dof_vel_noise, cfg.reset_dof_vel_noise, (num_resets, self._num_hand_dofs)
-        ).astype(np.float32)
+        # Add noise to DOF positions and velocities, drawn together
+        noise_scale = np.repeat([cfg.reset_dof_pos_noise, cfg.reset_dof_vel_noise], self._num_hand_dofs)
+        dof_noise = self._rng.uniform(-noise_scale, noise_scale, (num_resets, 2 * self._num_hand_dofs))
+        dof_pos_noise = dof_noise[:, : self._num_hand_dofs].astype(np.float32)
+        dof_vel_noise = dof_noise[:, self._num_hand_dofs :].astype(np.float32)
 
         # Set DOF states for all envs in data (already filtered)
         dof_pos = np.tile(init_dof_pos, (num_resets, 1))
@@ -350,14 +320,14 @@ class ShadowHandReposeEnv(NpEnv):
         data.set_dof_vel(dof_vel)
 
         # Reset cube position with small noise
-        cube_pos_noise = np.random.uniform(-cfg.reset_position_noise, cfg.reset_position_noise, (num_resets, 3)).astype(
-            np.float32
-        )
+        # Cube position noise, cube orientation and goal orientation samples, drawn together
+        spawn = self._rng.random((num_resets, 9))
+        cube_pos_noise = (cfg.reset_position_noise * (2.0 * spawn[:, :3] - 1.0)).astype(np.float32)
         cube_pos = np.tile(self._in_hand_pos, (num_resets, 1))
         cube_pos += cube_pos_noise
 
         # Randomize cube orientation
-        cube_quat = quaternion.generate_random_shoemake(num_resets)
+        cube_quat = quaternion.generate_random_shoemake(num_resets, spawn[:, 3:6])
 
         # Set cube pose using body's set_dof_pos method
         # Combine into DOF pose: [x, y, z, qx, qy, qz, qw]
@@ -374,7 +344,7 @@ class ShadowHandReposeEnv(NpEnv):
         # Note: goal_pos and goal_rot are indexed by original env indices
         info = {
             "goal_pos": np.tile(self._in_hand_pos, num_resets).reshape(num_resets, 3),
-            "goal_rot": quaternion.generate_random_shoemake(num_resets),
+            "goal_rot": quaternion.generate_random_shoemake(num_resets, spawn[:, 6:9]),
             "prev_actions": np.zeros((num_resets, self._num_actuators), dtype=np.float32),
             "successes": np.zeros((num_resets), dtype=np.int32),
         }
@@ -390,4 +360,6 @@ class ShadowHandReposeEnv(NpEnv):
         # Goal position is fixed
 
         # Randomize goal orientation using Shoemake method for uniform SO(3) sampling
-        info["goal_rot"][env_ids] = quaternion.generate_random_shoemake(num_resets)
+        info["goal_rot"][env_ids] = quaternion.generate_random_shoemake(
+            num_resets, self._rng.random((num_resets, 3), rows=env_ids)
+        )
@@ -0,0 +1,97 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Numba gufuncs of the kernels of ``motrix_envs.math.rotation``, selected by ``rotation.set_backend("numba")``
+
+Every kernel loads all its operands before writing, so that the output may alias an input. The projected
+gravity runs as ``rotate_inverse`` of the constant direction, a gufunc output needing a core dimension of its
+inputs.
+"""
+
+import math
+
+from numba import guvectorize
+
+_OPTIONS = {"nopython": True, "cache": True}
+
+
+@guvectorize(["void(float32[:], float32[:], float32[:])"], "(n),(n)->(n)", **_OPTIONS)
+def mul(q1, q2, out):
+    x1, y1, z1, w1 = q1[0], q1[1], q1[2], q1[3]
+    x2, y2, z2, w2 = q2[0], q2[1], q2[2], q2[3]
+    out[0] = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+    out[1] = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+    out[2] = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    out[3] = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+
+
+@guvectorize(["void(float32[:], float32[:])"], "(n)->(n)", **_OPTIONS)
+def conjugate(q, out):
+    x, y, z, w = q[0], q[1], q[2], q[3]
+    out[0] = -x
+    out[1] = -y
+    out[2] = -z
+    out[3] = w
+
+
+@guvectorize(["void(float32[:], float32[:], float32[:])"], "(n),(n)->(n)", **_OPTIONS)
+def relative(q_target, q_current, out):
+    x1, y1, z1, w1 = q_target[0], q_target[1], q_target[2], q_target[3]
+    x2, y2, z2, w2 = q_current[0], q_current[1], q_current[2], q_current[3]
+    w = w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2
+    sign = -1.0 if w < 0.0 else 1.0
+    out[0] = sign * (x1 * w2 - w1 * x2 - y1 * z2 + z1 * y2)
+    out[1] = sign * (y1 * w2 - w1 * y2 + x1 * z2 - z1 * x2)
+    out[2] = sign * (z1 * w2 - w1 * z2 - x1 * y2 + y1 * x2)
+    out[3] = sign * w
+
+
+@guvectorize(["void(float32[:], float32[:], float32[:])"], "(n),(m)->(m)", **_OPTIONS)
+def rotate(q, v, out):
+    x, y, z, w = q[0], q[1], q[2], q[3]
+    vx, vy, vz = v[0], v[1], v[2]
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+    out[0] = vx + w * tx + (y * tz - z * ty)
+    out[1] = vy + w * ty + (z * tx - x * tz)
+    out[2] = vz + w * tz + (x * ty - y * tx)
+
+
+@guvectorize(["void(float32[:], float32[:], float32[:])"], "(n),(m)->(m)", **_OPTIONS)
+def rotate_inverse(q, v, out):
+    x, y, z, w = q[0], q[1], q[2], -q[3]
+    vx, vy, vz = v[0], v[1], v[2]
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+    out[0] = vx + w * tx + (y * tz - z * ty)
+    out[1] = vy + w * ty + (z * tx - x * tz)
+    out[2] = vz + w * tz + (x * ty - y * tx)
+
+
+@guvectorize(["void(float32[:], float32[:])"], "(n)->()", **_OPTIONS)
+def yaw(q, out):
+    x, y, z, w = q[0], q[1], q[2], q[3]
+    out[0] = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+
+
+@guvectorize(["void(float32[:], float32[:], float32[:])"], "(n),(n)->()", **_OPTIONS)
+def similarity(q_current, q_target, out):
+    w = q_target[0] * q_current[0] + q_target[1] * q_current[1] + q_target[2] * q_current[2]
+    w += q_target[3] * q_current[3]
+    w = min(max(w, -1.0), 1.0)
+    out[0] = 2.0 * w * w - 1.0
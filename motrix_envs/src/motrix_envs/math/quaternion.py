@@ -283,7 +283,7 @@ def get_yaw(quat: np.ndarray) -> np.ndarray:
     return yaw
 
 
-def generate_random_shoemake(size):
+def generate_random_shoemake(size, samples=None):
     """
     Generate uniformly distributed random quaternions using Shoemake's method.
 
@@ -291,6 +291,7 @@ def generate_random_shoemake(size):
 
     Args:
         size: Number of quaternions to generate (int or tuple)
+        samples: Optional uniform [0, 1) samples of shape (*size, 3) to map instead of drawing from np.random
 
     Returns:
         Random quaternions in (x, y, z, w) format. Shape: (size, 4) or (*size, 4)
@@ -305,7 +306,10 @@ def generate_random_shoemake(size):
         size = tuple(size)
 
     # Generate three uniform random numbers
-    u1, u2, u3 = np.random.uniform(0, 1, size=(3, *size)).astype(np.float32)
+    if samples is None:
+        u1, u2, u3 = np.random.uniform(0, 1, size=(3, *size)).astype(np.float32)
+    else:
+        u1, u2, u3 = np.moveaxis(np.asarray(samples, dtype=np.float32).reshape(*size, 3), -1, 0)
 
     # Shoemake's method
     sqrt1_u1 = np.sqrt(1 - u1)
@@ -0,0 +1,221 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""
+Float32 quaternion and rotation kernels with optional ``out=`` buffers
+
+Quaternions are in [x, y, z, w] format. The inputs broadcast like numpy ufuncs and are cast to float32. The
+float32 results are written into ``out`` when given, which may alias an input. Unlike ``quaternion``, the
+kernels never stack, tile or copy their operands, and fuse the compound operations of the tasks: the relative
+rotation with its hemisphere fix, the projected gravity and the yaw.
+
+The kernels run on numpy by default, ``set_backend("numba")`` switches them to compiled Numba gufuncs.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+BACKENDS = ("numpy", "numba")
+
+# the compiled kernels of motrix_envs.math._rotation_numba, None for the numpy backend
+_numba = None
+
+_GRAVITY_DIRECTION = np.array([0.0, 0.0, -1.0], dtype=np.float32)
+
+
+def set_backend(name: str):
+    """
+    Select the implementation of the kernels, one of ``BACKENDS``
+
+    Raises:
+        ImportError: If the numba backend is selected without numba installed
+    """
+    global _numba
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown rotation backend {name!r}, expected one of {BACKENDS}")
+    if name == "numpy":
+        _numba = None
+    else:
+        from motrix_envs.math import _rotation_numba
+
+        _numba = _rotation_numba
+
+
+def get_backend() -> str:
+    return "numpy" if _numba is None else "numba"
+
+
+def _f32(x) -> np.ndarray:
+    return np.asarray(x, dtype=np.float32)
+
+
+def _output(out: Optional[np.ndarray], shape: tuple[int, ...]) -> np.ndarray:
+    if out is None:
+        return np.empty(shape, dtype=np.float32)
+    if out.shape != shape or out.dtype != np.float32:
+        raise ValueError(f"Expected a float32 output of shape {shape}, got {out.dtype} {out.shape}")
+    return out
+
+
+def _write(out: np.ndarray, *components: np.ndarray) -> np.ndarray:
+    # the components are computed before the first write, so that out may alias an input
+    for i, component in enumerate(components):
+        out[..., i] = component
+    return out
+
+
+def mul(q1, q2, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Product of two quaternions, (..., 4)
+    """
+    q1, q2 = _f32(q1), _f32(q2)
+    out = _output(out, np.broadcast_shapes(q1.shape, q2.shape))
+    if _numba is not None:
+        return _numba.mul(q1, q2, out)
+    x1, y1, z1, w1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    x2, y2, z2, w2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+    return _write(
+        out,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+    )
+
+
+def conjugate(q, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Conjugate (-x, -y, -z, w) of quaternions, the inverse of unit quaternions, (..., 4)
+    """
+    q = _f32(q)
+    out = _output(out, q.shape)
+    if _numba is not None:
+        return _numba.conjugate(q, out)
+    np.negative(q[..., :3], out=out[..., :3])
+    out[..., 3] = q[..., 3]
+    return out
+
+
+def relative(q_target, q_current, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Rotation from ``q_current`` to ``q_target``, ``q_target * conjugate(q_current)``, in the hemisphere w >= 0
+    so that the same rotation always has the same sign, (..., 4)
+    """
+    q_target, q_current = _f32(q_target), _f32(q_current)
+    out = _output(out, np.broadcast_shapes(q_target.shape, q_current.shape))
+    if _numba is not None:
+        return _numba.relative(q_target, q_current, out)
+    x1, y1, z1, w1 = q_target[..., 0], q_target[..., 1], q_target[..., 2], q_target[..., 3]
+    x2, y2, z2, w2 = q_current[..., 0], q_current[..., 1], q_current[..., 2], q_current[..., 3]
+    w = w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2
+    sign = np.where(w < 0.0, np.float32(-1.0), np.float32(1.0))
+    return _write(
+        out,
+        sign * (x1 * w2 - w1 * x2 - y1 * z2 + z1 * y2),
+        sign * (y1 * w2 - w1 * y2 + x1 * z2 - z1 * x2),
+        sign * (z1 * w2 - w1 * z2 - x1 * y2 + y1 * x2),
+        sign * w,
+    )
+
+
+def rotate(q, v, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Rotate the vectors ``v`` (..., 3) by the unit quaternions ``q`` (..., 4), (..., 3)
+    """
+    q, v = _f32(q), _f32(v)
+    out = _output(out, np.broadcast_shapes(q.shape[:-1], v.shape[:-1]) + (3,))
+    if _numba is not None:
+        return _numba.rotate(q, v, out)
+    return _rotate(q, v, 1.0, out)
+
+
+def rotate_inverse(q, v, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Rotate the vectors ``v`` (..., 3) by the inverse of the unit quaternions ``q`` (..., 4), (..., 3)
+    """
+    q, v = _f32(q), _f32(v)
+    out = _output(out, np.broadcast_shapes(q.shape[:-1], v.shape[:-1]) + (3,))
+    if _numba is not None:
+        return _numba.rotate_inverse(q, v, out)
+    return _rotate(q, v, -1.0, out)
+
+
+def _rotate(q: np.ndarray, v: np.ndarray, direction: float, out: np.ndarray) -> np.ndarray:
+    # v' = v +/- w t + u x t with t = 2 u x v, u the vector part of q
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    if direction < 0.0:
+        w = -w
+    vx, vy, vz = v[..., 0], v[..., 1], v[..., 2]
+    tx = 2.0 * (y * vz - z * vy)
+    ty = 2.0 * (z * vx - x * vz)
+    tz = 2.0 * (x * vy - y * vx)
+    return _write(
+        out,
+        vx + w * tx + (y * tz - z * ty),
+        vy + w * ty + (z * tx - x * tz),
+        vz + w * tz + (x * ty - y * tx),
+    )
+
+
+def projected_gravity(q, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    The gravity direction (0, 0, -1) in the frames of the unit quaternions ``q``, i.e.
+    ``rotate_inverse(q, [0, 0, -1])`` expanded for the constant vector, (..., 3)
+    """
+    q = _f32(q)
+    out = _output(out, q.shape[:-1] + (3,))
+    if _numba is not None:
+        return _numba.rotate_inverse(q, _GRAVITY_DIRECTION, out)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return _write(
+        out,
+        2.0 * (w * y - x * z),
+        -2.0 * (w * x + y * z),
+        2.0 * (x * x + y * y) - 1.0,
+    )
+
+
+def yaw(q, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    The yaw angle (z-axis rotation of the xyz Euler angles) of quaternions, (...)
+    """
+    q = _f32(q)
+    out = _output(out, q.shape[:-1])
+    if _numba is not None:
+        return _numba.yaw(q, out)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z), out=out)
+
+
+def similarity(q_current, q_target, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Cosine of the rotation angle between two unit quaternions, in [-1, 1], (...)
+
+    Equal to ``quaternion.similarity``, ``cos(2 * arccos(w))`` of the relative rotation, computed as
+    ``2 * w ** 2 - 1`` without the trigonometric round trip.
+    """
+    q_current, q_target = _f32(q_current), _f32(q_target)
+    out = _output(out, np.broadcast_shapes(q_current.shape, q_target.shape)[:-1])
+    if _numba is not None:
+        return _numba.similarity(q_current, q_target, out)
+    x1, y1, z1, w1 = q_target[..., 0], q_target[..., 1], q_target[..., 2], q_target[..., 3]
+    x2, y2, z2, w2 = q_current[..., 0], q_current[..., 1], q_current[..., 2], q_current[..., 3]
+    w = w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2
+    np.clip(w, -1.0, 1.0, out=w)
+    np.multiply(w, w, out=out)
+    out *= 2.0
+    out -= 1.0
+    return out
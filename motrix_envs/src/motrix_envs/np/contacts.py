@@ -0,0 +1,101 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import motrixsim as mtx
+import numpy as np
+
+
+class ContactService:
+    """
+    One batched contact query per step, shared by observation, termination and reward
+
+    Tasks register named tables of geom pairs at init. The first read after an invalidation runs a single
+    ``is_colliding`` over the concatenation of all registered pairs; every name is then served as a
+    ``(num_envs, num_pairs)`` boolean view of that result. ``NpEnv`` invalidates the service after
+    ``physics_step`` and after resetting done envs.
+    """
+
+    def __init__(self, model: mtx.SceneModel):
+        self._model = model
+        self._pairs = np.zeros((0, 2), dtype=np.uint32)
+        self._slices: dict[str, slice] = {}
+        self._data = None
+        self._result = None
+
+    def register(self, name: str, pairs: np.ndarray) -> slice:
+        """
+        Register a table of geom pairs to query every step
+
+        Args:
+            name (str): The name to read the result with
+            pairs (np.ndarray): Geom index pairs, shape (num_pairs, 2)
+
+        Returns:
+            slice: The columns of the name in the full contact table
+        """
+        if name in self._slices:
+            raise ValueError(f"Contact pairs {name} already registered")
+        pairs = np.asarray(pairs, dtype=np.uint32).reshape(-1, 2)
+        start = self._pairs.shape[0]
+        self._pairs = np.concatenate([self._pairs, pairs], axis=0)
+        self._slices[name] = slice(start, start + pairs.shape[0])
+        self.invalidate()
+        return self._slices[name]
+
+    @property
+    def pairs(self) -> np.ndarray:
+        """
+        The full table of registered geom pairs
+        """
+        return self._pairs
+
+    def num_pairs(self, name: str) -> int:
+        s = self._slices[name]
+        return s.stop - s.start
+
+    def invalidate(self):
+        """
+        Drop the cached query result
+        """
+        self._data = None
+        self._result = None
+
+    def query(self, data: mtx.SceneData) -> np.ndarray:
+        """
+        Get the collision state of all registered pairs, running the contact query at most once per step
+
+        Returns:
+            np.ndarray: bool array of shape (*data.shape, num_pairs)
+        """
+        if self._result is None or data is not self._data:
+            result = self._model.get_contact_query(data).is_colliding(self._pairs)
+            self._result = result.reshape((*data.shape, self._pairs.shape[0]))
+            self._data = data
+        return self._result
+
+    def get(self, name: str, data: mtx.SceneData) -> np.ndarray:
+        """
+        Get the collision state of the pairs registered as ``name``
+
+        Returns:
+            np.ndarray: bool view of shape (*data.shape, num_pairs)
+        """
+        return self.query(data)[..., self._slices[name]]
+
+    def any(self, name: str, data: mtx.SceneData, out: np.ndarray = None) -> np.ndarray:
+        """
+        Whether any of the pairs registered as ``name`` collides, per env
+        """
+        return np.any(self.get(name, data), axis=-1, out=out)
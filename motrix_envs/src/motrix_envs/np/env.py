@@ -15,12 +15,34 @@
 
 import abc
 import dataclasses
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Optional, Sequence, Union
 
 import motrixsim as mtx
 import numpy as np
 
 from motrix_envs.base import ABEnv, EnvCfg
+from motrix_envs.np import model_cache
+from motrix_envs.np.contacts import ContactService
+from motrix_envs.np.info import InfoField, InfoSchema, InfoStore
+from motrix_envs.np.profiler import StepProfiler
+from motrix_envs.np.rng import EnvRng
+from motrix_envs.np.sensors import SensorGroup
+from motrix_envs.np.step_view import StepView
+
+_BUFFER_FIELDS = ("obs", "reward", "terminated", "truncated")
+# methods timed by the step profiler, and their phase names
+_PROFILED_PHASES = {
+    "step": "step",
+    "init_state": "init_state",
+    "apply_action": "apply_action",
+    "physics_step": "physics_step",
+    "_physics_substep": "physics_step/substep",
+    "update_state": "update_state",
+    "_update_truncate": "update_truncate",
+    "_reset_done_envs": "reset_done_envs",
+}
 
 
 @dataclass
@@ -30,7 +52,7 @@ class NpEnvState:
     reward: np.ndarray
     terminated: np.ndarray
     truncated: np.ndarray
-    info: dict
+    info: Union[dict, InfoStore]
 
     @property
     def done(self) -> np.ndarray:
@@ -42,6 +64,23 @@ class NpEnvState:
     def replace(self, **updates) -> "NpEnvState":
         return dataclasses.replace(self, **updates)
 
+    def assign(self, **updates) -> "NpEnvState":
+        """
+        Write the given values into the existing state buffers in place.
+
+        Unlike ``replace``, the arrays held by the state keep their identity, so references taken
+        before the call observe the new values.
+
+        Args:
+            **updates: array field name (``obs``, ``reward``, ``terminated`` or ``truncated``) to new values.
+                Values are broadcast and cast to the dtype of the buffer.
+        """
+        for name, value in updates.items():
+            if name not in _BUFFER_FIELDS:
+                raise KeyError(f"{name} is not an array buffer of NpEnvState")
+            np.copyto(getattr(self, name), value, casting="unsafe")
+        return self
+
     def validate(self):
         num_envs = self.data.shape[0]
         assert self.reward.shape == (num_envs,), self.reward.shape
@@ -49,18 +88,50 @@ class NpEnvState:
         assert self.truncated.shape == (num_envs,), self.truncated.shape
 
 
+def _scatter_info(dst: dict, src: dict, index):
+    """
+    Write the info of the reset envs into the batch info, one vectorized assignment per key
+    """
+    for key, value in src.items():
+        if key not in dst:
+            dst[key] = value
+        elif isinstance(value, np.ndarray):
+            dst[key][index] = value
+        elif isinstance(value, dict):
+            assert isinstance(dst[key], dict)
+            _scatter_info(dst[key], value, index)
+
+
 class NpEnv(ABEnv):
     _model: mtx.SceneModel
     _cfg: EnvCfg
     _state: NpEnvState = None
     _render_spacing: float
+    # state holding the buffers allocated by init_state, used when cfg.inplace_state is enabled
+    _buffers: NpEnvState = None
+    _done: np.ndarray = None
+    # background thread and pending step of step_async, created on first use
+    _step_executor: ThreadPoolExecutor = None
+    _pending_step: Future = None
+    # task methods timed as update_state/<method> while the profiler is enabled
+    profile_methods: tuple[str, ...] = ()
+    _profiler: StepProfiler = None
+    # per-env random streams, owned by the workers of a ShardedNpEnv
+    _rng: EnvRng = None
 
     def __init__(self, cfg: EnvCfg, num_envs: int = 1):
         self._cfg = cfg
         self._num_envs = num_envs
-        self._model = mtx.load_model(cfg.model_file)
-        self._model.options.timestep = cfg.sim_dt
+        if cfg.cache_model:
+            self._model = model_cache.load_model(cfg.model_file, cfg.sim_dt)
+        else:
+            self._model = mtx.load_model(cfg.model_file)
+            self._model.options.timestep = cfg.sim_dt
         self._render_spacing = cfg.render_spacing
+        self._step_view = StepView()
+        self._contacts = ContactService(self._model)
+        self._rng = EnvRng(num_envs)
+        self._sensor_groups: dict[tuple[str, ...], SensorGroup] = {}
 
     @property
     def model(self) -> mtx.SceneModel:
@@ -90,10 +161,98 @@ class NpEnv(ABEnv):
         """
         return self._render_spacing
 
+    @property
+    def step_view(self) -> StepView:
+        """
+        Get the memoized scene data reads of the current step, invalidated by physics_step and reset
+        """
+        return self._step_view
+
+    @property
+    def contacts(self) -> ContactService:
+        """
+        Get the shared contact query service, invalidated by physics_step and reset
+        """
+        return self._contacts
+
+    def sensor_group(self, names: Sequence[str]) -> SensorGroup:
+        """
+        Register an ordered list of sensors read together, typically at init
+
+        Args:
+            names (Sequence[str]): The sensor names, in column order
+
+        Returns:
+            SensorGroup: The group, shared by the registrations of the same names
+        """
+        names = tuple(names)
+        group = self._sensor_groups.get(names)
+        if group is None:
+            group = self._sensor_groups[names] = SensorGroup(self._model, names)
+        return group
+
+    @property
+    def rng(self) -> EnvRng:
+        """
+        Get the per-env random streams, from which the tasks draw their resets and noise
+        """
+        return self._rng
+
+    def seed(self, seed: Optional[int] = None, env_offset: int = 0):
+        """
+        Restart the random streams of the envs from ``seed``
+
+        Args:
+            seed (Optional[int]): The seed, drawn from the global numpy random state if None
+            env_offset (int): Global id of the first env when this env is a shard of a larger batch
+        """
+        self._rng.seed(seed, env_offset)
+
+    def _detached_copy(self) -> "NpEnv":
+        """
+        A single-env instance of the task loading a scene model of its own, for work in a background thread
+        while this env steps its model, e.g. refilling a reset pool
+        """
+        return type(self)(dataclasses.replace(self._cfg, cache_model=False), num_envs=1)
+
     @property
     def num_envs(self) -> int:
         return self._num_envs
 
+    @property
+    def profiler(self) -> Optional[StepProfiler]:
+        """
+        Get the step profiler, None unless enabled by ``enable_profiler``
+        """
+        return self._profiler
+
+    def enable_profiler(self, profiler: Optional[StepProfiler] = None) -> StepProfiler:
+        """
+        Time every phase of ``step`` and the task methods listed in ``profile_methods``
+
+        Args:
+            profiler (Optional[StepProfiler]): The profiler to record into, a new one if None
+
+        Returns:
+            StepProfiler: The enabled profiler
+        """
+        self.disable_profiler()
+        profiler = profiler or StepProfiler()
+        # the wrappers shadow the methods on the instance, so that ``step`` runs the same code timed or not
+        phases = {**_PROFILED_PHASES, **{name: f"update_state/{name}" for name in self.profile_methods}}
+        for name, phase in phases.items():
+            setattr(self, name, profiler.wrap(phase, getattr(self, name)))
+        self._profiler = profiler
+        return profiler
+
+    def disable_profiler(self):
+        """
+        Stop profiling, ``step`` runs without any timing afterwards
+        """
+        for name in (*_PROFILED_PHASES, *self.profile_methods):
+            self.__dict__.pop(name, None)
+        self._profiler = None
+
     def init_state(self) -> NpEnvState:
         """
         Create a new environment state
@@ -102,9 +261,16 @@ class NpEnv(ABEnv):
         reward = np.zeros((self._num_envs,), dtype=np.float32)
         terminated = np.ones((self._num_envs,), dtype=bool)
         truncated = np.zeros((self._num_envs,), dtype=bool)
-        info = {"steps": np.zeros((self._num_envs,), dtype=np.uint64)}
+        schema = self._resolve_info_schema()
+        if schema is None:
+            info = {"steps": np.zeros((self._num_envs,), dtype=np.uint64)}
+        else:
+            info = schema.allocate(self._num_envs)
         data = mtx.SceneData(self._model, batch=[self._num_envs])
+        self._invalidate_step_caches()
         self._state = NpEnvState(data, obs, reward, terminated, truncated, info)
+        self._buffers = self._state
+        self._done = np.empty((self._num_envs,), dtype=bool)
         self._reset_done_envs()
         self._state.validate()
         return self._state
@@ -114,29 +280,31 @@ class NpEnv(ABEnv):
         Reset the environments that are done
         """
         state = self._state
-        done = state.done
-        assert done.shape == (self._num_envs,)
-        if not np.any(done):
+        done = np.logical_or(state.terminated, state.truncated, out=self._done)
+        env_ids = np.flatnonzero(done)
+        if env_ids.size == 0:
             return
 
-        np.putmask(state.info["steps"], done, 0)
-        data = state.data[done]
-        obs, info1 = self.reset(data)
-        state.obs[done] = obs
-        if info1:
-
-            def replace_dict_values(dst, new_values, mask):
-                for key, value in new_values.items():
-                    if key not in dst:
-                        dst[key] = value
-                    else:
-                        if isinstance(value, np.ndarray):
-                            dst[key][mask] = value
-                        elif isinstance(value, dict):
-                            assert isinstance(dst[key], dict)
-                            replace_dict_values(dst[key], value, mask)
-
-            replace_dict_values(state.info, info1, done)
+        if env_ids.size == self._num_envs:
+            # reset the whole batch in place, no gather/scatter needed
+            index = slice(None)
+            data = state.data
+        else:
+            index = env_ids
+            data = state.data[mtx.DisjointIndices(env_ids)]
+
+        state.info["steps"][index] = 0
+        # the reset data writes through to state.data
+        self._invalidate_step_caches()
+        self._rng.new_episode(index)
+        with self._rng.active(index):
+            obs, info1 = self.reset(data)
+        self._invalidate_step_caches()
+        state.obs[index] = obs
+        if isinstance(state.info, InfoStore):
+            state.info.reset(index, info1)
+        elif info1:
+            _scatter_info(state.info, info1, index)
 
     def _update_truncate(self):
         """
@@ -144,7 +312,77 @@ class NpEnv(ABEnv):
         """
         if not self._cfg.max_episode_steps:
             return
-        self._state.truncated = self._state.info["steps"] >= self._cfg.max_episode_steps
+        state = self._state
+        np.greater_equal(state.info["steps"], self._cfg.max_episode_steps, out=state.truncated)
+
+    def _restore_buffers(self, state: NpEnvState) -> NpEnvState:
+        """
+        Copy arrays that were rebound by the task back into the buffers allocated by ``init_state``
+
+        Tasks that write through ``out=`` or slices of the state buffers skip the copy entirely.
+
+        Args:
+            state (NpEnvState): The state returned by the task
+
+        Returns:
+            NpEnvState: The state owning the persistent buffers
+        """
+        buffers = self._buffers
+        for name in _BUFFER_FIELDS:
+            value = getattr(state, name)
+            buffer = getattr(buffers, name)
+            if value is not buffer:
+                np.copyto(buffer, value, casting="unsafe")
+        buffers.data = state.data
+        buffers.info = state.info
+        return buffers
+
+    def _bind_buffers(self, arrays: dict[str, np.ndarray], info: Optional[InfoStore] = None) -> NpEnvState:
+        """
+        Make externally allocated arrays, e.g. views of shared memory, the buffers of the current state
+
+        The current values are copied into the arrays. Combined with ``cfg.inplace_state``, every later step
+        writes into them.
+
+        Args:
+            arrays (dict[str, np.ndarray]): array field name to the array replacing its buffer
+            info (Optional[InfoStore]): A store of the same schema replacing ``state.info``
+
+        Returns:
+            NpEnvState: The state owning the new buffers
+        """
+        state = self._state
+        for name, array in arrays.items():
+            if name not in _BUFFER_FIELDS:
+                raise KeyError(f"{name} is not an array buffer of NpEnvState")
+            np.copyto(array, getattr(state, name), casting="unsafe")
+            setattr(state, name, array)
+        if info is not None:
+            for key in info:
+                info[key] = state.info[key]
+            state.info = info
+        self._buffers = state
+        return state
+
+    def _resolve_info_schema(self) -> Optional[InfoSchema]:
+        """
+        The schema of ``state.info`` including the ``steps`` field, or None for a plain dict info
+        """
+        schema = self.info_schema()
+        if schema is not None and "steps" not in schema:
+            schema = InfoSchema([InfoField("steps", dtype=np.uint64), *schema.fields])
+        return schema
+
+    def info_schema(self) -> Optional[InfoSchema]:
+        """
+        The schema of ``state.info``. When provided, the info is an ``InfoStore`` allocated once in
+        ``init_state`` and the info returned by ``reset`` is written into it field by field; fields missing
+        from it are reset to their default. A ``steps`` field is added if absent.
+
+        Returns:
+            Optional[InfoSchema]: The schema, or None to keep ``state.info`` a plain dict
+        """
+        return None
 
     @abc.abstractmethod
     def apply_action(self, actions: np.ndarray, state: NpEnvState) -> NpEnvState:
@@ -181,16 +419,40 @@ class NpEnv(ABEnv):
         """
         pass
 
+    def _invalidate_step_caches(self):
+        """
+        Drop the memoized scene data reads and contact results, called whenever the scene data changes
+        """
+        self._step_view.invalidate()
+        self._contacts.invalidate()
+
     def physics_step(self):
         # motrixsim.SceneModel.step only supports single step, so we loop
         for _ in range(self._cfg.sim_substeps):
-            self._model.step(self._state.data)
+            self._physics_substep()
+        self._invalidate_step_caches()
+
+    def _physics_substep(self):
+        self._model.step(self._state.data)
 
     def _prev_physics_step(self):
+        """
+        Prepare the arrays of the state for the step, into which the tasks write through ``out=``
+
+        With ``cfg.inplace_state`` they are the buffers of ``init_state``, cleared in place. Otherwise every step
+        gets new arrays, so that the arrays of a returned state are never overwritten by a later step, whatever
+        the task.
+        """
         state = self._state
-        state.reward.fill(0.0)
-        state.terminated.fill(False)
-        state.truncated.fill(False)
+        if self._cfg.inplace_state:
+            state.reward.fill(0.0)
+            state.terminated.fill(False)
+            state.truncated.fill(False)
+            return
+        state.obs = state.obs.copy()
+        state.reward = np.zeros_like(state.reward)
+        state.terminated = np.zeros_like(state.terminated)
+        state.truncated = np.zeros_like(state.truncated)
 
     def step(self, actions: np.ndarray) -> NpEnvState:
         if self._state is None:
@@ -201,7 +463,36 @@ class NpEnv(ABEnv):
         assert self._state is not None, "apply_action must return a valid NpEnvState"
         self.physics_step()
         self._state = self.update_state(self._state)
+        if self._cfg.inplace_state:
+            self._state = self._restore_buffers(self._state)
         self._state.info["steps"] += 1
         self._update_truncate()
         self._reset_done_envs()
         return self._state
+
+    def step_async(self, actions: np.ndarray):
+        """
+        Start stepping the envs in a background thread, e.g. to run the policy of another batch meanwhile
+
+        The actions and the state must not be modified until ``step_wait`` returns.
+
+        Args:
+            actions (np.ndarray): The actions to apply
+        """
+        if self._pending_step is not None:
+            raise RuntimeError("A step is already pending, call step_wait first")
+        if self._step_executor is None:
+            self._step_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="NpEnv.step")
+        self._pending_step = self._step_executor.submit(self.step, actions)
+
+    def step_wait(self) -> NpEnvState:
+        """
+        Wait for the step started by ``step_async``
+
+        Returns:
+            NpEnvState: The state after the step, as returned by ``step``
+        """
+        if self._pending_step is None:
+            raise RuntimeError("No step is pending, call step_async first")
+        future, self._pending_step = self._pending_step, None
+        return future.result()
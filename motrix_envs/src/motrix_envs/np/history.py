@@ -0,0 +1,156 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from collections.abc import Mapping
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from motrix_envs.np.info import InfoField
+
+Index = Union[slice, np.ndarray]
+
+
+class HistoryBuffer:
+    """
+    A per-env ring buffer of the last ``length`` values, e.g. for delayed actuation, action history, frame
+    stacking or observation latency
+
+    Every env has its own write head: ``push`` writes one slot per env instead of shifting the whole buffer like
+    ``np.roll``, and ``get`` gathers one slot per env at a per-env delay. Delay 0 is the latest value pushed.
+
+    The buffer wraps a ``values`` array of shape ``(num_envs, length, *shape)`` and a ``head`` array of shape
+    ``(num_envs,)`` without copying them, so both may be fields of the episode info, see ``fields`` and
+    ``from_info``: the history is then reset and shared like any other info field.
+
+    Usage:
+        history = HistoryBuffer.allocate(num_envs, 4, (action_dim,))
+        history.fill(actions)
+        history.push(actions)
+        delayed = history.get(delay_steps)
+    """
+
+    def __init__(self, values: np.ndarray, head: np.ndarray):
+        """
+        Args:
+            values: The storage, (num_envs, length, *shape)
+            head: The slot of the latest value of each env, (num_envs,)
+        """
+        if head.shape != values.shape[:1]:
+            raise ValueError(f"The head shape {head.shape} does not match the values shape {values.shape}")
+        self._values = values
+        self._head = head
+        self._rows = np.arange(values.shape[0])
+
+    @classmethod
+    def allocate(cls, num_envs: int, length: int, shape: tuple[int, ...] = (), dtype: Any = np.float32):
+        """
+        Allocate a zero-filled buffer
+        """
+        return cls(np.zeros((num_envs, length, *shape), dtype=dtype), np.zeros((num_envs,), dtype=np.int32))
+
+    @staticmethod
+    def fields(name: str, length: int, shape: tuple[int, ...] = (), dtype: Any = np.float32) -> list[InfoField]:
+        """
+        The info fields holding a buffer: ``name`` for the values and ``{name}_head`` for the write heads
+        """
+        return [InfoField(name, (length, *shape), dtype), InfoField(f"{name}_head", dtype=np.int32)]
+
+    @classmethod
+    def from_info(cls, info: Mapping, name: str) -> Optional["HistoryBuffer"]:
+        """
+        Wrap the buffer stored in ``info`` by ``fields``, None if the info does not hold it
+        """
+        values = info.get(name)
+        head = info.get(f"{name}_head")
+        if not isinstance(values, np.ndarray) or not isinstance(head, np.ndarray) or head.shape != values.shape[:1]:
+            return None
+        return cls(values, head)
+
+    def to_info(self, name: str) -> dict[str, np.ndarray]:
+        """
+        The info items of the buffer under ``name``, see ``fields``
+        """
+        return {name: self._values, f"{name}_head": self._head}
+
+    @property
+    def num_envs(self) -> int:
+        return self._values.shape[0]
+
+    @property
+    def length(self) -> int:
+        return self._values.shape[1]
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The storage, in slot order rather than latest first, see ``ordered``
+        """
+        return self._values
+
+    def push(self, value: np.ndarray):
+        """
+        Append one value per env, dropping the oldest one
+
+        Args:
+            value: (num_envs, *shape)
+        """
+        head = self._head
+        np.add(head, 1, out=head)
+        np.remainder(head, self.length, out=head)
+        self._values[self._rows, head] = value
+
+    def get(self, delay: Union[int, np.ndarray] = 0) -> np.ndarray:
+        """
+        Get the value pushed ``delay`` pushes ago, clipped to the oldest one kept
+
+        Args:
+            delay: A delay for all envs or one per env, (num_envs,)
+
+        Returns:
+            (num_envs, *shape)
+        """
+        slot = (self._head - np.minimum(delay, self.length - 1)) % self.length
+        return self._values[self._rows, slot]
+
+    def fill(self, value: np.ndarray, index: Index = slice(None)):
+        """
+        Set the whole history of the envs ``index`` to ``value``, e.g. on reset
+
+        Args:
+            value: One value per selected env, (num_selected, *shape)
+            index: The envs, an index array, a boolean mask or a slice
+        """
+        self._values[index] = np.expand_dims(value, 1)
+        self._head[index] = 0
+
+    def ordered(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the history latest first, e.g. to concatenate it to the observation
+
+        Args:
+            out: Optional C-contiguous (num_envs, length, *shape) or (num_envs, length * size) array to write into
+
+        Returns:
+            The history, (num_envs, length, *shape) or the shape of ``out``
+        """
+        num_envs, length = self._values.shape[:2]
+        slot = (self._head[:, None] - np.arange(length)) % length
+        flat = self._values.reshape(num_envs * length, -1)
+        rows = (self._rows * length)[:, None] + slot
+        if out is None:
+            return flat[rows].reshape(self._values.shape)
+        np.take(flat, rows, axis=0, out=out.reshape(num_envs, length, flat.shape[1]))
+        return out
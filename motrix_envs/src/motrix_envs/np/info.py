@@ -0,0 +1,163 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class InfoField:
+    """
+    A per-env array field of the episode info
+
+    The field is stored as one contiguous array of shape ``(num_envs, *shape)``.
+    """
+
+    name: str
+    shape: tuple[int, ...] = ()
+    dtype: Any = np.float32
+    # value written for the reset envs when the task does not provide one
+    default: Any = 0
+
+
+@dataclass(frozen=True)
+class InfoGroup:
+    """
+    A named group of fields, e.g. the per-term ``Reward`` values read by the trainers
+    """
+
+    name: str
+    fields: tuple[Union[InfoField, "InfoGroup"], ...]
+
+
+class InfoSchema:
+    """
+    The declared layout of an ``InfoStore``, built once per task
+    """
+
+    def __init__(self, fields: Sequence[Union[InfoField, InfoGroup]]):
+        self._fields = tuple(fields)
+        self._groups = {f.name: InfoSchema(f.fields) for f in self._fields if isinstance(f, InfoGroup)}
+        names = tuple(f.name for f in self._fields)
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicated info fields: {names}")
+        for name in names:
+            if not name.isidentifier() or name.startswith("_"):
+                raise ValueError(f"Invalid info field name: {name!r}")
+        self._names = frozenset(names)
+        self._store_cls = type("InfoStore", (InfoStore,), {"__slots__": names, "__module__": __name__})
+
+    @property
+    def fields(self) -> tuple[Union[InfoField, InfoGroup], ...]:
+        return self._fields
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def allocate(self, num_envs: int, empty: Callable[..., np.ndarray] = np.empty) -> "InfoStore":
+        """
+        Allocate a store with every field set to its default
+
+        Args:
+            num_envs (int): The number of envs
+            empty (Callable): Called as ``empty(shape, dtype)`` to get the uninitialized array of each field,
+                in schema order. Defaults to ``np.empty``.
+        """
+        store = self._store_cls.__new__(self._store_cls)
+        store._schema = self
+        for field in self._fields:
+            if isinstance(field, InfoGroup):
+                value = self._groups[field.name].allocate(num_envs, empty)
+            else:
+                value = empty((num_envs, *field.shape), field.dtype)
+                value.fill(field.default)
+            setattr(store, field.name, value)
+        return store
+
+
+class InfoStore(Mapping):
+    """
+    Struct-of-arrays episode info with a fixed schema
+
+    Fields are slots holding one contiguous array each, read as attributes (``info.grasped``) or, for
+    compatibility with dict-based code and the trainers, as items (``info["grasped"]``). Item assignment
+    copies into the existing array, so the arrays are never rebound; unknown keys raise ``KeyError``.
+    Groups are nested stores.
+
+    Create a store with ``InfoSchema.allocate``.
+    """
+
+    __slots__ = ("_schema",)
+    _schema: InfoSchema
+
+    def __getitem__(self, key: str):
+        if key not in self._schema:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        if key not in self._schema:
+            raise KeyError(f"{key} is not a field of the info schema")
+        current = getattr(self, key)
+        if isinstance(current, InfoStore):
+            for sub_key, sub_value in value.items():
+                current[sub_key] = sub_value
+        elif current is not value:
+            np.copyto(current, value, casting="unsafe")
+
+    def __contains__(self, key) -> bool:
+        return key in self._schema
+
+    def __iter__(self):
+        return (field.name for field in self._schema.fields)
+
+    def __len__(self) -> int:
+        return len(self._schema.fields)
+
+    def reset(self, index, values: Optional[Mapping] = None):
+        """
+        Reset the given envs in one vectorized assignment per field
+
+        Args:
+            index: The envs to reset, an index array, a boolean mask or a slice
+            values (Optional[Mapping]): Values of the reset envs, keyed by field name. Fields without a value
+                are set to their default.
+        """
+        for field in self._schema.fields:
+            value = None if values is None else values.get(field.name)
+            if isinstance(field, InfoGroup):
+                getattr(self, field.name).reset(index, value)
+            else:
+                getattr(self, field.name)[index] = field.default if value is None else value
+
+    def snapshot(self) -> "InfoStore":
+        """
+        Copy the store, e.g. to keep the info of a step while the env keeps running
+        """
+        store = self.__class__.__new__(self.__class__)
+        store._schema = self._schema
+        for field in self._schema.fields:
+            value = getattr(self, field.name)
+            setattr(store, field.name, value.snapshot() if isinstance(value, InfoStore) else value.copy())
+        return store
+
+    def to_dict(self) -> dict:
+        """
+        Get the fields as a nested dict of arrays, without copy
+        """
+        return {key: value.to_dict() if isinstance(value, InfoStore) else value for key, value in self.items()}
@@ -0,0 +1,126 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Optional, Sequence
+
+import motrixsim as mtx
+import numpy as np
+
+from motrix_envs.math import quaternion
+
+VELOCITY_MODES = ("sim", "finite_difference")
+
+
+class LinkStateReader:
+    """
+    Batched reads of the world pose and 6D velocity of a list of links
+
+    ``read`` fills one ``(batch, links, 13)`` array ``[x, y, z, qx, qy, qz, qw, vx, vy, vz, wx, wy, wz]``, reused
+    across calls, the poses being gathered from a single ``get_link_poses`` read. The velocities depend on
+    ``velocity``:
+
+    - ``"sim"``: the exact velocities of the simulator, from ``model.get_link_velocities`` when it provides one,
+      read link by link otherwise.
+    - ``"finite_difference"``: differentiated from the poses of the previous read in one vectorized pass, lagging
+      half a control step. They are zero for the envs restarted since the previous read and for the reads of a
+      sub batch, such as the ones of ``reset``.
+    """
+
+    def __init__(self, model: mtx.SceneModel, link_ids: Sequence[int], dt: float, velocity: str = "sim"):
+        """
+        Args:
+            model: The scene model
+            link_ids: The indices of the links, in output order
+            dt: The time between two reads, for finite differences
+            velocity: How the velocities are obtained, one of ``VELOCITY_MODES``
+        """
+        if velocity not in VELOCITY_MODES:
+            raise ValueError(f"Unknown link velocity mode {velocity!r}, expected one of {VELOCITY_MODES}")
+        self._model = model
+        self._link_ids = np.asarray(link_ids, dtype=np.intp).reshape(-1)
+        self._links = [model.get_link(int(link_id)) for link_id in self._link_ids]
+        self._dt = float(dt)
+        self._velocity = velocity
+        self._out: Optional[np.ndarray] = None
+        self._prev_poses: Optional[np.ndarray] = None
+
+    @property
+    def num_links(self) -> int:
+        return self._link_ids.shape[0]
+
+    def read(
+        self, data: mtx.SceneData, out: Optional[np.ndarray] = None, restart: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Read the states of the links
+
+        Args:
+            data: The scene data
+            out: The (batch, links, 13) array to fill. Defaults to an array owned by the reader, overwritten by
+                the next read.
+            restart: Mask of the envs restarted since the previous read, whose poses are not differentiated but
+                start the next differences. ``reset`` reads pass all True, so that a reset of the full batch
+                does not differentiate across it.
+
+        Returns:
+            The (batch, links, 13) states
+        """
+        batch = data.shape[0]
+        if out is None:
+            if self._out is None or self._out.shape[0] != batch:
+                self._out = np.empty((batch, self.num_links, 13), dtype=np.float32)
+            out = self._out
+        out[..., :7] = self._model.get_link_poses(data)[:, self._link_ids]
+        if self._velocity == "sim":
+            self._read_velocities(data, out[..., 7:])
+        else:
+            self._differentiate(out, restart)
+        return out
+
+    def _read_velocities(self, data: mtx.SceneData, out: np.ndarray):
+        read_all = getattr(self._model, "get_link_velocities", None)
+        if read_all is not None:
+            out[:] = read_all(data)[:, self._link_ids]
+            return
+        for j, link in enumerate(self._links):
+            out[:, j, :3] = link.get_linear_velocity(data)
+            out[:, j, 3:] = link.get_angular_velocity(data)
+
+    def _differentiate(self, out: np.ndarray, restart: Optional[np.ndarray]):
+        poses = out[..., :7]
+        prev = self._prev_poses
+        if prev is None or prev.shape[0] < poses.shape[0]:
+            # the first read of the full batch, the largest one read
+            self._prev_poses = poses.copy()
+            out[..., 7:] = 0.0
+            return
+        if prev.shape[0] != poses.shape[0]:
+            # a sub batch, whose envs are unknown
+            out[..., 7:] = 0.0
+            return
+
+        inv_dt = 1.0 / self._dt
+        np.subtract(poses[..., :3], prev[..., :3], out=out[..., 7:10])
+        out[..., 7:10] *= inv_dt
+        # rotation from the previous pose, as a rotation vector over dt
+        delta = quaternion.mul(poses[..., 3:], quaternion.conjugate(prev[..., 3:]))
+        delta *= np.where(delta[..., 3:] < 0.0, -1.0, 1.0).astype(delta.dtype)
+        sin_half = np.linalg.norm(delta[..., :3], axis=-1, keepdims=True)
+        angle = 2.0 * np.arctan2(sin_half, delta[..., 3:])
+        scale = np.divide(angle, sin_half, out=np.full_like(angle, 2.0), where=sin_half > 1e-8)
+        out[..., 10:] = delta[..., :3] * (scale * inv_dt)
+        if restart is not None:
+            out[restart, :, 7:] = 0.0
+        prev[:] = poses
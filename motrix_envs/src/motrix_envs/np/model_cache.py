@@ -0,0 +1,62 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import functools
+import os
+
+import motrixsim as mtx
+
+MAX_CACHED_MODELS = 16
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_MODELS)
+def _load_model(path: str, mtime_ns: int, sim_dt: float) -> mtx.SceneModel:
+    model = mtx.load_model(path)
+    model.options.timestep = sim_dt
+    return model
+
+
+def load_model(model_file: str, sim_dt: float) -> mtx.SceneModel:
+    """
+    Load a scene model with the given simulation timestep, parsing the file only once per process
+
+    Models are kept in an LRU cache keyed by the file path, its modification time and ``sim_dt``, so the envs
+    created from the same file share one model; it must not be modified afterwards. Files referenced by the
+    model file, such as meshes and heightmaps, are not part of the key: call ``clear_model_cache`` after
+    changing them in a running process.
+
+    Args:
+        model_file: The path of the model file
+        sim_dt: The simulation timestep of the model
+
+    Returns:
+        The scene model
+    """
+    path = os.path.abspath(model_file)
+    return _load_model(path, os.stat(path).st_mtime_ns, float(sim_dt))
+
+
+def clear_model_cache():
+    """
+    Drop all the cached scene models
+    """
+    _load_model.cache_clear()
+
+
+def model_cache_info() -> functools._CacheInfo:
+    """
+    Get the hits, misses and size of the scene model cache
+    """
+    return _load_model.cache_info()
@@ -0,0 +1,174 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import gymnasium as gym
+import numpy as np
+
+ArrayOrScalar = Union[float, np.ndarray]
+
+
+@dataclass
+class ObsTerm:
+    """
+    A named term of an observation vector
+
+    The value written into the observation is ``(value - offset) * scale``.
+    """
+
+    name: str
+    size: int
+    scale: ArrayOrScalar = 1.0
+    offset: Optional[ArrayOrScalar] = None
+
+
+class ObsSpec:
+    """
+    Declarative layout of a flat float32 observation
+
+    The layout is computed once from the ordered terms; each term is then written straight into its
+    slice of the observation buffer, avoiding the temporaries of ``np.hstack``/``np.concatenate``.
+
+    Example:
+        spec = ObsSpec([ObsTerm("linvel", 3, scale=2.0), ObsTerm("dof_pos", 12, offset=default_angles)])
+        spec.build(out=state.obs, linvel=linvel, dof_pos=dof_pos)
+    """
+
+    def __init__(self, terms: Sequence[ObsTerm]):
+        self._terms = tuple(terms)
+        self._slices = {}
+        self._scales = {}
+        self._offsets = {}
+        start = 0
+        for term in self._terms:
+            if term.name in self._slices:
+                raise ValueError(f"Duplicated observation term: {term.name}")
+            if term.size <= 0:
+                raise ValueError(f"Observation term {term.name} must have a positive size, got {term.size}")
+            self._slices[term.name] = slice(start, start + term.size)
+            self._scales[term.name] = self._as_param(term.scale, term.size, default=1.0)
+            self._offsets[term.name] = self._as_param(term.offset, term.size, default=0.0)
+            start += term.size
+        self._size = start
+
+    @staticmethod
+    def _as_param(value, size: int, default: float):
+        """
+        Returns None when the parameter is a no-op, so the hot path can skip the ufunc
+        """
+        if value is None:
+            return None
+        value = np.asarray(value, dtype=np.float32)
+        if value.ndim == 0:
+            return None if value == default else value
+        assert value.shape == (size,), f"expected shape ({size},), got {value.shape}"
+        if np.all(value == default):
+            return None
+        return value
+
+    @property
+    def size(self) -> int:
+        """
+        The total dimension of the observation
+        """
+        return self._size
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """
+        The term names, in layout order
+        """
+        return tuple(term.name for term in self._terms)
+
+    @property
+    def slices(self) -> dict[str, slice]:
+        """
+        The slice of each term in the observation vector
+        """
+        return dict(self._slices)
+
+    def observation_space(self, low: float = -np.inf, high: float = np.inf) -> gym.spaces.Box:
+        return gym.spaces.Box(low, high, (self._size,), dtype=np.float32)
+
+    def allocate(self, num_envs: int) -> np.ndarray:
+        """
+        Allocate an observation buffer for ``num_envs`` environments
+        """
+        return np.zeros((num_envs, self._size), dtype=np.float32)
+
+    def write(self, out: np.ndarray, name: str, value: ArrayOrScalar) -> np.ndarray:
+        """
+        Write a single term into its slice of ``out``
+
+        Args:
+            out (np.ndarray): The observation buffer, shape (num_envs, size)
+            name (str): The term name
+            value (ArrayOrScalar): The raw term value. Shapes (num_envs,) and (num_envs, ...) are
+                reshaped to the term slice.
+
+        Returns:
+            np.ndarray: The view of ``out`` holding the term
+        """
+        view = out[..., self._slices[name]]
+        value = np.asarray(value)
+        if value.ndim not in (0, view.ndim):
+            value = value.reshape(view.shape)
+        offset = self._offsets[name]
+        scale = self._scales[name]
+        if offset is not None:
+            np.subtract(value, offset, out=view, casting="unsafe")
+            value = view
+        if scale is not None:
+            np.multiply(value, scale, out=view, casting="unsafe")
+        elif offset is None:
+            np.copyto(view, value, casting="unsafe")
+        return view
+
+    def build(self, out: Optional[np.ndarray] = None, **values: ArrayOrScalar) -> np.ndarray:
+        """
+        Write every term into ``out``
+
+        Args:
+            out (Optional[np.ndarray]): The observation buffer. If None, a new buffer is allocated with the
+                batch size of the first term.
+            **values: The raw value of each term, keyed by term name. All terms must be given.
+
+        Returns:
+            np.ndarray: The observation buffer
+        """
+        if values.keys() != self._slices.keys():
+            missing = self._slices.keys() - values.keys()
+            unknown = values.keys() - self._slices.keys()
+            raise KeyError(f"Observation terms mismatch, missing: {sorted(missing)}, unknown: {sorted(unknown)}")
+        if out is None:
+            first = np.asarray(values[self._terms[0].name])
+            out = self.allocate(first.shape[0])
+        for term in self._terms:
+            self.write(out, term.name, values[term.name])
+        return out
+
+    def view(self, obs: np.ndarray, name: str) -> np.ndarray:
+        """
+        Get the view of a term in ``obs``
+        """
+        return obs[..., self._slices[name]]
+
+    def split(self, obs: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Split ``obs`` into per-term views, handy for debugging and normalization statistics
+        """
+        return {name: obs[..., s] for name, s in self._slices.items()}
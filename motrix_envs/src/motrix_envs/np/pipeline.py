@@ -0,0 +1,69 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Callable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from motrix_envs.np.env import NpEnv, NpEnvState
+
+
+def double_buffered(
+    envs: Sequence[NpEnv], policy: Callable[[np.ndarray], np.ndarray], num_steps: Optional[int] = None
+) -> Iterator[tuple[int, NpEnvState]]:
+    """
+    Step two half batches alternately, running the policy of one half while the other one simulates
+
+    Each env sees the same sequence of observations and actions as with a serial loop, only the policy
+    latency is hidden behind the physics of the other half.
+
+    Usage:
+        envs = [registry.make(name, num_envs=num_envs // 2) for _ in range(2)]
+        for index, state in double_buffered(envs, policy):
+            ...
+
+    Args:
+        envs: The two half batches, stepped with ``step_async``/``step_wait``
+        policy: Maps the observations of a half batch to its actions
+        num_steps: Number of steps of each half batch, or None to run until the caller stops iterating
+
+    Yields:
+        tuple[int, NpEnvState]: The index of the half batch that just stepped and its state
+    """
+    if len(envs) != 2:
+        raise ValueError(f"Expected two half batches, got {len(envs)}")
+    states = [env.init_state() for env in envs]
+    counts = [0, 0]
+    pending = None
+    try:
+        if num_steps != 0:
+            envs[0].step_async(policy(states[0].obs))
+            pending = 0
+        while pending is not None:
+            current, other = pending, 1 - pending
+            actions = None
+            if num_steps is None or counts[other] < num_steps:
+                actions = policy(states[other].obs)
+            states[current] = envs[current].step_wait()
+            pending = None
+            counts[current] += 1
+            yield current, states[current]
+            if actions is not None:
+                envs[other].step_async(actions)
+                pending = other
+    finally:
+        # leave no step running when the caller stops early
+        if pending is not None:
+            envs[pending].step_wait()
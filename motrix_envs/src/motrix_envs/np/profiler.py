@@ -0,0 +1,153 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import functools
+import json
+import time
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+
+class _Phase:
+    """
+    Durations of one phase, the last ``window`` kept in a ring buffer
+    """
+
+    __slots__ = ("samples", "count", "total")
+
+    def __init__(self, window: int):
+        self.samples = np.zeros((window,), dtype=np.int64)
+        self.count = 0
+        self.total = 0
+
+    def add(self, duration: int):
+        self.samples[self.count % self.samples.shape[0]] = duration
+        self.count += 1
+        self.total += duration
+
+    def window(self) -> np.ndarray:
+        return self.samples[: min(self.count, self.samples.shape[0])]
+
+
+class StepProfiler:
+    """
+    Phase-level timings of ``NpEnv.step``, enabled with ``NpEnv.enable_profiler``
+
+    Phases are named by path: ``step``, ``init_state``, ``apply_action``, ``physics_step``, ``physics_step/substep``,
+    ``update_state``, ``update_state/<method>`` for the task methods listed in ``NpEnv.profile_methods``,
+    ``update_truncate`` and ``reset_done_envs``. The statistics are computed over the last ``window``
+    samples of each phase, the totals over every sample.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._window = window
+        self._phases: dict[str, _Phase] = {}
+
+    def record(self, name: str, start: int) -> int:
+        """
+        Record the time elapsed since ``start``, a ``time.perf_counter_ns`` value
+
+        Returns:
+            int: The current ``time.perf_counter_ns`` value, to chain consecutive phases
+        """
+        now = time.perf_counter_ns()
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Phase(self._window)
+        phase.add(now - start)
+        return now
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """
+        Wrap ``fn`` so that every call is recorded as phase ``name``
+        """
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.record(name, start)
+
+        return timed
+
+    def reset(self):
+        """
+        Drop every recorded sample
+        """
+        self._phases.clear()
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._phases)
+
+    def histogram(self, name: str, bins: int = 20) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram of the durations of a phase over the window, edges in milliseconds
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The counts and the bin edges, as ``np.histogram``
+        """
+        return np.histogram(self._phases[name].window() * 1e-6, bins=bins)
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """
+        Statistics of every phase, durations in milliseconds
+
+        ``share`` is the fraction of the total ``step`` time spent in the phase.
+        """
+        step = self._phases.get("step")
+        step_total = step.total if step is not None else 0
+        result = {}
+        for name, phase in self._phases.items():
+            samples = phase.window() * 1e-6
+            p50, p99 = np.percentile(samples, [50, 99])
+            result[name] = {
+                "count": phase.count,
+                "total_ms": phase.total * 1e-6,
+                "mean_ms": float(samples.mean()),
+                "p50_ms": float(p50),
+                "p99_ms": float(p99),
+                "max_ms": float(samples.max()),
+                "share": phase.total / step_total if step_total else float("nan"),
+            }
+        return result
+
+    def to_json(self, path: Optional[str] = None, **kwargs) -> str:
+        """
+        Serialize ``to_dict`` as JSON, written to ``path`` if given
+
+        Args:
+            path: The file to write
+            **kwargs: Passed to ``json.dumps``
+        """
+        text = json.dumps(self.to_dict(), **kwargs)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def write_tensorboard(self, writer: Any, global_step: int, prefix: str = "Profiler"):
+        """
+        Write the statistics to a tensorboard writer
+
+        Works with any writer exposing ``add_scalar(tag, value, global_step)``, such as the
+        ``SummaryWriter`` of the skrl agents (``agent.writer``) and of the rsl_rl runners (``runner.writer``).
+        """
+        for name, stats in self.to_dict().items():
+            for key in ("mean_ms", "p50_ms", "p99_ms", "share"):
+                writer.add_scalar(f"{prefix} / {name} ({key})", stats[key], global_step)
@@ -0,0 +1,184 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+import motrixsim as mtx
+import numpy as np
+
+from motrix_envs.np.rng import EnvRng
+
+GenerateFn = Callable[[mtx.SceneData, EnvRng], Dict[str, np.ndarray]]
+
+
+class ResetPool:
+    """
+    A pool of precomputed initial states, copied in by ``reset`` instead of running an expensive initialization
+
+    ``generate(data, rng)`` initializes a fresh batch of scene data in place, e.g. randomizing and settling it while
+    drawing from ``rng``, and returns the arrays to restore the states from, one row per env. The pool keeps
+    ``size`` such states and ``sample`` hands out the least used fresh ones. A state serves at most ``max_uses``
+    resets, after which it is stale: the stale states are regenerated in a background thread once a quarter of the
+    pool is stale, and synchronously when a sample would run short.
+
+    With ``max_uses=1`` every reset still gets a state of its own and the initialization only moves off the reset
+    path; larger values trade the diversity of the initial states for throughput. The states handed out by a pool
+    refilled in the background depend on the timing of the refills, set ``refill_async=False`` for reproducible
+    runs. A background refill runs ``generate`` concurrently with the owner of the pool: with
+    ``refill_async=True``, ``model`` and ``generate`` must not use a scene model stepped elsewhere meanwhile,
+    e.g. they come from ``NpEnv._detached_copy``.
+
+    Usage:
+        pool = ResetPool(model, generate, size=256)
+        if num <= pool.size:
+            states = pool.sample(num)
+    """
+
+    def __init__(
+        self,
+        model: mtx.SceneModel,
+        generate: GenerateFn,
+        size: int,
+        max_uses: int = 1,
+        refill_async: bool = True,
+        rng: Optional[EnvRng] = None,
+    ):
+        """
+        Fill the pool
+
+        Args:
+            model: The scene model of the generated scene data
+            generate: Initializes a batch of scene data in place and returns the arrays of its states
+            size: Number of states kept by the pool
+            max_uses: Number of resets a state serves before it is regenerated
+            refill_async: Regenerate the stale states in a background thread
+            rng: The streams of the pool slots, one env per slot, e.g. ``NpEnv.rng.derive(size)``
+        """
+        if size <= 0:
+            raise ValueError(f"The reset pool size must be positive, got {size}")
+        if max_uses <= 0:
+            raise ValueError(f"The reset pool max_uses must be positive, got {max_uses}")
+        if rng is not None and rng.num_active != size:
+            raise ValueError(f"The reset pool rng must have one env per slot, got {rng.num_active} for {size}")
+        self._model = model
+        self._generate = generate
+        self._size = size
+        self._max_uses = max_uses
+        self._refill_async = refill_async
+        self._rng = rng if rng is not None else EnvRng(size)
+        self._states: Dict[str, np.ndarray] = {}
+        self._uses = np.zeros(size, dtype=np.int64)
+        self._refilling = np.zeros(size, dtype=bool)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Future] = None
+        self._fill(np.arange(size))
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def num_fresh(self) -> int:
+        """
+        Number of states that can be sampled without waiting for a refill
+        """
+        with self._lock:
+            return int(np.count_nonzero((self._uses < self._max_uses) & ~self._refilling))
+
+    def sample(self, num: int) -> Dict[str, np.ndarray]:
+        """
+        Take ``num`` states, at most ``size``
+
+        Args:
+            num: Number of states
+
+        Returns:
+            The arrays returned by ``generate``, one row per state
+        """
+        if num > self._size:
+            raise ValueError(f"Cannot sample {num} states from a reset pool of {self._size}")
+        picked = self._take(num)
+        if picked.size < num:
+            self._wait()
+            picked = np.concatenate([picked, self._take(num - picked.size)])
+        if picked.size < num:
+            self._fill(np.setdiff1d(np.flatnonzero(self._uses >= self._max_uses), picked))
+            picked = np.concatenate([picked, self._take(num - picked.size)])
+        with self._lock:
+            states = {name: values[picked] for name, values in self._states.items()}
+        self._maybe_refill()
+        return states
+
+    def close(self):
+        """
+        Wait for the pending refill and stop the background thread
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._pending = None
+
+    def _take(self, num: int) -> np.ndarray:
+        with self._lock:
+            fresh = np.flatnonzero((self._uses < self._max_uses) & ~self._refilling)
+            picked = fresh[np.argsort(self._uses[fresh], kind="stable")[:num]]
+            self._uses[picked] += 1
+        return picked
+
+    def _fill(self, slots: np.ndarray):
+        """
+        Generate the states of the pool slots ``slots``
+        """
+        if slots.size == 0:
+            return
+        data = mtx.SceneData(self._model, batch=[slots.size])
+        self._rng.new_episode(slots)
+        with self._rng.active(slots):
+            states = self._generate(data, self._rng)
+        with self._lock:
+            for name, values in states.items():
+                if name not in self._states:
+                    self._states[name] = np.empty((self._size, *values.shape[1:]), dtype=values.dtype)
+                self._states[name][slots] = values
+            self._uses[slots] = 0
+            self._refilling[slots] = False
+
+    def _wait(self):
+        """
+        Wait for the pending refill, raising its error if it failed
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.result()
+
+    def _maybe_refill(self):
+        if self._pending is not None:
+            if not self._pending.done():
+                return
+            self._wait()
+        with self._lock:
+            stale = np.flatnonzero((self._uses >= self._max_uses) & ~self._refilling)
+            if stale.size < max(self._size // 4, 1):
+                return
+            self._refilling[stale] = True
+        if not self._refill_async:
+            self._fill(stale)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ResetPool.refill")
+        self._pending = self._executor.submit(self._fill, stale)
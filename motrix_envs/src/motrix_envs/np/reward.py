@@ -13,6 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 
+from typing import Callable, Mapping
+
 import numpy as np
 
 _DEFAULT_VALUE_AT_MARGIN = 0.1
@@ -81,3 +83,75 @@ def tolerance(
         value = np.where(in_bounds, 1.0, _sigmoids(d, value_at_margin, sigmoid))
 
     return value
+
+
+class RewardPlan:
+    """
+    A weighted sum of reward terms, compiled once at env construction
+
+    Terms whose scale is zero are dropped, the remaining scales are bound to their terms and every term
+    is accumulated into the caller's reward buffer. Per-term values are kept only when ``log_terms`` is
+    enabled.
+
+    Args:
+        terms (Mapping[str, Callable[..., np.ndarray]]): term name to a function computing the unscaled term.
+            All functions receive the arguments given to ``compute``.
+        scales (Mapping[str, float]): term name to scale. Terms without scale are dropped as well.
+        log_terms (bool): Whether to keep the scaled value of each term, see ``values``.
+    """
+
+    def __init__(
+        self,
+        terms: Mapping[str, Callable[..., np.ndarray]],
+        scales: Mapping[str, float],
+        log_terms: bool = False,
+    ):
+        self._plan = tuple((name, term, float(scales[name])) for name, term in terms.items() if scales.get(name, 0.0))
+        self._log_terms = log_terms
+        self._values: dict[str, np.ndarray] = {}
+        self._scratch = None
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """
+        The names of the terms that are computed
+        """
+        return tuple(name for name, _, _ in self._plan)
+
+    @property
+    def log_terms(self) -> bool:
+        return self._log_terms
+
+    @property
+    def values(self) -> dict[str, np.ndarray]:
+        """
+        The scaled value of each term from the last ``compute``, empty unless ``log_terms`` is enabled
+        """
+        return self._values
+
+    def compute(self, *args, out: np.ndarray) -> np.ndarray:
+        """
+        Compute the weighted sum of all terms into ``out``
+
+        Args:
+            *args: Forwarded to every term function
+            out (np.ndarray): The reward buffer, overwritten
+
+        Returns:
+            np.ndarray: ``out``
+        """
+        out.fill(0.0)
+        if self._log_terms:
+            values = self._values
+            for name, term, scale in self._plan:
+                value = values[name] = term(*args) * scale
+                out += value
+            return out
+
+        scratch = self._scratch
+        if scratch is None or scratch.shape != out.shape:
+            scratch = self._scratch = np.empty_like(out)
+        for _, term, scale in self._plan:
+            np.multiply(term(*args), scale, out=scratch, casting="unsafe")
+            out += scratch
+        return out
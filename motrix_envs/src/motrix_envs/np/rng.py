@@ -0,0 +1,276 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import contextlib
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+Index = Union[slice, np.ndarray]
+
+# Philox4x32-10 constants, see Salmon et al., "Parallel random numbers: as easy as 1, 2, 3"
+_PHILOX_M0 = np.uint64(0xD2511F53)
+_PHILOX_M1 = np.uint64(0xCD9E8D57)
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_PHILOX_ROUNDS = 10
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+
+# SplitMix64 constants, see Steele et al., "Fast splittable pseudorandom number generators"
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_M0 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_M1 = np.uint64(0x94D049BB133111EB)
+
+
+def philox4x32(counter: np.ndarray, key: tuple[int, int]) -> np.ndarray:
+    """
+    The Philox4x32-10 bijection of ``counter`` under ``key``
+
+    Args:
+        counter: (..., 4) 32-bit counter words
+        key: The two 32-bit key words
+
+    Returns:
+        (..., 4) uint32 random words
+    """
+    c0, c1, c2, c3 = np.moveaxis(counter.astype(np.uint64), -1, 0)
+    k0, k1 = int(key[0]), int(key[1])
+    for _ in range(_PHILOX_ROUNDS):
+        p0 = _PHILOX_M0 * c0
+        p1 = _PHILOX_M1 * c2
+        c0, c1, c2, c3 = (
+            (p1 >> _SHIFT32) ^ c1 ^ np.uint64(k0),
+            p1 & _MASK32,
+            (p0 >> _SHIFT32) ^ c3 ^ np.uint64(k1),
+            p0 & _MASK32,
+        )
+        k0 = (k0 + _PHILOX_W0) & 0xFFFFFFFF
+        k1 = (k1 + _PHILOX_W1) & 0xFFFFFFFF
+    return np.stack((c0, c1, c2, c3), axis=-1).astype(np.uint32)
+
+
+def _splitmix64(words: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+    """
+    The SplitMix64 output function of uint64 ``words``, in place, with a ``scratch`` array of the same shape
+    """
+    for shift, multiplier in ((30, _SPLITMIX_M0), (27, _SPLITMIX_M1)):
+        np.right_shift(words, np.uint64(shift), out=scratch)
+        words ^= scratch
+        words *= multiplier
+    np.right_shift(words, np.uint64(31), out=scratch)
+    words ^= scratch
+    return words
+
+
+def _num_values(size: tuple[int, ...]) -> int:
+    return int(np.prod(size[1:], dtype=np.int64))
+
+
+class EnvRng:
+    """
+    Per-env counter-based random streams
+
+    Every env has its own stream, the Philox4x32-10 hash of its global env id under a key derived from the seed.
+    Each episode of an env splits a SplitMix64 sequence off the stream, and value ``i`` of the ``draw``-th draw of
+    the episode is the element (draw, i) of the sequence. Philox only runs when seeding, a draw is a few in-place
+    passes over its values. The values an env gets therefore depend only on the seed, its global env id and its
+    own history: the same in a single process, in the shards of ``ShardedNpEnv`` and whatever the other envs do.
+
+    A draw returns one row per active env, all the envs except while ``NpEnv`` resets the done ones, so that a
+    task's ``reset`` draws for exactly the envs it resets. ``low``/``high``/``loc``/``scale`` broadcast against
+    the trailing dimensions, so several noise terms with different ranges are drawn in a single call.
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None, env_offset: int = 0):
+        """
+        Args:
+            num_envs: Number of envs
+            seed: The seed, drawn from the global numpy random state if None
+            env_offset: Global id of the first env, e.g. of a shard of a larger batch
+        """
+        self._num_envs = num_envs
+        self._episodes = np.zeros(num_envs, dtype=np.uint32)
+        self._draws = np.zeros(num_envs, dtype=np.uint32)
+        self._episode_seeds = np.zeros(num_envs, dtype=np.uint64)
+        self._active: Index = slice(None)
+        self._scratch = np.empty(0, dtype=np.uint64)
+        self.seed(seed, env_offset)
+
+    def seed(self, seed: Optional[int] = None, env_offset: int = 0):
+        """
+        Restart all the streams from ``seed``
+
+        Args:
+            seed: The seed, drawn from the global numpy random state if None
+            env_offset: Global id of the first env, e.g. of a shard of a larger batch
+        """
+        if seed is None:
+            seed = int(np.random.randint(0, 2**63, dtype=np.int64))
+        self._set_key(tuple(int(word) for word in np.random.SeedSequence(seed).generate_state(2)), env_offset)
+
+    def _set_key(self, key: tuple[int, int], env_offset: int = 0):
+        self._key = key
+        self._env_ids = np.arange(env_offset, env_offset + self._num_envs, dtype=np.uint32)
+        counter = np.zeros((self._num_envs, 4), dtype=np.uint32)
+        counter[:, 3] = self._env_ids
+        block = philox4x32(counter, key).astype(np.uint64)
+        self._env_streams = (block[:, 0] << _SHIFT32) | block[:, 1]
+        self._episodes[:] = 0
+        self._draws[:] = 0
+        self._split_episodes(slice(None))
+
+    def _split_episodes(self, index: Index):
+        seeds = self._env_streams[index] + self._episodes[index].astype(np.uint64) * _SPLITMIX_GAMMA
+        self._episode_seeds[index] = _splitmix64(seeds, np.empty_like(seeds))
+
+    def derive(self, num_envs: int, stream: int = 1) -> "EnvRng":
+        """
+        Independent streams for an auxiliary generator, such as the slots of a reset pool, following this seed
+
+        Args:
+            num_envs: Number of envs of the derived streams
+            stream: Distinguishes the generators derived from the same streams
+
+        Returns:
+            The derived streams
+        """
+        rng = EnvRng(num_envs, seed=0)
+        rng._set_key(tuple(int(word) for word in np.random.SeedSequence((*self._key, stream)).generate_state(2)))
+        return rng
+
+    def new_episode(self, index: Index = slice(None)):
+        """
+        Start a new episode for the envs ``index``, restarting their draws
+        """
+        self._episodes[index] += 1
+        self._draws[index] = 0
+        self._split_episodes(index)
+
+    @contextlib.contextmanager
+    def active(self, index: Index) -> Iterator[None]:
+        """
+        Draw only for the envs ``index`` within the context
+        """
+        previous, self._active = self._active, index
+        try:
+            yield
+        finally:
+            self._active = previous
+
+    @property
+    def num_active(self) -> int:
+        """
+        Number of rows of a draw
+        """
+        return len(self._env_ids[self._active])
+
+    def _words(self, size: tuple[int, ...], num_values: int, rows: Optional[Index]) -> np.ndarray:
+        """
+        (envs, num_values) uint64 words of a ``size`` draw, in a buffer reused by the next draw
+        """
+        envs = np.arange(self._num_envs)[self._active]
+        if rows is not None:
+            envs = envs[rows]
+        if not size or size[0] != len(envs):
+            raise ValueError(f"The draw size {size} must start with the number of drawing envs {len(envs)}")
+
+        shape = (len(envs), num_values)
+        if self._scratch.size < 2 * len(envs) * num_values:
+            self._scratch = np.empty(2 * len(envs) * num_values, dtype=np.uint64)
+        words, scratch = self._scratch[: 2 * len(envs) * num_values].reshape(2, *shape)
+
+        # (draw, i) packed into the sequence position draw * 2**32 + i + 1
+        draws = self._draws[envs].astype(np.uint64) << _SHIFT32
+        np.add(np.arange(1, num_values + 1, dtype=np.uint64), draws[:, None], out=words)
+        self._draws[envs] += 1
+        words *= _SPLITMIX_GAMMA
+        words += self._episode_seeds[envs, None]
+        return _splitmix64(words, scratch)
+
+    def _size(self, size, rows: Optional[Index], *params) -> tuple[int, ...]:
+        if size is None:
+            num = self.num_active if rows is None else len(np.arange(self.num_active)[rows])
+            return (num, *np.broadcast_shapes(*(np.shape(param) for param in params)))
+        return (size,) if isinstance(size, (int, np.integer)) else tuple(size)
+
+    def random(self, size=None, rows: Optional[Index] = None) -> np.ndarray:
+        """
+        Uniform float64 values in [0, 1)
+
+        Args:
+            size: The shape of the draw, starting with the number of drawing envs. Defaults to one value per env.
+            rows: Draw only for these rows of the active envs
+
+        Returns:
+            The values
+        """
+        size = self._size(size, rows)
+        words = self._words(size, _num_values(size), rows)
+        words >>= np.uint64(11)
+        values = words.view(np.int64).astype(np.float64)
+        values *= 2.0**-53
+        return values.reshape(size)
+
+    def uniform(self, low=0.0, high=1.0, size=None, rows: Optional[Index] = None) -> np.ndarray:
+        """
+        Uniform float64 values in [low, high), see ``random``
+        """
+        values = self.random(self._size(size, rows, low, high), rows)
+        values *= np.asarray(high) - low
+        values += low
+        return values
+
+    def standard_normal(self, size=None, rows: Optional[Index] = None) -> np.ndarray:
+        """
+        Standard normal float64 values by the Box-Muller transform, see ``random``
+
+        The two 32-bit halves of a word give the radius and the angle of a pair of values, its cosine and its sine
+        branch. The angle is float32, whose trigonometry vectorizes, which bounds the error of a value to ~1e-6.
+        """
+        size = self._size(size, rows)
+        num_values = _num_values(size)
+        words = self._words(size, -(-num_values // 2), rows)
+        angle = (words & _MASK32).astype(np.float32)
+        angle *= np.float32(2.0 * np.pi * 2.0**-32)
+        words >>= _SHIFT32
+        radius = words.view(np.int64).astype(np.float64)
+        radius *= -(2.0**-32)
+        np.log1p(radius, out=radius)
+        radius *= -2.0
+        np.sqrt(radius, out=radius)
+        values = np.empty((*words.shape, 2))
+        np.multiply(radius, np.cos(angle), out=values[..., 0])
+        np.multiply(radius, np.sin(angle), out=values[..., 1])
+        values = values.reshape(len(words), -1)
+        return (values if values.shape[1] == num_values else values[:, :num_values]).reshape(size)
+
+    def normal(self, loc=0.0, scale=1.0, size=None, rows: Optional[Index] = None) -> np.ndarray:
+        """
+        Normal float64 values, see ``random``
+        """
+        values = self.standard_normal(self._size(size, rows, loc, scale), rows)
+        values *= scale
+        values += loc
+        return values
+
+    def integers(self, low, high=None, size=None, rows: Optional[Index] = None) -> np.ndarray:
+        """
+        Uniform int64 values in [low, high), or [0, low) if high is None, see ``random``
+        """
+        if high is None:
+            low, high = 0, low
+        values = self.uniform(low, high, self._size(size, rows, low, high), rows)
+        return np.minimum(np.floor(values), np.asarray(high) - 1).astype(np.int64)
@@ -0,0 +1,87 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Optional, Sequence
+
+import motrixsim as mtx
+import numpy as np
+
+
+class SensorGroup:
+    """
+    Batched reads of an ordered list of sensors into one contiguous array
+
+    The dimension of every sensor is resolved once, so that a read writes each sensor straight into its columns
+    of a single ``(batch, dim)`` array, instead of collecting per-sensor arrays and stacking them.
+    """
+
+    def __init__(self, model: mtx.SceneModel, names: Sequence[str], dtype=np.float32):
+        """
+        Args:
+            model: The scene model
+            names: The sensor names, in column order
+            dtype: The dtype of the read arrays
+        """
+        self._model = model
+        self._names = tuple(names)
+        self._dtype = np.dtype(dtype)
+        if len(set(self._names)) != len(self._names):
+            raise ValueError(f"Duplicated sensor in group: {self._names}")
+
+        probe = mtx.SceneData(model)
+        self._slices: dict[str, slice] = {}
+        start = 0
+        for name in self._names:
+            size = int(np.size(model.get_sensor_value(name, probe)))
+            self._slices[name] = slice(start, start + size)
+            start += size
+        self._dim = start
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self._names
+
+    @property
+    def dim(self) -> int:
+        """
+        Total dimension of the sensors, the number of columns of a read
+        """
+        return self._dim
+
+    def slice(self, name: str) -> slice:
+        """
+        The columns of the sensor ``name`` in a read
+        """
+        return self._slices[name]
+
+    def read(self, data: mtx.SceneData, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Read all the sensors
+
+        Args:
+            data: The scene data
+            out: The (batch, dim) array to fill, e.g. a slice of the observation buffer. Defaults to a new array.
+
+        Returns:
+            The (batch, dim) sensor values, in the order of ``names``
+        """
+        batch = data.shape[0]
+        if out is None:
+            out = np.empty((batch, self._dim), dtype=self._dtype)
+        elif out.shape != (batch, self._dim):
+            raise ValueError(f"Expected an output of shape {(batch, self._dim)}, got {out.shape}")
+        for name, columns in self._slices.items():
+            out[:, columns] = self._model.get_sensor_value(name, data).reshape(batch, -1)
+        return out
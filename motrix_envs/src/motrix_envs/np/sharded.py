@@ -0,0 +1,457 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import multiprocessing as mp
+import os
+import traceback
+import weakref
+from multiprocessing.connection import Connection, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Optional
+
+import gymnasium as gym
+import numpy as np
+
+from motrix_envs.base import ABEnv, EnvCfg
+from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_envs.np.info import InfoField, InfoGroup, InfoSchema, InfoStore
+
+# commands and replies go through the pipes as raw bytes, the batch data only through shared memory
+_STEP = b"s"
+_INIT = b"i"
+_SEED = b"r"
+_CLOSE = b"c"
+_OK = b"ok"
+
+
+class _SharedArrays:
+    """
+    Arrays backed by shared memory blocks, one block per array
+
+    The parent creates the blocks; a worker attaches to them by requesting the same arrays in the same order.
+    """
+
+    def __init__(self, names: Optional[list[str]] = None):
+        self._names = names
+        self._blocks: list[SharedMemory] = []
+
+    @property
+    def names(self) -> list[str]:
+        return [block.name for block in self._blocks]
+
+    def empty(self, shape: tuple[int, ...], dtype) -> np.ndarray:
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        if self._names is None:
+            block = SharedMemory(create=True, size=max(nbytes, 1))
+        else:
+            block = SharedMemory(name=self._names[len(self._blocks)])
+        self._blocks.append(block)
+        return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    def close(self, unlink: bool = False):
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                # an array is still referenced somewhere, the mapping goes away with it
+                pass
+            if unlink:
+                block.unlink()
+        self._blocks = []
+
+
+def _allocate(
+    empty: Callable[..., np.ndarray], num_envs: int, obs_dim: int, action_shape: tuple, schema: InfoSchema
+) -> tuple[dict[str, np.ndarray], InfoStore]:
+    """
+    Allocate the state buffers, the actions and the info through ``empty``, in the order both sides rely on
+    """
+    arrays = {
+        "obs": empty((num_envs, obs_dim), np.float32),
+        "reward": empty((num_envs,), np.float32),
+        "terminated": empty((num_envs,), bool),
+        "truncated": empty((num_envs,), bool),
+        "actions": empty((num_envs, *action_shape), np.float32),
+    }
+    return arrays, schema.allocate(num_envs, empty)
+
+
+def _spawn_seeds(seed: Optional[int], num_workers: int) -> tuple[list[int], int]:
+    """
+    The seeds of the global random state of each worker, and the seed of the per-env streams
+    """
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(num_workers)]
+    rng_seed = int(np.random.randint(2**31)) if seed is None else seed
+    return seeds, rng_seed
+
+
+def _infer_info_fields(info: dict, num_envs: int) -> list:
+    """
+    The fields of the per-env arrays of a plain dict info, nested dicts such as ``Reward`` becoming groups
+    """
+    fields = []
+    for key, value in info.items():
+        if not isinstance(key, str) or not key.isidentifier() or key.startswith("_"):
+            continue
+        if isinstance(value, dict):
+            group = _infer_info_fields(value, num_envs)
+            if group:
+                fields.append(InfoGroup(key, tuple(group)))
+        elif isinstance(value, np.ndarray) and value.ndim > 0 and value.shape[0] == num_envs:
+            fields.append(InfoField(key, value.shape[1:], value.dtype))
+    return fields
+
+
+def _probe_info_schema(env: NpEnv) -> InfoSchema:
+    """
+    The schema of the info of a task without ``info_schema``, from its info after one step with zero actions
+    """
+    env.init_state()
+    state = env.step(np.zeros((env.num_envs, *env.action_space.shape), dtype=np.float32))
+    fields = [field for field in _infer_info_fields(state.info, env.num_envs) if field.name != "steps"]
+    return InfoSchema([InfoField("steps", dtype=np.uint64), *fields])
+
+
+def _copy_info(store: InfoStore, info: dict):
+    """
+    Copy the arrays of a plain dict info into a store, skipping the keys the store or the info lack
+    """
+    for key in store:
+        value = info.get(key)
+        if value is None:
+            continue
+        current = store[key]
+        if isinstance(current, InfoStore):
+            _copy_info(current, value)
+        else:
+            np.copyto(current, value, casting="unsafe")
+
+
+def _worker(
+    conn: Connection,
+    name: str,
+    sim_backend: Optional[str],
+    env_cfg_override: Optional[Dict[str, Any]],
+    num_envs: int,
+    start: int,
+    stop: int,
+    seed: int,
+    rng_seed: int,
+):
+    """
+    Run the envs ``start:stop`` of the batch, serving the commands of the parent until closed
+    """
+    from motrix_envs import registry
+
+    try:
+        env: NpEnv = registry.make(
+            name, sim_backend=sim_backend, env_cfg_override=env_cfg_override, num_envs=stop - start
+        )
+        env.cfg.inplace_state = True
+        info_schema = env._resolve_info_schema()
+        schema = info_schema or _probe_info_schema(env)
+
+        def seed_worker(seed: int, rng_seed: int):
+            # the tasks may sample from the global random state, which must differ between the workers
+            np.random.seed(seed)
+            # the per-env streams are keyed by the global env id, so the shards draw what one batch would
+            env.seed(rng_seed, env_offset=start)
+
+        seed_worker(seed, rng_seed)
+        conn.send((env.cfg, env.observation_space, env.action_space, schema.fields))
+
+        shared = _SharedArrays(conn.recv())
+
+        def shard_empty(shape, dtype):
+            return shared.empty((num_envs, *shape[1:]), dtype)[start:stop]
+
+        arrays, info = _allocate(
+            shard_empty, stop - start, env.observation_space.shape[0], env.action_space.shape, schema
+        )
+        actions = arrays.pop("actions")
+    except Exception:
+        conn.send(traceback.format_exc())
+        return
+
+    while True:
+        command = conn.recv_bytes()
+        if command == _CLOSE:
+            break
+        try:
+            if command == _STEP:
+                # the tasks may keep the actions in their info, e.g. as the last actions, and the shared
+                # actions are overwritten by the next step
+                state = env.step(actions.copy())
+            elif command == _SEED:
+                seed_worker(*conn.recv())
+                conn.send_bytes(_OK)
+                continue
+            else:
+                env.init_state()
+                # from now on the env steps in place in the shared buffers
+                state = env._bind_buffers(arrays, info if info_schema is not None else None)
+            if info_schema is None:
+                # the task rebinds the entries of its dict info, copied into the shared store every step
+                _copy_info(info, state.info)
+            conn.send_bytes(_OK)
+        except Exception:
+            conn.send_bytes(traceback.format_exc().encode())
+    shared.close()
+
+
+def _shutdown(conns: list[Connection], processes: list, shared: Optional[_SharedArrays]):
+    for conn, process in zip(conns, processes):
+        if process.is_alive():
+            try:
+                conn.send_bytes(_CLOSE)
+            except (BrokenPipeError, OSError):
+                pass
+    for conn, process in zip(conns, processes):
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+        conn.close()
+    if shared is not None:
+        shared.close(unlink=True)
+
+
+class ShardedNpEnv(ABEnv):
+    """
+    A batch of ``NpEnv`` split across worker processes, for the trainer wrappers
+
+    Every worker owns a ``registry.make`` instance simulating a contiguous slice of the envs. The actions,
+    obs, reward, terminated, truncated and info live in shared memory: the workers step in place in their
+    slice, and the parent only exchanges a few bytes per worker and step. The returned state always holds
+    the same arrays, like ``cfg.inplace_state``.
+
+    It provides the surface of ``NpEnv`` the wrappers use: ``init_state``, ``step``, ``step_async``/
+    ``step_wait``, ``seed``, ``state``, ``cfg``, the spaces and ``num_envs``. The scene model and data live in
+    the workers, so ``state.data`` is None and there is no ``model`` to render.
+
+    The env must be registered when ``motrix_envs`` is imported, the workers being spawned by default. The
+    info of tasks declaring an ``info_schema`` is shared as a whole. For the other tasks, every worker steps
+    once with zero actions at start to find the per-env arrays of the info, e.g. ``Reward`` and ``metrics``,
+    which are then copied into shared memory every step; keys first set later in an episode are not shared.
+
+    Usage:
+        env = ShardedNpEnv("go2-flat-terrain-walk", num_envs=4096, num_workers=16)
+        state = env.step(actions)
+        ...
+        env.close()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        num_envs: int = 1,
+        num_workers: Optional[int] = None,
+        sim_backend: Optional[str] = None,
+        env_cfg_override: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Start the workers
+
+        Args:
+            name: Environment name
+            num_envs: Number of environments of the whole batch
+            num_workers: Number of worker processes, capped by num_envs. Defaults to the number of CPUs.
+            sim_backend: Simulation backend, see ``registry.make``
+            env_cfg_override: Dictionary of config overrides, see ``registry.make``
+            seed: Seed of the per-env random streams, matching an ``NpEnv`` of the whole batch seeded alike.
+                The global random state of each worker is seeded from it too.
+            start_method: The multiprocessing start method of the workers
+        """
+        num_workers = min(num_workers or os.cpu_count() or 1, num_envs)
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        seeds, rng_seed = _spawn_seeds(seed, num_workers)
+        ctx = mp.get_context(start_method)
+
+        self._num_envs = num_envs
+        self._state = None
+        self._pending_step = False
+        self._conns: list[Connection] = []
+        self._processes = []
+        self._shared = _SharedArrays()
+        self._finalizer = weakref.finalize(self, _shutdown, self._conns, self._processes, self._shared)
+        try:
+            for start, stop, worker_seed in zip(bounds[:-1], bounds[1:], seeds):
+                conn, child_conn = ctx.Pipe()
+                process = ctx.Process(
+                    target=_worker,
+                    args=(
+                        child_conn,
+                        name,
+                        sim_backend,
+                        env_cfg_override,
+                        num_envs,
+                        start,
+                        stop,
+                        worker_seed,
+                        rng_seed,
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                self._conns.append(conn)
+                self._processes.append(process)
+
+            specs = []
+            for index in range(num_workers):
+                self._wait(index)
+                specs.append(self._conns[index].recv())
+            for spec in specs:
+                if isinstance(spec, str):
+                    raise RuntimeError(f"Failed to create {name} in a worker:\n{spec}")
+            cfg, observation_space, action_space, fields = specs[0]
+            arrays, info = _allocate(
+                self._shared.empty, num_envs, observation_space.shape[0], action_space.shape, InfoSchema(fields)
+            )
+            for conn in self._conns:
+                conn.send(self._shared.names)
+        except BaseException:
+            self._finalizer()
+            raise
+
+        self._cfg = cfg
+        self._render_spacing = cfg.render_spacing
+        self._observation_space = observation_space
+        self._action_space = action_space
+        self._actions = arrays.pop("actions")
+        self._shared_state = NpEnvState(None, info=info, **arrays)
+
+    @property
+    def num_envs(self) -> int:
+        return self._num_envs
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._processes)
+
+    @property
+    def cfg(self) -> EnvCfg:
+        """
+        Get the environment configuration, as created by the workers
+        """
+        return self._cfg
+
+    @property
+    def state(self) -> NpEnvState:
+        """
+        Get the current environment state
+        """
+        return self._state
+
+    @property
+    def render_spacing(self) -> float:
+        return self._render_spacing
+
+    @property
+    def observation_space(self) -> gym.Space:
+        return self._observation_space
+
+    @property
+    def action_space(self) -> gym.Space:
+        return self._action_space
+
+    def _wait(self, index: int):
+        """
+        Wait for a message of a worker, failing if the worker died instead
+        """
+        conn, process = self._conns[index], self._processes[index]
+        if conn not in wait([conn, process.sentinel]) and not conn.poll():
+            process.join()
+            raise RuntimeError(f"Worker {index} exited unexpectedly with code {process.exitcode}")
+
+    def _send(self, command: bytes):
+        """
+        Send a command to every worker
+        """
+        if not self._finalizer.alive:
+            raise RuntimeError("The env is closed")
+        if self._pending_step:
+            raise RuntimeError("A step is already pending, call step_wait first")
+        for conn in self._conns:
+            conn.send_bytes(command)
+
+    def _collect(self):
+        """
+        Wait until every worker is done with the last command
+        """
+        errors = []
+        for index, conn in enumerate(self._conns):
+            self._wait(index)
+            reply = conn.recv_bytes()
+            if reply != _OK:
+                errors.append(f"Worker {index}:\n{reply.decode()}")
+        if errors:
+            raise RuntimeError("\n".join(errors))
+
+    def init_state(self) -> NpEnvState:
+        """
+        Reset every env of every worker
+        """
+        self._send(_INIT)
+        self._collect()
+        self._state = self._shared_state
+        return self._state
+
+    def step(self, actions: np.ndarray) -> NpEnvState:
+        self.step_async(actions)
+        return self.step_wait()
+
+    def step_async(self, actions: np.ndarray):
+        """
+        Start stepping the envs in the workers. The actions are copied before returning, only the state must
+        not be modified until ``step_wait`` returns.
+        """
+        if self._pending_step:
+            raise RuntimeError("A step is already pending, call step_wait first")
+        if self._state is None:
+            self.init_state()
+        np.copyto(self._actions, actions, casting="unsafe")
+        self._send(_STEP)
+        self._pending_step = True
+
+    def step_wait(self) -> NpEnvState:
+        if not self._pending_step:
+            raise RuntimeError("No step is pending, call step_async first")
+        self._pending_step = False
+        self._collect()
+        return self._state
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory, the arrays of the state are invalid afterwards
+        """
+        self._state = self._shared_state = self._actions = None
+        self._finalizer()
+
+    def seed(self, seed: Optional[int] = None):
+        """
+        Restart the random streams of the envs from ``seed``, like ``NpEnv.seed`` of the whole batch
+
+        The global random state of each worker is seeded from it too.
+
+        Args:
+            seed: The seed, drawn from the global numpy random state if None
+        """
+        seeds, rng_seed = _spawn_seeds(seed, self.num_workers)
+        self._send(_SEED)
+        for conn, worker_seed in zip(self._conns, seeds):
+            conn.send((worker_seed, rng_seed))
+        self._collect()
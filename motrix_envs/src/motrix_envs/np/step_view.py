@@ -0,0 +1,111 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from typing import Any
+
+import motrixsim as mtx
+import numpy as np
+
+
+class StepView:
+    """
+    Memoized reads of a ``SceneData`` within one control step
+
+    Each read crosses into motrixsim and copies a fresh array, while a task typically reads the same
+    dof positions, sensors and poses many times per step (observation, control, every reward term).
+    ``StepView`` caches those reads until ``invalidate`` is called; ``NpEnv`` invalidates it after
+    ``physics_step`` and after resetting done envs. Reading through a different ``SceneData`` (e.g. the
+    sub data passed to ``reset``) drops the cache as well.
+
+    The cached arrays are shared between callers and must be treated as read-only. Tasks that write the
+    scene data in ``update_state`` (e.g. ``set_dof_pos``) must call ``invalidate`` afterwards.
+    """
+
+    __slots__ = ("_data", "_cache")
+
+    def __init__(self):
+        self._data = None
+        self._cache: dict[Any, np.ndarray] = {}
+
+    def invalidate(self):
+        """
+        Drop all cached reads
+        """
+        self._data = None
+        self._cache.clear()
+
+    def _cache_for(self, data: mtx.SceneData) -> dict:
+        if data is not self._data:
+            self._cache.clear()
+            self._data = data
+        return self._cache
+
+    def dof_pos(self, data: mtx.SceneData) -> np.ndarray:
+        cache = self._cache_for(data)
+        value = cache.get("dof_pos")
+        if value is None:
+            value = cache["dof_pos"] = data.dof_pos
+        return value
+
+    def dof_vel(self, data: mtx.SceneData) -> np.ndarray:
+        cache = self._cache_for(data)
+        value = cache.get("dof_vel")
+        if value is None:
+            value = cache["dof_vel"] = data.dof_vel
+        return value
+
+    def sensor(self, model: mtx.SceneModel, name: str, data: mtx.SceneData) -> np.ndarray:
+        """
+        Memoized ``model.get_sensor_value(name, data)``
+        """
+        cache = self._cache_for(data)
+        key = ("sensor", name)
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = model.get_sensor_value(name, data)
+        return value
+
+    def pose(self, obj: Any, data: mtx.SceneData) -> np.ndarray:
+        """
+        Memoized ``obj.get_pose(data)`` for a body, link or site
+        """
+        cache = self._cache_for(data)
+        key = ("pose", obj)
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = obj.get_pose(data)
+        return value
+
+    def joint_dof_pos(self, body: mtx.Body, data: mtx.SceneData) -> np.ndarray:
+        """
+        Memoized ``body.get_joint_dof_pos(data)``
+        """
+        cache = self._cache_for(data)
+        key = ("joint_dof_pos", body)
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = body.get_joint_dof_pos(data)
+        return value
+
+    def joint_dof_vel(self, body: mtx.Body, data: mtx.SceneData) -> np.ndarray:
+        """
+        Memoized ``body.get_joint_dof_vel(data)``
+        """
+        cache = self._cache_for(data)
+        key = ("joint_dof_vel", body)
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = body.get_joint_dof_vel(data)
+        return value
@@ -13,8 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 
+import importlib
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
 
 from motrix_envs.base import ABEnv, EnvCfg
 
@@ -38,9 +39,62 @@ class EnvMeta:
 _envs: Dict[str, EnvMeta] = {}
 
 
+@dataclass(frozen=True)
+class _ManifestEntry:
+    module: str
+    """The module registering the environment when imported"""
+    config_class: str
+    sim_backends: Tuple[str, ...] = ("np",)
+
+
+# Built-in environments, registered by importing their module on first use rather than on package import
+_manifest: Dict[str, _ManifestEntry] = {
+    "acrobot": _ManifestEntry("motrix_envs.basic.acrobot", "AcrobotEnvCfg"),
+    "bounce_ball": _ManifestEntry("motrix_envs.basic.bounce_ball", "BounceBallEnvCfg"),
+    "cartpole": _ManifestEntry("motrix_envs.basic.cartpole", "CartPoleEnvCfg"),
+    "dm-cheetah": _ManifestEntry("motrix_envs.basic.cheetah", "CheetahEnvCfg"),
+    "dm-finger-spin": _ManifestEntry("motrix_envs.basic.finger", "FingerSpinCfg"),
+    "dm-finger-turn-easy": _ManifestEntry("motrix_envs.basic.finger", "FingerTurnEasyCfg"),
+    "dm-finger-turn-hard": _ManifestEntry("motrix_envs.basic.finger", "FingerTurnHardCfg"),
+    "dm-hopper-stand": _ManifestEntry("motrix_envs.basic.hopper", "HopperStandCfg"),
+    "dm-hopper-hop": _ManifestEntry("motrix_envs.basic.hopper", "HopperHopCfg"),
+    "dm-humanoid-walk": _ManifestEntry("motrix_envs.basic.humanoid", "HumanoidWalkCfg"),
+    "dm-humanoid-stand": _ManifestEntry("motrix_envs.basic.humanoid", "HumanoidStandCfg"),
+    "dm-humanoid-run": _ManifestEntry("motrix_envs.basic.humanoid", "HumanoidRunCfg"),
+    "dm-lqr-2-1": _ManifestEntry("motrix_envs.basic.lqr", "Lqr21Cfg"),
+    "dm-lqr-6-2": _ManifestEntry("motrix_envs.basic.lqr", "Lqr62Cfg"),
+    "dm-manipulator-bring-ball": _ManifestEntry("motrix_envs.basic.manipulator", "BringBallCfg"),
+    "pendulum": _ManifestEntry("motrix_envs.basic.pendulum", "PendulumEnvCfg"),
+    "point_mass": _ManifestEntry("motrix_envs.basic.point_mass", "PointMassEnvCfg"),
+    "dm-quadruped-walk": _ManifestEntry("motrix_envs.basic.quadruped", "QuadrupedWalkCfg"),
+    "dm-quadruped-run": _ManifestEntry("motrix_envs.basic.quadruped", "QuadrupedRunCfg"),
+    "dm-quadruped-escape": _ManifestEntry("motrix_envs.basic.quadruped", "QuadrupedEscapeCfg"),
+    "dm-quadruped-fetch": _ManifestEntry("motrix_envs.basic.quadruped", "QuadrupedFetchCfg"),
+    "dm-reacher": _ManifestEntry("motrix_envs.basic.reacher", "ReacherEnvCfg"),
+    "dm-walker": _ManifestEntry("motrix_envs.basic.walker", "WalkerEnvCfg"),
+    "dm-stander": _ManifestEntry("motrix_envs.basic.walker", "StanderEnvCfg"),
+    "dm-runner": _ManifestEntry("motrix_envs.basic.walker", "RunnerEnvCfg"),
+    "anymal_c_navigation_flat": _ManifestEntry("motrix_envs.locomotion.anymal_c", "AnymalCEnvCfg"),
+    "go1-flat-terrain-walk": _ManifestEntry("motrix_envs.locomotion.go1", "Go1WalkNpEnvCfg"),
+    "go1-rough-terrain-walk": _ManifestEntry("motrix_envs.locomotion.go1", "Go1WalkNpRoughEnvCfg"),
+    "go1-stairs-terrain-walk": _ManifestEntry("motrix_envs.locomotion.go1", "Go1WalkNpStairsEnvCfg"),
+    "go2-flat-terrain-walk": _ManifestEntry("motrix_envs.locomotion.go2", "Go2WalkNpEnvCfg"),
+    "franka-lift-cube": _ManifestEntry("motrix_envs.manipulation.franka_lift_cube", "FrankaLiftCubeEnvCfg"),
+    "franka-open-cabinet": _ManifestEntry("motrix_envs.manipulation.franka_open_cabinet", "FrankaOpenCabinetEnvCfg"),
+    "rm65-open-cabinet": _ManifestEntry("motrix_envs.manipulation.rm65_open_cabinet", "RM65OpenCabinetEnvCfg"),
+    "shadow-hand-repose": _ManifestEntry("motrix_envs.manipulation.shadow_hand", "ShadowHandReposeEnvCfg"),
+}
+
+
+def _load(name: str) -> None:
+    """Import the module registering ``name`` if it is a built-in environment not loaded yet."""
+    if name not in _envs and name in _manifest:
+        importlib.import_module(_manifest[name].module)
+
+
 def contains(name: str) -> bool:
     """Check if an environment configuration is registered."""
-    return name in _envs
+    return name in _envs or name in _manifest
 
 
 def register_env_config(name: str, env_cfg_cls: Type[EnvCfg]):
@@ -101,6 +155,7 @@ def env(name: str, sim_backend: str) -> Callable[[Type[ABEnv]], Type[ABEnv]]:
 
 def find_available_sim_backend(env_name: str) -> str:
     """Find the first available simulation backend for an environment."""
+    _load(env_name)
     if env_name not in _envs:
         raise ValueError(f"Environment '{env_name}' is not registered.")
 
@@ -129,6 +184,7 @@ def make(
     Returns:
         Environment instance
     """
+    _load(name)
     if name not in _envs:
         raise ValueError(f"Environment '{name}' is not registered.")
 
@@ -161,11 +217,22 @@ def make(
 
 
 def list_registered_envs() -> Dict[str, Dict[str, Any]]:
-    """List all registered environments with their available backends."""
+    """
+    List all registered environments with their available backends.
+
+    Built-in environments not loaded yet are listed from the manifest, without importing them.
+    """
     result = {}
-    for name, meta in _envs.items():
-        result[name] = {
-            "config_class": meta.env_cfg_cls.__name__,
-            "available_backends": list(meta.env_cls_dict.keys()),
-        }
+    for name in [*_manifest, *(name for name in _envs if name not in _manifest)]:
+        meta = _envs.get(name)
+        if meta is None:
+            result[name] = {
+                "config_class": _manifest[name].config_class,
+                "available_backends": list(_manifest[name].sim_backends),
+            }
+        else:
+            result[name] = {
+                "config_class": meta.env_cfg_cls.__name__,
+                "available_backends": list(meta.env_cls_dict.keys()),
+            }
     return result
@@ -13,7 +13,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from . import tasks  # noqa: F401
 from .rslrl.cfg import (  # noqa: F401
     RslRlActorCfg,
     RslRlCriticCfg,
@@ -0,0 +1,100 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Transfer of NpEnv arrays to JAX arrays and back without per-step allocations."""
+
+from typing import Optional
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+from jax.dlpack import from_dlpack
+
+
+class JaxTransfer:
+    """Moves NpEnv arrays to JAX arrays on a device, and actions back to numpy.
+
+    On the CPU backend, the env writes into its state arrays in place on every step, while JAX arrays must never
+    change, so every array is copied into memory owned by its JAX array. With ``zero_copy``, arrays are instead
+    copied into preallocated host buffers, ``num_slots`` used in turn per name, which are shared with JAX through
+    DLPack. Such a JAX array changes once ``num_slots`` more arrays of the same name have been transferred, so
+    it is only for callers that drop the arrays by then: nothing may keep them, e.g. a jit cache or a rollout
+    buffer storing them by reference.
+
+    On accelerators, arrays are copied with ``jax.device_put``, which is asynchronous and leaves the host
+    arrays free to be reused once it returns.
+    """
+
+    def __init__(self, device: Optional[jax.Device] = None, num_slots: int = 2, zero_copy: bool = False):
+        """
+        Args:
+            device: The device of the arrays, the default JAX device if None
+            num_slots: Number of host buffers used in turn per name (CPU with zero_copy only)
+            zero_copy: Share host buffers reused after ``num_slots`` transfers with the JAX arrays (CPU only)
+        """
+        self._device = jax.devices()[0] if device is None else device
+        self._cpu = self._device.platform == "cpu"
+        self._num_slots = num_slots
+        self._zero_copy = zero_copy
+        # name -> host buffers and index of the last used one
+        self._slots: dict[str, list[np.ndarray]] = {}
+        self._slot_index: dict[str, int] = {}
+
+    @property
+    def device(self) -> jax.Device:
+        return self._device
+
+    @property
+    def num_slots(self) -> int:
+        return self._num_slots
+
+    def to_jax(self, name: str, array: np.ndarray, dtype: Optional[np.dtype] = None) -> jax.Array:
+        """Get a copy of ``array`` as a JAX array on the device.
+
+        Args:
+            name: The name of the array, each name having its own host buffers
+            array: The array to transfer
+            dtype: The numpy dtype of the JAX array, the dtype of the array if None
+
+        Returns:
+            The JAX array, independent of ``array``. On CPU with ``zero_copy``, it shares the host buffer of the
+            transfer, which is reused after ``num_slots`` transfers of the same name.
+        """
+        dtype = array.dtype if dtype is None else np.dtype(dtype)
+        if not self._cpu:
+            return jax.device_put(array.astype(dtype, copy=False), self._device)
+        if not self._zero_copy:
+            return jnp.array(array, dtype=dtype, device=self._device)
+
+        slot = self._next_slot(name, array.shape, dtype)
+        np.copyto(slot, array, casting="unsafe")
+        return from_dlpack(slot)
+
+    def to_numpy(self, array: jax.Array) -> np.ndarray:
+        """Get a JAX array, e.g. the actions of the policy, as a read-only numpy array.
+
+        Arrays on the CPU backend are shared; device arrays are copied to the host.
+        """
+        return np.asarray(array)
+
+    def _next_slot(self, name: str, shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Get the next host buffer of ``name``, allocating the buffers on first use."""
+        slots = self._slots.get(name)
+        if slots is None or slots[0].shape != shape or slots[0].dtype != dtype:
+            slots = self._slots[name] = [np.empty(shape, dtype=dtype) for _ in range(self._num_slots)]
+            self._slot_index[name] = -1
+        index = (self._slot_index[name] + 1) % self._num_slots
+        self._slot_index[name] = index
+        return slots[index]
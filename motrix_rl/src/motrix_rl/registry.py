@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
+import importlib
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Callable, Type, TypeVar
@@ -37,6 +38,55 @@ class EnvRlCfgs:
 # RL configuration registry. map from env name to EnvMeta
 _rlcfgs: dict[str, EnvRlCfgs] = {}
 
+# Built-in RL configurations, map from env name to the module registering them when imported on first use
+_manifest: dict[str, str] = {
+    "acrobot": "motrix_rl.tasks.acrobot",
+    "anymal_c_navigation_flat": "motrix_rl.tasks.anymal_navigation",
+    "bounce_ball": "motrix_rl.tasks.bounce_ball",
+    "cartpole": "motrix_rl.tasks.cartpole",
+    "dm-cheetah": "motrix_rl.tasks.dm_cheetah",
+    "dm-finger-turn-hard": "motrix_rl.tasks.dm_finger",
+    "dm-finger-turn-easy": "motrix_rl.tasks.dm_finger",
+    "dm-finger-spin": "motrix_rl.tasks.dm_finger",
+    "dm-hopper-stand": "motrix_rl.tasks.dm_hopper",
+    "dm-hopper-hop": "motrix_rl.tasks.dm_hopper",
+    "dm-humanoid-run": "motrix_rl.tasks.dm_humanoid",
+    "dm-humanoid-walk": "motrix_rl.tasks.dm_humanoid",
+    "dm-humanoid-stand": "motrix_rl.tasks.dm_humanoid",
+    "dm-lqr-2-1": "motrix_rl.tasks.dm_lqr",
+    "dm-lqr-6-2": "motrix_rl.tasks.dm_lqr",
+    "dm-manipulator-bring-ball": "motrix_rl.tasks.dm_manipulator",
+    "dm-quadruped-fetch": "motrix_rl.tasks.dm_quadruped",
+    "dm-quadruped-escape": "motrix_rl.tasks.dm_quadruped",
+    "dm-quadruped-run": "motrix_rl.tasks.dm_quadruped",
+    "dm-quadruped-walk": "motrix_rl.tasks.dm_quadruped",
+    "dm-reacher": "motrix_rl.tasks.dm_reacher",
+    "dm-runner": "motrix_rl.tasks.dm_walker",
+    "dm-stander": "motrix_rl.tasks.dm_walker",
+    "dm-walker": "motrix_rl.tasks.dm_walker",
+    "franka-lift-cube": "motrix_rl.tasks.franka_lift_cube",
+    "franka-open-cabinet": "motrix_rl.tasks.franka_open_cabinet",
+    "go1-flat-terrain-walk": "motrix_rl.tasks.go1",
+    "go1-rough-terrain-walk": "motrix_rl.tasks.go1",
+    "go1-stairs-terrain-walk": "motrix_rl.tasks.go1",
+    "go2-flat-terrain-walk": "motrix_rl.tasks.go2",
+    "pendulum": "motrix_rl.tasks.pendulum",
+    "point_mass": "motrix_rl.tasks.point_mass",
+    "rm65-open-cabinet": "motrix_rl.tasks.rm65_open_cabinet",
+    "shadow-hand-repose": "motrix_rl.tasks.shadow_hand_repose",
+}
+
+
+def _load(env_name: str) -> None:
+    """Import the module registering the RL configurations of ``env_name`` if not loaded yet."""
+    if env_name not in _rlcfgs and env_name in _manifest:
+        importlib.import_module(_manifest[env_name])
+
+
+def list_registered_envs() -> list[str]:
+    """List the environments having RL configurations, without importing the built-in ones."""
+    return [*_manifest, *(env_name for env_name in _rlcfgs if env_name not in _manifest)]
+
 
 def _register_rlcfg(env_name: str, rllib: str, backend: str, train_cfg_cls: Type):
     """
@@ -123,6 +173,7 @@ def default_rl_cfg(env_name: str, rllib: str, backend: str) -> Any:
         The configuration class instance. Will use backend-specific config if available,
         otherwise falls back to universal config (backend=None).
     """
+    _load(env_name)
     if env_name not in _rlcfgs:
         raise ValueError(f"Environment '{env_name}' is not registered.")
     meta: EnvRlCfgs = _rlcfgs.get(env_name)
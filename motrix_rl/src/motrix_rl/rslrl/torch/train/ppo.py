@@ -78,6 +78,7 @@ class Trainer:
         # Set random seed
         if rlcfg.runner.seed is not None:
             torch.manual_seed(rlcfg.runner.seed)
+        env.seed(rlcfg.runner.seed)
 
         # Determine device
         device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
@@ -122,6 +123,7 @@ class Trainer:
         # Set random seed
         if rlcfg.runner.seed is not None:
             torch.manual_seed(rlcfg.runner.seed)
+        env.seed(rlcfg.runner.seed)
 
         # Determine device
         device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
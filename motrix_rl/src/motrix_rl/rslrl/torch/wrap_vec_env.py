@@ -20,7 +20,8 @@ import torch
 from rsl_rl.env.vec_env import VecEnv
 from tensordict import TensorDict
 
-from motrix_envs.np.env import NpEnv
+from motrix_envs.np.env import NpEnv, NpEnvState
+from motrix_rl.torch_transfer import TorchTransfer
 
 
 class RslrlNpEnvWrap(VecEnv):
@@ -35,7 +36,7 @@ class RslrlNpEnvWrap(VecEnv):
         """Initialize the VecEnv adapter.
 
         Args:
-            env: The NpEnv instance to wrap
+            env: The NpEnv or ShardedNpEnv instance to wrap
             device: PyTorch device for tensors
         """
         self._env = env
@@ -50,6 +51,16 @@ class RslrlNpEnvWrap(VecEnv):
         # Episode length buffer for tracking
         self.episode_length_buf = torch.zeros(self._num_envs, dtype=torch.long, device=self._device)
 
+        # Transfer of the env arrays to torch and the buffers reused across steps
+        self._transfer = TorchTransfer(device)
+        self._done_mask = np.zeros((self._num_envs,), dtype=bool)
+        self._dones = np.zeros((self._num_envs,), dtype=np.float32)
+        # One observation TensorDict per transfer slot, RSLRL keeping the previous observations across a step
+        self._obs_dicts = [
+            TensorDict({}, batch_size=[self._num_envs], device=self._device) for _ in range(self._transfer.num_slots)
+        ]
+        self._obs_dict_index = 0
+
         # Configuration dict for RSLRL logger
         self.cfg = {
             "env_name": self._env.cfg.__class__.__name__,
@@ -85,35 +96,58 @@ class RslrlNpEnvWrap(VecEnv):
 
     def step(self, actions: torch.Tensor) -> tuple[TensorDict, torch.Tensor, torch.Tensor, dict]:
         # Convert torch actions to numpy
-        actions_np = actions.cpu().numpy()
+        actions_np = self._transfer.to_numpy(actions)
 
         # Step the environment
-        state = self._env.step(actions_np)
-        self._state = state
+        return self._process_step(self._env.step(actions_np))
 
-        # Update episode length buffer
-        self.episode_length_buf += 1
-        # Reset episode length for done environments
-        dones_np = state.done.astype(bool)
-        self.episode_length_buf[dones_np] = 0
+    def step_async(self, actions: torch.Tensor) -> None:
+        """Start stepping the environment, collect the result with step_wait.
 
-        # Convert to torch tensors
-        obs_tensor = torch.from_numpy(state.obs).to(self._device)
-        rewards = torch.from_numpy(state.reward).to(self._device)
+        Args:
+            actions: Actions of all environments
+        """
+        self._env.step_async(self._transfer.to_numpy(actions))
+
+    def step_wait(self) -> tuple[TensorDict, torch.Tensor, torch.Tensor, dict]:
+        """Wait for the step started by step_async.
+
+        Returns:
+            The same as step
+        """
+        return self._process_step(self._env.step_wait())
+
+    def _process_step(self, state: NpEnvState) -> tuple[TensorDict, torch.Tensor, torch.Tensor, dict]:
+        self._state = state
+        transfer = self._transfer
 
         # Merge terminated and truncated into dones
-        dones = torch.from_numpy(state.done.astype(np.float32)).to(self._device)
+        np.logical_or(state.terminated, state.truncated, out=self._done_mask)
+        np.copyto(self._dones, self._done_mask)
+
+        # Update episode length buffer, resetting it for done environments
+        self.episode_length_buf += 1
+        self.episode_length_buf.masked_fill_(transfer.to_torch("done_mask", self._done_mask), 0)
 
-        # Create TensorDict for observations
-        obs = TensorDict({"policy": obs_tensor}, batch_size=[self._num_envs], device=self._device)
+        # Convert to torch tensors
+        obs = self._obs_dict(state.obs)
+        rewards = transfer.to_torch("rewards", state.reward, np.float32)
+        dones = transfer.to_torch("dones", self._dones)
 
         # Build extras dict (RSLRL calls it "extras" not "infos")
         extras = {}
         if "time_outs" in state.info:
-            extras["time_outs"] = torch.from_numpy(state.info["time_outs"]).to(self._device)
+            extras["time_outs"] = transfer.to_torch("time_outs", state.info["time_outs"])
 
         return obs, rewards, dones, extras
 
+    def _obs_dict(self, obs: np.ndarray) -> TensorDict:
+        """Get the observations as the next of the reused TensorDicts."""
+        self._obs_dict_index = (self._obs_dict_index + 1) % len(self._obs_dicts)
+        obs_dict = self._obs_dicts[self._obs_dict_index]
+        obs_dict["policy"] = self._transfer.to_torch("obs", obs, np.float32, persistent=True)
+        return obs_dict
+
     def reset(self) -> tuple[TensorDict, dict]:
         """Reset all environments.
 
@@ -128,10 +162,7 @@ class RslrlNpEnvWrap(VecEnv):
         # Reset episode length buffer
         self.episode_length_buf.zero_()
 
-        obs_tensor = torch.from_numpy(state.obs).to(self._device)
-
-        # Create TensorDict for observations
-        obs = TensorDict({"policy": obs_tensor}, batch_size=[self._num_envs], device=self._device)
+        obs = self._obs_dict(state.obs)
 
         # Build extras dict
         extras = {}
@@ -148,9 +179,7 @@ class RslrlNpEnvWrap(VecEnv):
             obs, _ = self.reset()
             return obs
 
-        obs_tensor = torch.from_numpy(self._state.obs).to(self._device)
-        obs = TensorDict({"policy": obs_tensor}, batch_size=[self._num_envs], device=self._device)
-        return obs
+        return self._obs_dict(self._state.obs)
 
     def render(self) -> None:
         """Render the environment.
@@ -19,11 +19,15 @@ def _inherits_from(cls, base_class_name):
     return any(base.__name__ == base_class_name for base in cls.__mro__)
 
 
-def wrap_env(env, enable_render: bool = False):
+# the numpy envs, in a single process or sharded across worker processes
+_NP_ENV_CLASS_NAMES = ("NpEnv", "ShardedNpEnv")
+
+
+def wrap_env(env, enable_render: bool = False, prefetch: bool = False):
     """Wrap the environment based on its type."""
-    if _inherits_from(env.__class__, "NpEnv"):
+    if any(_inherits_from(env.__class__, name) for name in _NP_ENV_CLASS_NAMES):
         from motrix_rl.skrl.jax.wrap_np import SkrlNpWrapper
 
-        return SkrlNpWrapper(env, enable_render=enable_render)
+        return SkrlNpWrapper(env, enable_render=enable_render, prefetch=prefetch)
     else:
         raise ValueError(f"Unsupported environment type: {env.__class__.__name__}")
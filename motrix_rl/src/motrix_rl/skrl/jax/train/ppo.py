@@ -16,6 +16,7 @@
 from typing import Any
 
 import flax.linen as nn
+import jax
 import jax.numpy as jnp
 import numpy as np
 from skrl.agents.jax.ppo import PPO as BasePPO
@@ -114,8 +115,124 @@ def _add_runtime_config(
     return cfg
 
 
+@jax.jit
+def _accumulate_instant(instant: jax.Array, steps: jax.Array, values: jax.Array) -> tuple[jax.Array, jax.Array]:
+    stats = jnp.stack((values.max(axis=1), values.min(axis=1), values.mean(axis=1)))
+    return instant + stats, steps + 1
+
+
+@jax.jit
+def _accumulate_total(
+    episode: jax.Array, total: jax.Array, done_steps: jax.Array, values: jax.Array, done: jax.Array
+) -> tuple[jax.Array, jax.Array, jax.Array]:
+    episode = episode + values
+    done = done.reshape(1, -1)
+    num_done = done.sum()
+    stats = jnp.stack(
+        (
+            jnp.where(done, episode, 0.0).sum(axis=1) / jnp.maximum(num_done, 1),
+            jnp.where(done, episode, jnp.inf).min(axis=1),
+            jnp.where(done, episode, -jnp.inf).max(axis=1),
+        )
+    )
+    any_done = num_done > 0
+    total = total + jnp.where(any_done, stats, 0.0)
+    return jnp.where(done, 0.0, episode), total, done_steps + any_done
+
+
+class _TermTracker:
+    """
+    Accumulates the statistics of named per-env terms, e.g. the reward terms, on the device.
+
+    The terms of a step are stacked into one array, their max/min/mean summed across steps, and optionally
+    summed per env over episodes whose mean/min/max over the done envs are summed across steps as well. Nothing
+    is read back until ``flush`` appends the averages to the tracking data, once per write interval, or until the
+    set of terms changes. Each term is averaged over the steps it was recorded in.
+    """
+
+    def __init__(self, instant_prefix: str, total_prefix: str = None):
+        """
+        Args:
+            instant_prefix: Prefix of the tracking data keys of the per step statistics
+            total_prefix: Prefix of the tracking data keys of the per episode statistics, None to not track episodes
+        """
+        self._instant_prefix = instant_prefix
+        self._total_prefix = total_prefix
+        self._keys: tuple[str, ...] = ()
+        # key -> host sums of the instant stats, steps, total stats and done steps of the previous sets of terms
+        self._pending: dict[str, list] = {}
+
+    def _allocate(self, keys: tuple[str, ...], num_envs: int) -> None:
+        episode = jnp.zeros((len(keys), num_envs))
+        if self._keys:
+            self._stash()
+            # the episodes of the terms kept go on
+            kept = [(i, self._keys.index(key)) for i, key in enumerate(keys) if key in self._keys]
+            if kept and self._episode.shape[1] == num_envs:
+                rows, old_rows = map(np.array, zip(*kept))
+                episode = episode.at[rows].set(self._episode[old_rows])
+        self._keys = keys
+        # sums across steps of the max/min/mean of each term
+        self._instant = jnp.zeros((3, len(keys)))
+        self._steps = jnp.zeros(())
+        # per env episode sums, and the sums across steps of their mean/min/max over the done envs
+        self._episode = episode
+        self._total = jnp.zeros((3, len(keys)))
+        self._done_steps = jnp.zeros(())
+
+    def _stash(self) -> None:
+        """Add the sums of the current terms to the pending host sums."""
+        instant, steps, total, done_steps = jax.device_get((self._instant, self._steps, self._total, self._done_steps))
+        for i, key in enumerate(self._keys):
+            sums = self._pending.setdefault(key, [np.zeros(3), 0.0, np.zeros(3), 0.0])
+            sums[0] += instant[:, i]
+            sums[1] += steps
+            sums[2] += total[:, i]
+            sums[3] += done_steps
+
+    def record(self, terms: dict[str, Any], done: jax.Array = None) -> None:
+        """
+        Args:
+            terms: The per-env values of each term
+            done: The per-env done flags, required when tracking episodes
+        """
+        keys = tuple(terms)
+        if not keys:
+            return
+        values = jnp.asarray(np.stack(list(terms.values())), dtype=jnp.float32)
+        if keys != self._keys or self._episode.shape[1] != values.shape[1]:
+            self._allocate(keys, values.shape[1])
+
+        self._instant, self._steps = _accumulate_instant(self._instant, self._steps, values)
+        if self._total_prefix is not None:
+            self._episode, self._total, self._done_steps = _accumulate_total(
+                self._episode, self._total, self._done_steps, values, done
+            )
+
+    def flush(self, tracking_data: dict[str, list]) -> None:
+        """Append the averages since the last flush to ``tracking_data`` and restart the averages."""
+        if not self._keys:
+            return
+        self._stash()
+        for key, (instant, steps, total, done_steps) in self._pending.items():
+            if steps > 0:
+                for j, stat in enumerate(("max", "min", "mean")):
+                    tracking_data[f"{self._instant_prefix}{key} ({stat})"].append(instant[j] / steps)
+            if done_steps > 0:
+                for j, stat in enumerate(("mean", "min", "max")):
+                    tracking_data[f"{self._total_prefix}{key} ({stat})"].append(total[j] / done_steps)
+        self._pending.clear()
+        self._instant = jnp.zeros_like(self._instant)
+        self._steps = jnp.zeros_like(self._steps)
+        self._total = jnp.zeros_like(self._total)
+        self._done_steps = jnp.zeros_like(self._done_steps)
+
+
 class PPO(BasePPO):
-    _total_custom_rewards: dict[str, np.ndarray] = {}
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reward_tracker = _TermTracker("Reward Instant / ", "Reward Total/ ")
+        self._metric_tracker = _TermTracker("metrics / ")
 
     def record_transition(
         self,
@@ -142,34 +259,14 @@ class PPO(BasePPO):
         )
 
         if "Reward" in infos:
-            for key, value in infos["Reward"].items():
-                self.tracking_data[f"Reward Instant / {key} (max)"].append(jnp.max(value))
-                self.tracking_data[f"Reward Instant / {key} (min)"].append(jnp.min(value))
-                self.tracking_data[f"Reward Instant / {key} (mean)"].append(jnp.mean(value))
-                if key not in self._total_custom_rewards:
-                    self._total_custom_rewards[key] = jnp.zeros_like(value)
-                self._total_custom_rewards[key] += value
-            done = terminated | truncated
-            done = done.reshape(-1)
-            if done.any():
-                for key in self._total_custom_rewards:
-                    self.tracking_data[f"Reward Total/ {key} (mean)"].append(
-                        jnp.mean(self._total_custom_rewards[key][done])
-                    )
-                    self.tracking_data[f"Reward Total/ {key} (min)"].append(
-                        jnp.min(self._total_custom_rewards[key][done])
-                    )
-                    self.tracking_data[f"Reward Total/ {key} (max)"].append(
-                        jnp.max(self._total_custom_rewards[key][done])
-                    )
-
-                    self._total_custom_rewards[key] = self._total_custom_rewards[key] * (1 - done)
-
+            self._reward_tracker.record(infos["Reward"], terminated | truncated)
         if "metrics" in infos:
-            for key, value in infos["metrics"].items():
-                self.tracking_data[f"metrics / {key} (max)"].append(jnp.max(value))
-                self.tracking_data[f"metrics / {key} (min)"].append(jnp.min(value))
-                self.tracking_data[f"metrics / {key} (mean)"].append(jnp.mean(value))
+            self._metric_tracker.record(infos["metrics"])
+
+    def write_tracking_data(self, timestep: int, timesteps: int) -> None:
+        self._reward_tracker.flush(self.tracking_data)
+        self._metric_tracker.flush(self.tracking_data)
+        super().write_tracking_data(timestep, timesteps)
 
 
 class Trainer:
@@ -201,7 +298,8 @@ class Trainer:
         rlcfg = self._rlcfg
         env = env_registry.make(self._env_name, sim_backend=self._sim_backend, num_envs=rlcfg.num_envs)
 
-        set_seed(rlcfg.runner.seed)
+        # set_seed draws a seed when none is configured, the env streams follow the same one
+        env.seed(set_seed(rlcfg.runner.seed))
         skrl_env = wrap_env(env, self._enable_render)
         models = self._make_model(skrl_env, rlcfg)
         # Get base configuration from config object
@@ -222,7 +320,8 @@ class Trainer:
         rlcfg = self._rlcfg
         env = env_registry.make(self._env_name, sim_backend=self._sim_backend, num_envs=rlcfg.play_num_envs)
 
-        set_seed(rlcfg.runner.seed)
+        # set_seed draws a seed when none is configured, the env streams follow the same one
+        env.seed(set_seed(rlcfg.runner.seed))
         env = wrap_env(env, self._enable_render)
         models = self._make_model(env, rlcfg)
         # Get base configuration from config object
@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Tuple
 
 import gymnasium
@@ -20,8 +21,9 @@ import jax
 import numpy as np
 from skrl.envs.jax import Wrapper as SkrlWrapper
 
-from motrix_envs.np.env import NpEnv
+from motrix_envs.np.env import NpEnv, NpEnvState
 from motrix_envs.np.renderer import NpRenderer
+from motrix_rl.jax_transfer import JaxTransfer
 
 
 class SkrlNpWrapper(SkrlWrapper):
@@ -32,14 +34,25 @@ class SkrlNpWrapper(SkrlWrapper):
     _env: NpEnv
     _renderer: NpRenderer = None
 
-    def __init__(self, env: NpEnv, enable_render: bool = False):
+    def __init__(self, env: NpEnv, enable_render: bool = False, prefetch: bool = False):
+        """
+        Args:
+            env: The environment to wrap
+            enable_render: Whether to render the environment
+            prefetch: Whether ``step_async`` also transfers the next observations in the background, so that
+                ``step_wait`` returns arrays already on the device
+        """
         super().__init__(env)
+        self._transfer = JaxTransfer(self.device)
+        self._prefetch = prefetch
+        self._prefetch_executor: ThreadPoolExecutor = None
+        self._pending_step: Future = None
         if enable_render:
             self._renderer = NpRenderer(env)
 
     def reset(self) -> Tuple[jax.Array, Any]:
         state = self._env.init_state()
-        return state.obs, state.info
+        return self._transfer.to_jax("obs", state.obs, np.float32), state.info
 
     def step(
         self, actions: jax.Array
@@ -50,13 +63,41 @@ class SkrlNpWrapper(SkrlWrapper):
         jax.Array,
         Any,
     ]:
-        actions = np.array(actions)
-        state = self._env.step(actions)
+        actions = self._transfer.to_numpy(actions)
+        return self._to_arrays(self._env.step(actions))
+
+    def step_async(self, actions: jax.Array) -> None:
+        """
+        Start stepping the env, collect the result with ``step_wait``
+        """
+        actions = self._transfer.to_numpy(actions)
+        if not self._prefetch:
+            self._env.step_async(actions)
+            return
+        if self._pending_step is not None:
+            raise RuntimeError("A step is already pending, call step_wait first")
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SkrlNpWrapper.step")
+        self._pending_step = self._prefetch_executor.submit(lambda: self._to_arrays(self._env.step(actions)))
+
+    def step_wait(self) -> Tuple[jax.Array, jax.Array, jax.Array, jax.Array, Any]:
+        """
+        Wait for the step started by ``step_async``, returning the same as ``step``
+        """
+        if not self._prefetch:
+            return self._to_arrays(self._env.step_wait())
+        if self._pending_step is None:
+            raise RuntimeError("No step is pending, call step_async first")
+        future, self._pending_step = self._pending_step, None
+        return future.result()
+
+    def _to_arrays(self, state: NpEnvState) -> Tuple[jax.Array, jax.Array, jax.Array, jax.Array, Any]:
+        transfer = self._transfer
         return (
-            state.obs,
-            state.reward.reshape(-1, 1),
-            state.terminated.reshape(-1, 1),
-            state.truncated.reshape(-1, 1),
+            transfer.to_jax("obs", state.obs, np.float32),
+            transfer.to_jax("reward", state.reward, np.float32).reshape(-1, 1),
+            transfer.to_jax("terminated", state.terminated, np.bool_).reshape(-1, 1),
+            transfer.to_jax("truncated", state.truncated, np.bool_).reshape(-1, 1),
             state.info,
         )
 
@@ -65,7 +106,9 @@ class SkrlNpWrapper(SkrlWrapper):
             self._renderer.render()
 
     def close(self) -> None:
-        pass
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown()
+            self._prefetch_executor = None
 
     @property
     def num_envs(self) -> int:
@@ -19,9 +19,13 @@ def _inherits_from(cls, base_class_name):
     return any(base.__name__ == base_class_name for base in cls.__mro__)
 
 
+# the numpy envs, in a single process or sharded across worker processes
+_NP_ENV_CLASS_NAMES = ("NpEnv", "ShardedNpEnv")
+
+
 def wrap_env(env, enable_render: bool = False):
     """Wrap the environment based on its type."""
-    if _inherits_from(env.__class__, "NpEnv"):
+    if any(_inherits_from(env.__class__, name) for name in _NP_ENV_CLASS_NAMES):
         from motrix_rl.skrl.torch.wrap_np import SkrlNpWrapper
 
         return SkrlNpWrapper(env, enable_render=enable_render)
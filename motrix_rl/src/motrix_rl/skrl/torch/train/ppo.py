@@ -15,6 +15,7 @@
 
 from typing import Any
 
+import numpy as np
 import torch
 import torch.nn as nn
 from skrl.agents.torch.ppo import PPO as BasePPO
@@ -113,8 +114,115 @@ def _add_runtime_config(
     return cfg
 
 
+class _TermTracker:
+    """
+    Accumulates the statistics of named per-env terms, e.g. the reward terms, on the device.
+
+    The terms of a step are stacked into one tensor, their max/min/mean summed across steps, and optionally
+    summed per env over episodes whose mean/min/max over the done envs are summed across steps as well. Nothing
+    is read back until ``flush`` appends the averages to the tracking data, once per write interval, or until the
+    set of terms changes. Each term is averaged over the steps it was recorded in.
+    """
+
+    def __init__(self, device, instant_prefix: str, total_prefix: str = None):
+        """
+        Args:
+            device: The device of the accumulators
+            instant_prefix: Prefix of the tracking data keys of the per step statistics
+            total_prefix: Prefix of the tracking data keys of the per episode statistics, None to not track episodes
+        """
+        self._device = device
+        self._instant_prefix = instant_prefix
+        self._total_prefix = total_prefix
+        self._keys: tuple[str, ...] = ()
+        # key -> host sums of the instant stats, steps, total stats and done steps of the previous sets of terms
+        self._pending: dict[str, list] = {}
+
+    def _allocate(self, keys: tuple[str, ...], num_envs: int) -> None:
+        episode = torch.zeros((len(keys), num_envs), device=self._device)
+        if self._keys:
+            self._stash()
+            # the episodes of the terms kept go on
+            kept = [(i, self._keys.index(key)) for i, key in enumerate(keys) if key in self._keys]
+            if kept and self._episode.shape[1] == num_envs:
+                rows, old_rows = zip(*kept)
+                episode[list(rows)] = self._episode[list(old_rows)]
+        self._keys = keys
+        # sums across steps of the max/min/mean of each term
+        self._instant = torch.zeros((3, len(keys)), device=self._device)
+        self._steps = torch.zeros((), device=self._device)
+        # per env episode sums, and the sums across steps of their mean/min/max over the done envs
+        self._episode = episode
+        self._total = torch.zeros((3, len(keys)), device=self._device)
+        self._done_steps = torch.zeros((), device=self._device)
+
+    def _stash(self) -> None:
+        """Add the sums of the current terms to the pending host sums."""
+        steps, done_steps = torch.stack((self._steps, self._done_steps)).tolist()
+        instant, total = self._instant.cpu().numpy(), self._total.cpu().numpy()
+        for i, key in enumerate(self._keys):
+            sums = self._pending.setdefault(key, [np.zeros(3), 0.0, np.zeros(3), 0.0])
+            sums[0] += instant[:, i]
+            sums[1] += steps
+            sums[2] += total[:, i]
+            sums[3] += done_steps
+
+    def record(self, terms: dict[str, Any], done: torch.Tensor = None) -> None:
+        """
+        Args:
+            terms: The per-env values of each term
+            done: The per-env done flags, required when tracking episodes
+        """
+        keys = tuple(terms)
+        if not keys:
+            return
+        values = torch.as_tensor(np.stack(list(terms.values())), dtype=torch.float32, device=self._device)
+        if keys != self._keys or self._episode.shape[1] != values.shape[1]:
+            self._allocate(keys, values.shape[1])
+
+        self._instant += torch.stack((values.amax(dim=1), values.amin(dim=1), values.mean(dim=1)))
+        self._steps += 1
+        if self._total_prefix is None:
+            return
+
+        self._episode += values
+        done = done.reshape(1, -1)
+        num_done = done.sum()
+        episode = self._episode
+        total = torch.stack(
+            (
+                (episode * done).sum(dim=1) / num_done.clamp(min=1),
+                episode.masked_fill(~done, torch.inf).amin(dim=1),
+                episode.masked_fill(~done, -torch.inf).amax(dim=1),
+            )
+        )
+        any_done = num_done > 0
+        self._total += torch.where(any_done, total, 0.0)
+        self._done_steps += any_done
+        episode.masked_fill_(done, 0.0)
+
+    def flush(self, tracking_data: dict[str, list]) -> None:
+        """Append the averages since the last flush to ``tracking_data`` and restart the averages."""
+        if not self._keys:
+            return
+        self._stash()
+        for key, (instant, steps, total, done_steps) in self._pending.items():
+            if steps > 0:
+                for j, stat in enumerate(("max", "min", "mean")):
+                    tracking_data[f"{self._instant_prefix}{key} ({stat})"].append(float(instant[j] / steps))
+            if done_steps > 0:
+                for j, stat in enumerate(("mean", "min", "max")):
+                    tracking_data[f"{self._total_prefix}{key} ({stat})"].append(float(total[j] / done_steps))
+        self._pending.clear()
+        for accumulator in (self._instant, self._steps, self._total, self._done_steps):
+            accumulator.zero_()
+
+
 class PPO(BasePPO):
-    _total_custom_rewards: dict[str, torch.Tensor] = {}
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reward_tracker = _TermTracker(self.device, "Reward Instant / ", "Reward Total/ ")
+        self._metric_tracker = _TermTracker(self.device, "metrics / ")
 
     def record_transition(
         self,
@@ -140,36 +248,14 @@ class PPO(BasePPO):
             timesteps,
         )
         if "Reward" in infos:
-            for key, value in infos["Reward"].items():
-                value = torch.tensor(value, device=self.device)
-                self.tracking_data[f"Reward Instant / {key} (max)"].append(torch.max(value).item())
-                self.tracking_data[f"Reward Instant / {key} (min)"].append(torch.min(value).item())
-                self.tracking_data[f"Reward Instant / {key} (mean)"].append(torch.mean(value).item())
-                if key not in self._total_custom_rewards:
-                    self._total_custom_rewards[key] = torch.zeros_like(value)
-                self._total_custom_rewards[key] += value
-            done = terminated | truncated
-            done = done.reshape(-1)
-            if done.any():
-                for key in self._total_custom_rewards:
-                    self.tracking_data[f"Reward Total/ {key} (mean)"].append(
-                        torch.mean(self._total_custom_rewards[key][done]).item()
-                    )
-                    self.tracking_data[f"Reward Total/ {key} (min)"].append(
-                        torch.min(self._total_custom_rewards[key][done]).item()
-                    )
-                    self.tracking_data[f"Reward Total/ {key} (max)"].append(
-                        torch.max(self._total_custom_rewards[key][done]).item()
-                    )
-
-                    self._total_custom_rewards[key] = self._total_custom_rewards[key] * (~done)
-
+            self._reward_tracker.record(infos["Reward"], terminated | truncated)
         if "metrics" in infos:
-            for key, value in infos["metrics"].items():
-                tracked_value = torch.tensor(value, device=self.device)
-                self.tracking_data[f"metrics / {key} (max)"].append(torch.max(tracked_value).item())
-                self.tracking_data[f"metrics / {key} (min)"].append(torch.min(tracked_value).item())
-                self.tracking_data[f"metrics / {key} (mean)"].append(torch.mean(tracked_value).item())
+            self._metric_tracker.record(infos["metrics"])
+
+    def write_tracking_data(self, timestep: int, timesteps: int) -> None:
+        self._reward_tracker.flush(self.tracking_data)
+        self._metric_tracker.flush(self.tracking_data)
+        super().write_tracking_data(timestep, timesteps)
 
 
 class Trainer:
@@ -200,7 +286,8 @@ class Trainer:
         """
         rlcfg = self._rlcfg
         env = env_registry.make(self._env_name, sim_backend=self._sim_backend, num_envs=rlcfg.num_envs)
-        set_seed(rlcfg.runner.seed)
+        # set_seed draws a seed when none is configured, the env streams follow the same one
+        env.seed(set_seed(rlcfg.runner.seed))
         skrl_env = wrap_env(env, self._enable_render)
         models = self._make_model(skrl_env, rlcfg)
         # Get base configuration from config object
@@ -220,7 +307,8 @@ class Trainer:
 
         rlcfg = self._rlcfg
         env = env_registry.make(self._env_name, sim_backend=self._sim_backend, num_envs=rlcfg.play_num_envs)
-        set_seed(rlcfg.runner.seed)
+        # set_seed draws a seed when none is configured, the env streams follow the same one
+        env.seed(set_seed(rlcfg.runner.seed))
         env = wrap_env(env, self._enable_render)
         models = self._make_model(env, rlcfg)
         # Get base configuration from config object
@@ -16,11 +16,13 @@
 from typing import Any, Tuple
 
 import gymnasium
+import numpy as np
 import torch
 from skrl.envs.torch import Wrapper as SkrlWrapper
 
-from motrix_envs.np.env import NpEnv
+from motrix_envs.np.env import NpEnv, NpEnvState
 from motrix_envs.np.renderer import NpRenderer
+from motrix_rl.torch_transfer import TorchTransfer
 
 
 class SkrlNpWrapper(SkrlWrapper):
@@ -33,12 +35,13 @@ class SkrlNpWrapper(SkrlWrapper):
 
     def __init__(self, env: NpEnv, enable_render: bool = False):
         super().__init__(env)
+        self._transfer = TorchTransfer(self.device)
         if enable_render:
             self._renderer = NpRenderer(env)
 
     def reset(self) -> Tuple[torch.Tensor, Any]:
         state = self._env.init_state()
-        return torch.tensor(state.obs, dtype=torch.float32, device=self.device), state.info
+        return self._transfer.to_torch("obs", state.obs, np.float32, persistent=True), state.info
 
     def step(
         self, actions: torch.Tensor
@@ -49,13 +52,27 @@ class SkrlNpWrapper(SkrlWrapper):
         torch.Tensor,
         Any,
     ]:
-        actions = actions.cpu().numpy()
-        state = self._env.step(actions)
+        return self._to_tensors(self._env.step(self._transfer.to_numpy(actions)))
+
+    def step_async(self, actions: torch.Tensor) -> None:
+        """
+        Start stepping the env, collect the result with ``step_wait``
+        """
+        self._env.step_async(self._transfer.to_numpy(actions))
+
+    def step_wait(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, Any]:
+        """
+        Wait for the step started by ``step_async``, returning the same as ``step``
+        """
+        return self._to_tensors(self._env.step_wait())
+
+    def _to_tensors(self, state: NpEnvState) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, Any]:
+        transfer = self._transfer
         return (
-            torch.tensor(state.obs, dtype=torch.float32, device=self.device),
-            torch.tensor(state.reward.reshape(-1, 1), dtype=torch.float32, device=self.device),
-            torch.tensor(state.terminated.reshape(-1, 1), dtype=torch.bool, device=self.device),
-            torch.tensor(state.truncated.reshape(-1, 1), dtype=torch.bool, device=self.device),
+            transfer.to_torch("obs", state.obs, np.float32, persistent=True),
+            transfer.to_torch("reward", state.reward.reshape(-1, 1), np.float32),
+            transfer.to_torch("terminated", state.terminated.reshape(-1, 1), bool),
+            transfer.to_torch("truncated", state.truncated.reshape(-1, 1), bool),
             state.info,
         )
 
@@ -12,27 +12,3 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-
-from . import (
-    acrobot,  # noqa: F401
-    anymal_navigation,  # noqa: F401
-    bounce_ball,  # noqa: F401
-    cartpole,  # noqa: F401
-    dm_cheetah,  # noqa: F401
-    dm_finger,  # noqa: F401
-    dm_hopper,  # noqa: F401
-    dm_humanoid,  # noqa: F401
-    dm_lqr,  # noqa: F401
-    dm_manipulator,  # noqa: F401
-    dm_quadruped,  # noqa: F401
-    dm_reacher,  # noqa: F401
-    dm_walker,  # noqa: F401
-    franka_lift_cube,  # noqa: F401
-    franka_open_cabinet,  # noqa: F401
-    go1,  # noqa: F401
-    go2,  # noqa: F401
-    pendulum,  # noqa: F401
-    point_mass,  # noqa: F401
-    rm65_open_cabinet,  # noqa: F401
-    shadow_hand_repose,  # noqa: F401
-)
@@ -0,0 +1,148 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Transfer of NpEnv arrays to torch tensors and back without per-step allocations."""
+
+from typing import Optional
+
+import numpy as np
+import torch
+
+
+def _torch_dtype(dtype: np.dtype) -> torch.dtype:
+    return torch.from_numpy(np.empty((0,), dtype=dtype)).dtype
+
+
+class TorchTransfer:
+    """Moves NpEnv arrays to torch tensors on a device, and actions back to numpy.
+
+    On CPU, arrays are shared with torch through ``torch.from_numpy``. Most tasks write every step into the
+    same arrays, so a shared tensor is only valid until the next step. Arrays whose tensors must outlive the
+    next step, such as the observations that the trainers record after stepping, are requested as
+    ``persistent``: they are copied into preallocated tensors used in turn, ``num_slots`` per name.
+
+    On CUDA, arrays are staged in pinned host buffers and copied to preallocated device tensors with
+    non-blocking copies; a staging buffer is only rewritten once its previous copy completed. Tensors copied back
+    to numpy land in pinned host buffers, ``num_slots`` used in turn per name as well.
+    """
+
+    def __init__(self, device: torch.device, num_slots: int = 2):
+        """
+        Args:
+            device: The device of the tensors
+            num_slots: Number of output tensors, and of host buffers of ``to_numpy``, used in turn per name
+        """
+        self._device = torch.device(device)
+        self._cuda = self._device.type == "cuda"
+        self._num_slots = num_slots
+        # name -> output tensors, their dtype, their numpy views on CPU, index of the last used one
+        self._slots: dict[str, list[torch.Tensor]] = {}
+        self._slot_dtypes: dict[str, np.dtype] = {}
+        self._slot_views: dict[str, list[np.ndarray]] = {}
+        self._slot_index: dict[str, int] = {}
+        # name -> pinned host buffer, its numpy view and the event of its last copy (CUDA only)
+        self._staging: dict[str, torch.Tensor] = {}
+        self._staging_views: dict[str, np.ndarray] = {}
+        self._copy_events: dict[str, torch.cuda.Event] = {}
+        # name -> pinned host buffers of to_numpy, their numpy views and index of the last used one (CUDA only)
+        self._host_buffers: dict[str, list[torch.Tensor]] = {}
+        self._host_views: dict[str, list[np.ndarray]] = {}
+        self._host_index: dict[str, int] = {}
+
+    @property
+    def device(self) -> torch.device:
+        return self._device
+
+    @property
+    def num_slots(self) -> int:
+        return self._num_slots
+
+    def to_torch(
+        self, name: str, array: np.ndarray, dtype: Optional[np.dtype] = None, persistent: bool = False
+    ) -> torch.Tensor:
+        """Get ``array`` as a tensor on the device.
+
+        Args:
+            name: The name of the array, each name having its own output tensors
+            array: The array to transfer
+            dtype: The numpy dtype of the tensor, the dtype of the array if None
+            persistent: Whether the tensor must stay valid after the env writes into ``array`` again
+
+        Returns:
+            The tensor. Unless persistent, it may share memory with ``array``. Output tensors are reused after
+            ``num_slots`` transfers of the same name.
+        """
+        dtype = array.dtype if dtype is None else np.dtype(dtype)
+        if not self._cuda and not persistent and array.dtype == dtype:
+            return torch.from_numpy(array)
+
+        index = self._next_slot(name, array.shape, dtype)
+        if not self._cuda:
+            np.copyto(self._slot_views[name][index], array, casting="unsafe")
+            return self._slots[name][index]
+
+        event = self._copy_events.get(name)
+        if event is not None:
+            event.synchronize()
+        np.copyto(self._staging_views[name], array, casting="unsafe")
+        out = self._slots[name][index]
+        out.copy_(self._staging[name], non_blocking=True)
+        if event is None:
+            event = self._copy_events[name] = torch.cuda.Event()
+        event.record()
+        return out
+
+    def to_numpy(self, tensor: torch.Tensor, name: str = "actions") -> np.ndarray:
+        """Get a tensor, e.g. the actions of the policy, as a numpy array.
+
+        CPU tensors are shared; device tensors are copied into pinned host buffers, ``num_slots`` used in turn per
+        name. The tasks keep the actions of the last steps in their info, e.g. as the current and last actions,
+        so an array stays valid until ``num_slots`` more tensors of the same name have been transferred.
+        """
+        tensor = tensor.detach()
+        if tensor.device.type == "cpu":
+            return tensor.numpy()
+        buffers = self._host_buffers.get(name)
+        if buffers is None or buffers[0].shape != tensor.shape or buffers[0].dtype != tensor.dtype:
+            buffers = self._host_buffers[name] = [
+                torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True) for _ in range(self._num_slots)
+            ]
+            self._host_views[name] = [buffer.numpy() for buffer in buffers]
+            self._host_index[name] = -1
+        index = (self._host_index[name] + 1) % self._num_slots
+        self._host_index[name] = index
+        buffers[index].copy_(tensor)
+        return self._host_views[name][index]
+
+    def _next_slot(self, name: str, shape: tuple[int, ...], dtype: np.dtype) -> int:
+        """Get the index of the next output tensor of ``name``, allocating the tensors on first use."""
+        slots = self._slots.get(name)
+        if slots is None or slots[0].shape != shape or self._slot_dtypes[name] != dtype:
+            torch_dtype = _torch_dtype(dtype)
+            if self._cuda:
+                slots = [torch.empty(shape, dtype=torch_dtype, device=self._device) for _ in range(self._num_slots)]
+                self._staging[name] = torch.empty(shape, dtype=torch_dtype, pin_memory=True)
+                self._staging_views[name] = self._staging[name].numpy()
+                self._copy_events.pop(name, None)
+            else:
+                views = [np.empty(shape, dtype=dtype) for _ in range(self._num_slots)]
+                slots = [torch.from_numpy(view) for view in views]
+                self._slot_views[name] = views
+            self._slots[name] = slots
+            self._slot_dtypes[name] = dtype
+            self._slot_index[name] = -1
+        index = (self._slot_index[name] + 1) % self._num_slots
+        self._slot_index[name] = index
+        return index
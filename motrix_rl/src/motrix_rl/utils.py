@@ -14,11 +14,28 @@
 # ==============================================================================
 
 import dataclasses
+import hashlib
+import importlib
+import json
+import logging
+import os
+import platform
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from importlib import metadata
+from typing import Any, Iterable, TypeVar
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+_BACKENDS = ("torch", "jax")
+# distributions whose version decides the result of probing each backend
+_BACKEND_PACKAGES = {"torch": ("torch",), "jax": ("jax", "jaxlib")}
+# environment variables changing the devices visible to the backends
+_DEVICE_ENV_VARS = ("CUDA_VISIBLE_DEVICES", "JAX_PLATFORMS", "JAX_PLATFORM_NAME")
+
 
 @dataclass
 class DeviceSupports:
@@ -40,8 +57,7 @@ def _check_gpu_available_for_torch():
         return False
 
 
-def get_device_supports() -> DeviceSupports:
-    supports = DeviceSupports()
+def _probe_torch(supports: DeviceSupports):
     try:
         import torch  # noqa: F401
 
@@ -50,6 +66,8 @@ def get_device_supports() -> DeviceSupports:
     except ImportError:
         pass
 
+
+def _probe_jax(supports: DeviceSupports):
     try:
         import jax  # noqa: F401
 
@@ -62,9 +80,120 @@ def get_device_supports() -> DeviceSupports:
     except ImportError:
         pass
 
+
+_PROBES = {"torch": _probe_torch, "jax": _probe_jax}
+
+
+def _cache_file() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "motrix_rl", "device_supports.json")
+
+
+def _machine_fingerprint(backend: str) -> str | None:
+    """
+    Get a key identifying the machine, the installed ``backend`` and its visible devices.
+
+    Returns None if the backend is not installed.
+    """
+    try:
+        versions = [metadata.version(package) for package in _BACKEND_PACKAGES[backend]]
+    except metadata.PackageNotFoundError:
+        return None
+    try:
+        with open("/proc/driver/nvidia/version") as f:
+            driver = f.readline()
+    except OSError:
+        driver = ""
+    parts = [backend, *versions, platform.node(), platform.machine(), platform.python_version(), driver]
+    parts += [os.environ.get(name, "") for name in _DEVICE_ENV_VARS]
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()
+
+
+def _read_cache() -> dict[str, dict[str, bool]]:
+    try:
+        with open(_cache_file()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(entries: dict[str, dict[str, bool]]):
+    path = _cache_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Failed to write the device supports cache: {e}")
+
+
+def get_device_supports(backends: Iterable[str] = _BACKENDS, use_cache: bool = True) -> DeviceSupports:
+    """Probe the learning backends available on this machine.
+
+    Only the requested backends are probed, the fields of the others are left False. A backend that is not
+    installed is reported without importing anything; otherwise probing imports it and checks its GPU, which
+    takes seconds, so the result is cached on disk per machine, backend version and visible devices.
+
+    Args:
+        backends: The backends to probe, among "torch" and "jax"
+        use_cache: Whether to read and write the on-disk cache
+
+    Returns:
+        The supports of the requested backends
+    """
+    supports = DeviceSupports()
+    entries = _read_cache() if use_cache else {}
+    updated = False
+    for backend in backends:
+        fingerprint = _machine_fingerprint(backend)
+        if fingerprint is None:
+            continue
+        cached = entries.get(fingerprint)
+        if cached is not None:
+            for name, value in cached.items():
+                setattr(supports, name, value)
+            continue
+        _PROBES[backend](supports)
+        entries[fingerprint] = {name: getattr(supports, name) for name in (backend, f"{backend}_gpu")}
+        updated = True
+    if use_cache and updated:
+        _write_cache(entries)
     return supports
 
 
+def get_device_supports_async(backends: Iterable[str] = _BACKENDS, use_cache: bool = True) -> Future:
+    """Probe the learning backends in a background thread, see ``get_device_supports``.
+
+    Once the result is known, the thread also imports the available backends, so that the import overlaps
+    with whatever the caller does meanwhile, e.g. building the env, even when the result came from the cache.
+
+    Returns:
+        A future of the ``DeviceSupports``
+    """
+    backends = tuple(backends)
+    future = Future()
+
+    def probe():
+        try:
+            supports = get_device_supports(backends, use_cache)
+        except BaseException as e:
+            future.set_exception(e)
+            return
+        future.set_result(supports)
+        for backend in backends:
+            if getattr(supports, backend):
+                try:
+                    importlib.import_module(backend)
+                except ImportError:
+                    pass
+
+    future.set_running_or_notify_cancel()
+    threading.Thread(target=probe, name="get_device_supports", daemon=True).start()
+    return future
+
+
 def class_to_dict(obj) -> dict | list | Any:
     """Recursively convert a dataclass to a dictionary.
 
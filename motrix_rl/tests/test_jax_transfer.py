@@ -0,0 +1,103 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for motrix_rl.jax_transfer and the skrl JAX wrapper, on the JAX CPU backend."""
+
+import numpy as np
+import pytest
+
+jax = pytest.importorskip("jax")
+
+from motrix_envs import registry  # noqa: E402
+from motrix_rl.jax_transfer import JaxTransfer  # noqa: E402
+
+
+@pytest.fixture
+def transfer():
+    return JaxTransfer(jax.devices("cpu")[0])
+
+
+def test_to_jax_is_independent_of_the_env_array(transfer):
+    reward = np.arange(4, dtype=np.float32)
+    array = transfer.to_jax("reward", reward)
+    # the env clears its reward buffer in place before every physics step
+    reward.fill(0.0)
+    np.testing.assert_array_equal(np.asarray(array), [0.0, 1.0, 2.0, 3.0])
+    assert transfer.to_jax("reward", reward.astype(np.float64), np.float32).dtype == np.float32
+
+    # a non-contiguous view is copied as well
+    obs = np.arange(12, dtype=np.float32).reshape(3, 4)
+    np.testing.assert_array_equal(np.asarray(transfer.to_jax("obs", obs[:, ::2])), obs[:, ::2])
+
+
+def test_to_jax_imports_bool_arrays(transfer):
+    terminated = np.array([True, False, True])
+    array = transfer.to_jax("terminated", terminated, np.bool_)
+    terminated.fill(False)
+    assert array.dtype == np.bool_
+    np.testing.assert_array_equal(np.asarray(array), [True, False, True])
+
+
+def test_to_jax_arrays_outlive_the_slots(transfer):
+    # e.g. a rollout buffer keeping the observations of every step
+    values = [transfer.to_jax("obs", np.full(3, i, dtype=np.float32)) for i in range(transfer.num_slots + 2)]
+    for i, value in enumerate(values):
+        np.testing.assert_array_equal(np.asarray(value), i)
+
+
+def test_zero_copy_to_jax_reuses_slots_in_turn():
+    transfer = JaxTransfer(jax.devices("cpu")[0], zero_copy=True)
+    values = [transfer.to_jax("obs", np.full(3, i, dtype=np.float32)) for i in range(transfer.num_slots)]
+    for i, value in enumerate(values):
+        np.testing.assert_array_equal(np.asarray(value), i)
+    # the next transfer rewrites the buffer of the first array
+    transfer.to_jax("obs", np.full(3, -1, dtype=np.float32))
+    np.testing.assert_array_equal(np.asarray(values[0]), -1)
+
+
+def test_to_numpy(transfer):
+    actions = jax.numpy.arange(6, dtype=np.float32).reshape(3, 2)
+    array = transfer.to_numpy(actions)
+    assert isinstance(array, np.ndarray)
+    np.testing.assert_array_equal(array, np.arange(6).reshape(3, 2))
+
+
+def test_wrapper_outputs_survive_the_next_step():
+    pytest.importorskip("skrl")
+    from motrix_rl.skrl.jax.wrap_np import SkrlNpWrapper
+
+    results = {}
+    for prefetch in (False, True):
+        env = registry.make("cartpole", num_envs=4)
+        env.seed(0)
+        wrapper = SkrlNpWrapper(env, prefetch=prefetch)
+        wrapper.reset()
+        steps = []
+        for i in range(30):
+            actions = jax.numpy.full((4, 1), 1.0 if i % 2 else -1.0)
+            wrapper.step_async(actions)
+            obs, reward, terminated, truncated, _ = wrapper.step_wait()
+            np.testing.assert_array_equal(np.asarray(reward)[:, 0], env.state.reward)
+            np.testing.assert_array_equal(np.asarray(terminated)[:, 0], env.state.terminated)
+            steps.append((obs, reward, terminated, truncated, np.asarray(reward).copy(), np.asarray(obs).copy()))
+        wrapper.close()
+        # the env has kept writing into its buffers, the arrays of the last num_slots steps are unchanged
+        for obs, reward, _, _, reward_copy, obs_copy in steps[-wrapper._transfer.num_slots :]:
+            np.testing.assert_array_equal(np.asarray(reward), reward_copy)
+            np.testing.assert_array_equal(np.asarray(obs), obs_copy)
+        results[prefetch] = [np.asarray(array) for step in steps for array in step[:4]]
+
+    for plain, prefetched in zip(results[False], results[True]):
+        np.testing.assert_array_equal(plain, prefetched)
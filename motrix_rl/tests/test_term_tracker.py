@@ -0,0 +1,124 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for the reward and metric term trackers of the skrl PPO agents, on CPU."""
+
+import importlib
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+NUM_ENVS = 6
+
+
+def _make_tracker(backend: str, total: bool):
+    """A tracker of the backend and a function converting a done mask to its array type."""
+    try:
+        ppo = importlib.import_module(f"motrix_rl.skrl.{backend}.train.ppo")
+    except ImportError as error:
+        pytest.skip(f"skrl {backend} backend unavailable: {error}")
+    prefixes = ("Reward Instant / ", "Reward Total/ ") if total else ("metrics / ",)
+    if backend == "torch":
+        import torch
+
+        return ppo._TermTracker("cpu", *prefixes), torch.from_numpy
+    import jax.numpy as jnp
+
+    return ppo._TermTracker(*prefixes), jnp.asarray
+
+
+def _per_step_loop(steps: list, total: bool) -> dict[str, list]:
+    """The tracking data of the former loop, appending the statistics of every step."""
+    prefix = "Reward Instant / " if total else "metrics / "
+    tracking_data = defaultdict(list)
+    episodes = {}
+    for terms, done in steps:
+        for key, value in terms.items():
+            tracking_data[f"{prefix}{key} (max)"].append(value.max())
+            tracking_data[f"{prefix}{key} (min)"].append(value.min())
+            tracking_data[f"{prefix}{key} (mean)"].append(value.mean())
+            if total:
+                episodes[key] = episodes.get(key, np.zeros(NUM_ENVS)) + value
+        if total and done.any():
+            for key in episodes:
+                tracking_data[f"Reward Total/ {key} (mean)"].append(episodes[key][done].mean())
+                tracking_data[f"Reward Total/ {key} (min)"].append(episodes[key][done].min())
+                tracking_data[f"Reward Total/ {key} (max)"].append(episodes[key][done].max())
+                episodes[key] = episodes[key] * ~done
+    return tracking_data
+
+
+def _steps(rng: np.random.Generator, num_steps: int, keys: tuple[str, ...], done_rate: float) -> list:
+    return [
+        (
+            {key: rng.normal(size=NUM_ENVS).astype(np.float32) for key in keys},
+            rng.random(NUM_ENVS) < done_rate,
+        )
+        for _ in range(num_steps)
+    ]
+
+
+@pytest.mark.parametrize("backend", ["torch", "jax"])
+@pytest.mark.parametrize("total", [True, False])
+def test_term_tracker_matches_per_step_loop(backend, total):
+    tracker, as_array = _make_tracker(backend, total)
+    rng = np.random.default_rng(0)
+    # partial done masks, steps without any done env, and a term added within the write interval
+    steps = _steps(rng, 7, ("tracking", "action_rate"), 0.3) + _steps(
+        rng, 9, ("tracking", "action_rate", "feet_air_time"), 0.3
+    )
+    steps[2][1][:] = False
+    steps[5][1][:] = True
+
+    tracking_data = defaultdict(list)
+    for terms, done in steps:
+        tracker.record(terms, as_array(done) if total else None)
+    tracker.flush(tracking_data)
+
+    expected = _per_step_loop(steps, total)
+    assert set(tracking_data) == set(expected)
+    for key, values in expected.items():
+        # the trainers write the mean of each list, the tracker appends the mean once
+        assert len(tracking_data[key]) == 1
+        np.testing.assert_allclose(tracking_data[key][0], np.mean(values), rtol=1e-5, atol=1e-6, err_msg=key)
+
+    # the next interval starts over, its episodes going on from the previous one
+    more = _steps(rng, 4, ("tracking", "action_rate", "feet_air_time"), 0.5)
+    for terms, done in more:
+        tracker.record(terms, as_array(done) if total else None)
+    tracking_data = defaultdict(list)
+    tracker.flush(tracking_data)
+    previous = _per_step_loop(steps, total)
+    for key, values in _per_step_loop(steps + more, total).items():
+        new_values = values[len(previous[key]) :]
+        np.testing.assert_allclose(tracking_data[key][0], np.mean(new_values), rtol=1e-5, atol=1e-6, err_msg=key)
+
+
+@pytest.mark.parametrize("backend", ["torch", "jax"])
+def test_term_tracker_flushes_nothing_without_steps(backend):
+    tracker, as_array = _make_tracker(backend, True)
+    tracking_data = defaultdict(list)
+    tracker.flush(tracking_data)
+    assert not tracking_data
+
+    tracker.record({"tracking": np.ones(NUM_ENVS, dtype=np.float32)}, as_array(np.zeros(NUM_ENVS, dtype=bool)))
+    tracker.flush(tracking_data)
+    # no episode ended, so there is no total
+    assert set(tracking_data) == {f"Reward Instant / tracking ({stat})" for stat in ("max", "min", "mean")}
+
+    tracking_data = defaultdict(list)
+    tracker.flush(tracking_data)
+    assert not tracking_data
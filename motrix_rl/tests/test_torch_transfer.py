@@ -0,0 +1,40 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for motrix_rl.torch_transfer."""
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from motrix_rl.torch_transfer import TorchTransfer  # noqa: E402
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA unavailable")
+def test_to_numpy_keeps_the_previous_actions():
+    transfer = TorchTransfer("cuda")
+    first = transfer.to_numpy(torch.ones((4, 3), device="cuda"))
+    # a task keeps the previous actions as its last actions
+    second = transfer.to_numpy(torch.full((4, 3), 2.0, device="cuda"))
+    assert not np.shares_memory(first, second)
+    np.testing.assert_array_equal(first, 1.0)
+    np.testing.assert_array_equal(second, 2.0)
+
+
+def test_to_numpy_shares_cpu_tensors():
+    transfer = TorchTransfer("cpu")
+    actions = torch.ones((4, 3))
+    assert np.shares_memory(transfer.to_numpy(actions), actions.numpy())
@@ -13,13 +13,14 @@
 # limitations under the License.
 # ==============================================================================
 
-"""Tests for motrix_rl.utils.cfg_override function."""
+"""Tests for motrix_rl.utils."""
 
 import dataclasses
 from dataclasses import dataclass
 
 import pytest
 
+from motrix_rl import utils
 from motrix_rl.utils import cfg_override
 
 
@@ -156,3 +157,29 @@ class TestCfgOverride:
         assert result.runner.algorithm.num_learning_epochs == 10
         assert result.runner.algorithm.learning_rate == 1e-4
         assert result.runner.actor.hidden_dims == [512, 256, 128]
+
+
+class TestDeviceSupports:
+    """Tests for get_device_supports."""
+
+    def test_probes_requested_backends_once(self, monkeypatch, tmp_path):
+        """Test that only the requested installed backends are probed, and their result cached on disk."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        # pretend torch is installed as numpy, and jax is not installed
+        monkeypatch.setitem(utils._BACKEND_PACKAGES, "torch", ("numpy",))
+        monkeypatch.setitem(utils._BACKEND_PACKAGES, "jax", ("motrix-rl-missing-package",))
+        probed = []
+
+        def probe_torch(supports):
+            probed.append("torch")
+            supports.torch = True
+
+        monkeypatch.setitem(utils._PROBES, "torch", probe_torch)
+        monkeypatch.setitem(utils._PROBES, "jax", lambda supports: probed.append("jax"))
+
+        assert utils.get_device_supports(["jax"]) == utils.DeviceSupports()
+        assert utils.get_device_supports() == utils.DeviceSupports(torch=True)
+        assert utils.get_device_supports_async(["torch"]).result() == utils.DeviceSupports(torch=True)
+        assert probed == ["torch"]
+        assert utils.get_device_supports(use_cache=False).torch
+        assert probed == ["torch", "torch"]
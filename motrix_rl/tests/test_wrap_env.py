@@ -0,0 +1,54 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for the ``wrap_env`` of the skrl backends, on CPU."""
+
+import importlib
+
+import numpy as np
+import pytest
+
+from motrix_envs.np.sharded import ShardedNpEnv
+
+
+@pytest.mark.parametrize("backend", ["torch", "jax"])
+def test_wrap_env_steps_a_sharded_env(backend):
+    try:
+        wrap_env = importlib.import_module(f"motrix_rl.skrl.{backend}").wrap_env
+        importlib.import_module(f"motrix_rl.skrl.{backend}.wrap_np")
+    except ImportError as error:
+        pytest.skip(f"skrl {backend} backend unavailable: {error}")
+
+    env = ShardedNpEnv("cartpole", num_envs=4, num_workers=2, seed=0)
+    try:
+        wrapper = wrap_env(env)
+        assert wrapper.num_envs == 4
+        obs, _ = wrapper.reset()
+        assert obs.shape == (4, env.observation_space.shape[0])
+        actions = np.zeros((4, env.action_space.shape[0]), dtype=np.float32)
+        if backend == "torch":
+            import torch
+
+            actions = torch.from_numpy(actions)
+        else:
+            import jax.numpy as jnp
+
+            actions = jnp.asarray(actions)
+        obs, reward, terminated, truncated, _ = wrapper.step(actions)
+        assert obs.shape == (4, env.observation_space.shape[0])
+        assert reward.shape == terminated.shape == truncated.shape == (4, 1)
+        np.testing.assert_array_equal(env.state.info["steps"], 1)
+    finally:
+        env.close()
@@ -30,6 +30,8 @@ flags.DEFINE_integer("num_steps", 1000, "Number of steps to benchmark")
 flags.DEFINE_boolean("random_actions", True, "Use random actions (True) or zero actions (False)")
 flags.DEFINE_integer("num_envs", 1, "Number of parallel environments")
 flags.DEFINE_string("sim_backend", None, "Simulation backend (auto-select if None)")
+flags.DEFINE_boolean("profile", False, "Report the time spent in each phase of the step")
+flags.DEFINE_string("profile_json", None, "Write the phase breakdown to this JSON file")
 
 
 def generate_action(env, random_actions: bool) -> np.ndarray:
@@ -92,6 +94,9 @@ def main(argv):
     for _ in range(10):
         env.step(action)
 
+    if FLAGS.profile or FLAGS.profile_json:
+        env.enable_profiler()
+
     # Benchmark loop
     start_time = time.perf_counter()
     for _ in range(num_steps):
@@ -110,6 +115,17 @@ def main(argv):
     print(f"  Total Steps per seconds: {steps_per_second * num_envs:.2f}")
     print(f"  Time per batch step: {time_per_step_ms:.4f} ms")
 
+    if env.profiler is not None:
+        print("\nPhase breakdown:")
+        print(f"  {'phase':<40} {'mean ms':>10} {'p50 ms':>10} {'p99 ms':>10} {'share':>8}")
+        for name, stats in env.profiler.to_dict().items():
+            print(
+                f"  {name:<40} {stats['mean_ms']:>10.4f} {stats['p50_ms']:>10.4f} "
+                f"{stats['p99_ms']:>10.4f} {stats['share']:>8.1%}"
+            )
+        if FLAGS.profile_json:
+            env.profiler.to_json(FLAGS.profile_json, indent=2)
+
 
 if __name__ == "__main__":
     app.run(main)
@@ -0,0 +1,193 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""End-to-end throughput of an environment under the RL stack layers.
+
+Runs the same environment as a bare ``NpEnv``, behind the skrl torch and jax wrappers, behind the rsl_rl wrapper
+and inside a short ``Trainer.train()``, reporting samples/sec and the share of wall time spent in the env itself.
+Layers whose learning framework is not installed are skipped. Runs on CPU by default.
+"""
+
+import os
+import time
+
+import numpy as np
+from absl import app, flags
+
+from motrix_envs import registry
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_string("env", "cartpole", "Environment name to benchmark")
+flags.DEFINE_integer("num_envs", 1024, "Number of parallel environments")
+flags.DEFINE_integer("num_steps", 200, "Number of timed batch steps per wrapper layer")
+flags.DEFINE_integer("train_steps", 96, "Number of batch steps of the trainer layer")
+flags.DEFINE_list(
+    "layers", ["np", "skrl-torch", "skrl-jax", "rslrl", "train"], "Layers to benchmark, in order of the report"
+)
+flags.DEFINE_enum("trainer", "skrl-torch", ["skrl-torch", "skrl-jax", "rslrl"], "Trainer of the train layer")
+flags.DEFINE_boolean("cpu", True, "Hide the GPUs from torch and jax")
+flags.DEFINE_string("sim_backend", None, "Simulation backend (auto-select if None)")
+
+
+def _make_env():
+    env = registry.make(FLAGS.env, sim_backend=FLAGS.sim_backend, num_envs=FLAGS.num_envs)
+    env.enable_profiler()
+    return env
+
+
+def _time_steps(env, step, actions) -> tuple[float, float]:
+    """Time ``num_steps`` calls of ``step`` after a short warmup.
+
+    Returns:
+        Wall time and time spent in ``NpEnv.step``, in seconds.
+    """
+    for _ in range(10):
+        step(actions)
+    env.profiler.reset()
+    start = time.perf_counter()
+    for _ in range(FLAGS.num_steps):
+        step(actions)
+    wall = time.perf_counter() - start
+    return wall, env.profiler.to_dict()["step"]["total_ms"] * 1e-3
+
+
+def bench_np() -> tuple[float, float, int]:
+    env = _make_env()
+    actions = np.zeros((env.num_envs, *env.action_space.shape), dtype=np.float32)
+    env.init_state()
+    return (*_time_steps(env, env.step, actions), FLAGS.num_steps * env.num_envs)
+
+
+def bench_skrl_torch() -> tuple[float, float, int]:
+    import torch
+
+    from motrix_rl.skrl.torch import wrap_env
+
+    env = _make_env()
+    wrapper = wrap_env(env)
+    wrapper.reset()
+    actions = torch.zeros((env.num_envs, *env.action_space.shape), device=wrapper.device)
+    return (*_time_steps(env, wrapper.step, actions), FLAGS.num_steps * env.num_envs)
+
+
+def bench_skrl_jax() -> tuple[float, float, int]:
+    import jax.numpy as jnp
+
+    from motrix_rl.skrl.jax import wrap_env
+
+    env = _make_env()
+    wrapper = wrap_env(env)
+    wrapper.reset()
+    actions = jnp.zeros((env.num_envs, *env.action_space.shape))
+    return (*_time_steps(env, wrapper.step, actions), FLAGS.num_steps * env.num_envs)
+
+
+def bench_rslrl() -> tuple[float, float, int]:
+    import torch
+
+    from motrix_rl.rslrl.torch.wrap_vec_env import RslrlNpEnvWrap
+
+    env = _make_env()
+    wrapper = RslrlNpEnvWrap(env, torch.device("cpu"))
+    actions = torch.zeros((env.num_envs, *env.action_space.shape))
+    return (*_time_steps(env, wrapper.step, actions), FLAGS.num_steps * env.num_envs)
+
+
+def bench_train(np_step_seconds: float) -> tuple[float, float, int]:
+    """Time a short training run, including env and model creation.
+
+    The env time is estimated from the bare layer, the trainer creating its own env.
+    """
+    num_envs = FLAGS.num_envs
+    if FLAGS.trainer == "rslrl":
+        from motrix_rl import registry as rl_registry
+        from motrix_rl.rslrl.torch.train import ppo
+
+        steps_per_iter = rl_registry.default_rl_cfg(FLAGS.env, "rslrl", "torch").runner.num_steps_per_env
+        iterations = max(1, FLAGS.train_steps // steps_per_iter)
+        num_steps = iterations * steps_per_iter
+        trainer = ppo.Trainer(
+            FLAGS.env,
+            FLAGS.sim_backend,
+            cfg_override={"num_envs": num_envs, "runner.max_iterations": iterations},
+        )
+    else:
+        if FLAGS.trainer == "skrl-jax":
+            from skrl import config
+
+            from motrix_rl.skrl.jax.train import ppo
+
+            config.jax.backend = "jax"
+        else:
+            from motrix_rl.skrl.torch.train import ppo
+
+        num_steps = FLAGS.train_steps
+        trainer = ppo.Trainer(
+            FLAGS.env,
+            FLAGS.sim_backend,
+            cfg_override={
+                "num_envs": num_envs,
+                "runner.trainer.timesteps": num_steps,
+                "runner.agent.experiment.write_interval": 0,
+                "runner.agent.experiment.checkpoint_interval": 0,
+            },
+        )
+
+    start = time.perf_counter()
+    trainer.train()
+    wall = time.perf_counter() - start
+    return wall, min(wall, np_step_seconds * num_steps), num_steps * num_envs
+
+
+def main(argv):
+    """Main benchmark function."""
+    del argv  # Unused
+
+    if FLAGS.cpu:
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+        os.environ["JAX_PLATFORMS"] = "cpu"
+
+    layers = {
+        "np": bench_np,
+        "skrl-torch": bench_skrl_torch,
+        "skrl-jax": bench_skrl_jax,
+        "rslrl": bench_rslrl,
+    }
+
+    print(f"End-to-end benchmark: {FLAGS.env}, {FLAGS.num_envs} envs\n")
+    print(f"  {'layer':<12} {'samples/s':>12} {'env share':>10} {'overhead share':>15}")
+    np_step_seconds = None
+    for layer in FLAGS.layers:
+        try:
+            if layer == "train":
+                if np_step_seconds is None:
+                    wall, env_seconds, _ = bench_np()
+                    np_step_seconds = env_seconds / FLAGS.num_steps
+                wall, env_seconds, samples = bench_train(np_step_seconds)
+                layer = f"train ({FLAGS.trainer})"
+            else:
+                wall, env_seconds, samples = layers[layer]()
+                if layer == "np":
+                    np_step_seconds = env_seconds / FLAGS.num_steps
+        except ImportError as e:
+            print(f"  {layer:<12} skipped: {e}")
+            continue
+        env_share = env_seconds / wall
+        print(f"  {layer:<12} {samples / wall:>12.1f} {env_share:>10.1%} {1.0 - env_share:>15.1%}")
+
+
+if __name__ == "__main__":
+    app.run(main)
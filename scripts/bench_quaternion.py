@@ -0,0 +1,105 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+"""Micro-benchmark the rotation kernels against the quaternion module, on each available backend."""
+
+import time
+
+import numpy as np
+from absl import app, flags
+
+from motrix_envs.math import quaternion, rotation
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list("batch_sizes", ["1024", "4096", "16384"], "Number of quaternions per call")
+flags.DEFINE_integer("num_iters", 200, "Number of timed calls per kernel and batch size")
+flags.DEFINE_list("backends", list(rotation.BACKENDS), "Rotation backends to benchmark, skipped if unavailable")
+
+_GRAVITY = np.array([0.0, 0.0, -1.0], dtype=np.float32)
+
+
+def _legacy_relative(q_target, q_current):
+    q_rel = quaternion.mul(q_target, quaternion.inverse(q_current))
+    return q_rel * np.where(q_rel[:, 3:4] < 0.0, -1.0, 1.0)
+
+
+def _cases(batch_size: int) -> dict:
+    """Name to (legacy call, kernel call writing into a preallocated output)."""
+    rng = np.random.default_rng(0)
+    q1 = quaternion.generate_random_shoemake(batch_size, rng.random((batch_size, 3))).astype(np.float32)
+    q2 = quaternion.generate_random_shoemake(batch_size, rng.random((batch_size, 3))).astype(np.float32)
+    v = rng.normal(size=(batch_size, 3)).astype(np.float32)
+    quat_out = np.empty((batch_size, 4), dtype=np.float32)
+    vec_out = np.empty((batch_size, 3), dtype=np.float32)
+    scalar_out = np.empty((batch_size,), dtype=np.float32)
+    return {
+        "mul": (lambda: quaternion.mul(q1, q2), lambda: rotation.mul(q1, q2, out=quat_out)),
+        "relative": (lambda: _legacy_relative(q1, q2), lambda: rotation.relative(q1, q2, out=quat_out)),
+        "rotate": (lambda: quaternion.rotate_vector(q1, v), lambda: rotation.rotate(q1, v, out=vec_out)),
+        "rotate_inverse": (
+            lambda: quaternion.rotate_inverse(q1, v),
+            lambda: rotation.rotate_inverse(q1, v, out=vec_out),
+        ),
+        "projected_gravity": (
+            lambda: quaternion.rotate_inverse(q1, _GRAVITY),
+            lambda: rotation.projected_gravity(q1, out=vec_out),
+        ),
+        "yaw": (lambda: quaternion.get_yaw(q1), lambda: rotation.yaw(q1, out=scalar_out)),
+        "similarity": (
+            lambda: quaternion.similarity(q1, q2[0]),
+            lambda: rotation.similarity(q1, q2[0], out=scalar_out),
+        ),
+    }
+
+
+def _time(fn, num_iters: int) -> float:
+    """Mean seconds per call after one warm-up call, which also compiles the numba kernels."""
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_iters):
+        fn()
+    return (time.perf_counter() - start) / num_iters
+
+
+def main(argv):
+    """Main benchmark function."""
+    del argv  # Unused
+
+    backends = []
+    for backend in FLAGS.backends:
+        try:
+            rotation.set_backend(backend)
+        except ImportError as e:
+            print(f"Skipping the {backend} backend: {e}")
+            continue
+        backends.append(backend)
+
+    header = f"  {'kernel':<18} {'batch':>7} {'legacy us':>10}" + "".join(f" {b + ' us':>10}" for b in backends)
+    print(f"Rotation kernels, {FLAGS.num_iters} calls per measure\n")
+    print(header)
+    for batch_size in map(int, FLAGS.batch_sizes):
+        for name, (legacy, kernel) in _cases(batch_size).items():
+            row = f"  {name:<18} {batch_size:>7d} {_time(legacy, FLAGS.num_iters) * 1e6:>10.1f}"
+            for backend in backends:
+                rotation.set_backend(backend)
+                row += f" {_time(kernel, FLAGS.num_iters) * 1e6:>10.1f}"
+            print(row)
+    rotation.set_backend("numpy")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,94 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+"""Benchmark the partial reset of done environments within ``step`` at different reset rates."""
+
+import numpy as np
+from absl import app, flags
+
+from motrix_envs import registry
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_string("env", "cartpole", "Environment name to benchmark")
+flags.DEFINE_integer("num_envs", 4096, "Number of parallel environments")
+flags.DEFINE_list("reset_rates", ["0.001", "0.01", "0.1", "0.5", "1.0"], "Fractions of envs reset per call")
+flags.DEFINE_integer("num_iters", 100, "Number of steps to time per reset rate")
+flags.DEFINE_string("sim_backend", None, "Simulation backend (auto-select if None)")
+
+
+def force_done(env, done: np.ndarray):
+    """Make every step of ``env`` end the episodes of the envs set in ``done``, and only those.
+
+    The task's ``update_state`` is shadowed on the instance, so ``step`` resets exactly these envs. Apply it
+    after ``enable_profiler``, which drops the methods shadowed on the instance.
+    """
+    update_state = env.update_state
+
+    def forced_update_state(state):
+        state = update_state(state)
+        np.copyto(state.terminated, done)
+        return state
+
+    env.update_state = forced_update_state
+
+
+def bench_reset(env, done: np.ndarray, rate: float, num_iters: int) -> tuple[float, float]:
+    """Time the reset of done envs within ``step``, with ``rate`` of the envs done at every step.
+
+    Args:
+        env: The initialized environment instance, with ``force_done`` applied on ``done`` and profiling enabled.
+        done: The forced done mask, rewritten before every step.
+        rate: The fraction of envs to reset, at least one env is reset.
+        num_iters: Number of timed steps.
+
+    Returns:
+        Mean time of the reset phase and of the whole step, in seconds.
+    """
+    num_done = max(1, int(round(rate * env.num_envs)))
+    rng = np.random.default_rng(0)
+    actions = np.zeros((env.num_envs, *env.action_space.shape), dtype=np.float32)
+    env.profiler.reset()
+    for _ in range(num_iters):
+        done.fill(False)
+        done[rng.choice(env.num_envs, num_done, replace=False)] = True
+        env.step(actions)
+    stats = env.profiler.to_dict()
+    return stats["reset_done_envs"]["mean_ms"] * 1e-3, stats["step"]["mean_ms"] * 1e-3
+
+
+def main(argv):
+    """Main benchmark function."""
+    del argv  # Unused
+
+    env = registry.make(FLAGS.env, sim_backend=FLAGS.sim_backend, num_envs=FLAGS.num_envs)
+    done = np.zeros((env.num_envs,), dtype=bool)
+    env.enable_profiler()
+    force_done(env, done)
+    env.init_state()
+
+    print(f"Reset benchmark: {FLAGS.env}, {FLAGS.num_envs} envs, {FLAGS.num_iters} steps per rate\n")
+    print(f"  {'rate':>8} {'num reset':>10} {'reset ms':>10} {'step ms':>10} {'us / env':>10}")
+    for rate in map(float, FLAGS.reset_rates):
+        num_done = max(1, int(round(rate * env.num_envs)))
+        reset, step = bench_reset(env, done, rate, FLAGS.num_iters)
+        print(
+            f"  {rate:>8.3%} {num_done:>10d} {reset * 1e3:>10.4f} {step * 1e3:>10.4f} {reset * 1e6 / num_done:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
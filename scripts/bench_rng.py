@@ -0,0 +1,76 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+"""Benchmark the per-env random streams of ``EnvRng`` against ``np.random.Generator``."""
+
+import time
+
+import numpy as np
+from absl import app, flags
+
+from motrix_envs.np.rng import EnvRng
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_envs", 4096, "Number of parallel environments")
+flags.DEFINE_list("widths", ["1", "3", "48"], "Values drawn per env")
+flags.DEFINE_integer("num_iters", 200, "Number of draws to time per distribution and width")
+
+
+def bench(draw, num_iters: int) -> float:
+    """Time ``draw``.
+
+    Args:
+        draw: The draw to time, called without arguments.
+        num_iters: Number of timed draws.
+
+    Returns:
+        Mean time per draw in seconds.
+    """
+    draw()
+    start = time.perf_counter()
+    for _ in range(num_iters):
+        draw()
+    return (time.perf_counter() - start) / num_iters
+
+
+def main(argv):
+    """Main benchmark function."""
+    del argv  # Unused
+
+    env_rng = EnvRng(FLAGS.num_envs, seed=0)
+    np_rng = np.random.default_rng(0)
+
+    print(f"RNG benchmark: {FLAGS.num_envs} envs, {FLAGS.num_iters} draws per case\n")
+    print(f"  {'draw':>10} {'width':>6} {'EnvRng ms':>10} {'numpy ms':>10} {'ratio':>6}")
+    for width in map(int, FLAGS.widths):
+        size = (FLAGS.num_envs, width)
+        cases = {
+            "random": (lambda: env_rng.random(size), lambda: np_rng.random(size)),
+            "uniform": (lambda: env_rng.uniform(-1.0, 1.0, size), lambda: np_rng.uniform(-1.0, 1.0, size)),
+            "normal": (lambda: env_rng.normal(0.0, 0.1, size), lambda: np_rng.normal(0.0, 0.1, size)),
+        }
+        for name, (env_draw, np_draw) in cases.items():
+            env_seconds = bench(env_draw, FLAGS.num_iters)
+            np_seconds = bench(np_draw, FLAGS.num_iters)
+            print(
+                f"  {name:>10} {width:>6d} {env_seconds * 1e3:>10.4f} {np_seconds * 1e3:>10.4f}"
+                f" {env_seconds / np_seconds:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,253 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Benchmark suite sweeping the registered environments over batch sizes, with baseline comparison.
+
+Usage:
+    python scripts/bench_suite.py --output bench.json
+    python scripts/bench_suite.py --baseline bench.json --threshold 0.1
+"""
+
+import gc
+import json
+import platform
+import resource
+import sys
+import time
+
+import numpy as np
+from absl import app, flags
+
+from motrix_envs import registry
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list("envs", None, "Environments to benchmark (all registered if None)")
+flags.DEFINE_list("num_envs", ["1", "64", "1024", "4096"], "Batch sizes to sweep")
+flags.DEFINE_integer("num_steps", 100, "Number of timed steps per run")
+flags.DEFINE_integer("warmup_steps", 10, "Number of untimed steps before timing")
+flags.DEFINE_float("reset_rate", 0.01, "Fraction of envs done per step when timing the partial reset")
+flags.DEFINE_string("sim_backend", None, "Simulation backend (auto-select if None)")
+flags.DEFINE_boolean("profile", False, "Record the phase breakdown of the step")
+flags.DEFINE_string("output", None, "Write the results to this JSON file")
+flags.DEFINE_string("baseline", None, "Compare the results against this JSON file")
+flags.DEFINE_float("threshold", 0.1, "Relative slowdown reported as a regression")
+
+# metric name -> True if higher is better
+_METRICS = {
+    "steps_per_sec": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "reset_ms": False,
+    "partial_reset_ms": False,
+    "rss_per_env_kb": False,
+}
+
+flags.DEFINE_multi_enum("metrics", list(_METRICS), list(_METRICS), "Metrics compared against the baseline")
+
+
+def rss_mb() -> float:
+    """Current resident set size of the process in MiB, the peak where the current one is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, KiB elsewhere
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def time_partial_reset(env, action: np.ndarray, rate: float, num_steps: int) -> float:
+    """Mean time of the reset of the done envs within ``step``, with ``rate`` of the envs done at every step.
+
+    The done envs are forced by shadowing the task's ``update_state`` on the instance, the reset is timed by the
+    step profiler, which must be enabled beforehand: enabling it drops the methods shadowed on the instance.
+    """
+    num_done = max(1, int(round(rate * env.num_envs)))
+    rng = np.random.default_rng(0)
+    done = np.zeros((env.num_envs,), dtype=bool)
+    update_state = env.update_state
+
+    def forced_update_state(state):
+        state = update_state(state)
+        np.copyto(state.terminated, done)
+        return state
+
+    env.update_state = forced_update_state
+    env.profiler.reset()
+    for _ in range(num_steps):
+        done.fill(False)
+        done[rng.choice(env.num_envs, num_done, replace=False)] = True
+        env.step(action)
+    return env.profiler.to_dict()["reset_done_envs"]["mean_ms"] * 1e-3
+
+
+def bench_env(name: str, num_envs: int, num_steps: int, warmup_steps: int, profile: bool, reset_rate: float) -> dict:
+    """Benchmark one environment at one batch size.
+
+    ``reset_ms`` times the reset of every env by ``init_state``, ``partial_reset_ms`` the reset of the done
+    envs within ``step`` with ``reset_rate`` of the envs done, as during training. The RSS of the process
+    includes the earlier runs, so ``rss_per_env_kb`` divides the growth of the RSS over this run instead.
+
+    Args:
+        name: Environment name.
+        num_envs: Number of parallel environments.
+        num_steps: Number of timed steps.
+        warmup_steps: Number of untimed steps before timing.
+        profile: Whether to record the phase breakdown.
+        reset_rate: Fraction of envs done per step when timing the partial reset.
+
+    Returns:
+        The metrics of the run.
+    """
+    rss_start = rss_mb()
+    env = registry.make(name, sim_backend=FLAGS.sim_backend, num_envs=num_envs)
+
+    start = time.perf_counter()
+    env.init_state()
+    reset_s = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    space = env.action_space
+    low = np.where(np.isfinite(space.low), space.low, -1.0)
+    high = np.where(np.isfinite(space.high), space.high, 1.0)
+    action = rng.uniform(low, high, size=(num_envs, *space.shape)).astype(space.dtype)
+
+    for _ in range(warmup_steps):
+        env.step(action)
+    if profile:
+        env.enable_profiler()
+
+    latencies = np.empty((num_steps,))
+    for i in range(num_steps):
+        start = time.perf_counter()
+        env.step(action)
+        latencies[i] = time.perf_counter() - start
+
+    rss_end = rss_mb()
+    phases = env.profiler.to_dict() if profile else None
+
+    if not profile:
+        env.enable_profiler()
+    partial_reset_s = time_partial_reset(env, action, reset_rate, num_steps)
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    result = {
+        "steps_per_sec": num_envs * num_steps / latencies.sum(),
+        "p50_ms": p50,
+        "p99_ms": p99,
+        "reset_ms": reset_s * 1e3,
+        "partial_reset_ms": partial_reset_s * 1e3,
+        "rss_mb": rss_end,
+        "rss_delta_mb": rss_end - rss_start,
+        "rss_per_env_kb": (rss_end - rss_start) * 2**10 / num_envs,
+    }
+    if profile:
+        result["phases"] = phases
+    return result
+
+
+def compare(results: dict, baseline: dict, threshold: float, metrics: list[str]) -> list[str]:
+    """Find the metrics that regressed by more than ``threshold`` relative to the baseline.
+
+    Args:
+        results: The results of this run, keyed by run name.
+        baseline: The stored results, in the same format.
+        threshold: The relative change reported as a regression, e.g. 0.1 for 10%.
+        metrics: The metrics to compare.
+
+    Returns:
+        A description of each regression.
+    """
+    regressions = []
+    for run, values in results.items():
+        reference = baseline.get(run)
+        if reference is None or "error" in values or "error" in reference:
+            continue
+        for metric in metrics:
+            if metric not in reference:
+                # a baseline recorded before the metric existed
+                continue
+            higher_is_better = _METRICS[metric]
+            old, new = reference[metric], values[metric]
+            if old <= 0:
+                continue
+            change = (new - old) / old
+            if (change < -threshold) if higher_is_better else (change > threshold):
+                regressions.append(f"{run} {metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    return regressions
+
+
+def main(argv):
+    """Main benchmark function."""
+    del argv  # Unused
+
+    env_names = FLAGS.envs or list(registry.list_registered_envs())
+    batch_sizes = [int(n) for n in FLAGS.num_envs]
+
+    results = {}
+    print(
+        f"  {'run':<45} {'steps/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'reset ms':>10} {'partial ms':>10} "
+        f"{'KiB/env':>10}"
+    )
+    for name in env_names:
+        for num_envs in batch_sizes:
+            run = f"{name}@{num_envs}"
+            try:
+                metrics = bench_env(
+                    name, num_envs, FLAGS.num_steps, FLAGS.warmup_steps, FLAGS.profile, FLAGS.reset_rate
+                )
+            except Exception as e:
+                results[run] = {"error": str(e)}
+                print(f"  {run:<45} failed: {e}")
+                continue
+            finally:
+                gc.collect()
+            results[run] = metrics
+            print(
+                f"  {run:<45} {metrics['steps_per_sec']:>12.1f} {metrics['p50_ms']:>10.3f} "
+                f"{metrics['p99_ms']:>10.3f} {metrics['reset_ms']:>10.3f} {metrics['partial_reset_ms']:>10.3f} "
+                f"{metrics['rss_per_env_kb']:>10.2f}"
+            )
+
+    report = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "num_steps": FLAGS.num_steps,
+            "reset_rate": FLAGS.reset_rate,
+        },
+        "results": results,
+    }
+    if FLAGS.output:
+        with open(FLAGS.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {FLAGS.output}")
+
+    if FLAGS.baseline:
+        with open(FLAGS.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, FLAGS.threshold, FLAGS.metrics)
+        if regressions:
+            print(f"\n{len(regressions)} regressions beyond {FLAGS.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regression beyond {FLAGS.threshold:.0%} against {FLAGS.baseline}")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -19,6 +19,7 @@ from pathlib import Path
 from absl import app, flags
 from skrl import config
 
+from motrix_envs import registry as env_registry
 from motrix_rl import utils
 
 logger = logging.getLogger(__name__)
@@ -139,8 +140,6 @@ def discover_rllib(env_name: str) -> tuple[str, Path]:
 
 
 def main(argv):
-    device_supports = utils.get_device_supports()
-    logger.info(device_supports)
     env_name = _ENV.value
     enable_render = True
 
@@ -179,6 +178,13 @@ def main(argv):
 
     backend = get_inference_backend(policy_path, rllib)
 
+    # Probe the backend in the background while the env module is loaded
+    supports_future = utils.get_device_supports_async([backend])
+    if sim_backend is None:
+        sim_backend = env_registry.find_available_sim_backend(env_name)
+    device_supports = supports_future.result()
+    logger.info(device_supports)
+
     if rllib == "rslrl":
         # RSLRL evaluation flow (always uses torch backend)
         assert device_supports.torch, "PyTorch is not available on your device"
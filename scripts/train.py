@@ -19,6 +19,7 @@ import logging
 from absl import app, flags
 from skrl import config
 
+from motrix_envs import registry as env_registry
 from motrix_rl import utils
 
 logger = logging.getLogger(__name__)
@@ -82,9 +83,20 @@ def get_train_backend(supports: utils.DeviceSupports, train_backend_arg: str | N
         raise Exception("Neither JAX nor PyTorch is available on the device.")
 
 
+def get_probe_backends(train_backend_arg: str | None, rllib: str) -> list[str]:
+    """
+    Get the learning backends whose device supports are needed to pick the training backend.
+    """
+    if rllib == "rslrl":
+        return ["torch"]
+    if train_backend_arg is not None:
+        return [train_backend_arg]
+    return ["jax", "torch"]
+
+
 def main(argv):
-    device_supports = utils.get_device_supports()
-    logger.info(device_supports)
+    # Probe the backends in the background while the env module is loaded
+    supports_future = utils.get_device_supports_async(get_probe_backends(_TRAIN_BACKEND.value, _RLLIB.value))
     env_name = _ENV.value
     enable_render = _RENDER.value
 
@@ -99,8 +111,13 @@ def main(argv):
         rl_override["runner.seed"] = _SEED.value
 
     sim_backend = _SIM_BACKEND.value
+    if sim_backend is None:
+        sim_backend = env_registry.find_available_sim_backend(env_name)
     rllib = _RLLIB.value
 
+    device_supports = supports_future.result()
+    logger.info(device_supports)
+
     # Determine the training backend
     train_backend = get_train_backend(device_supports, _TRAIN_BACKEND.value, rllib)
 
@@ -17,7 +17,7 @@
 import numpy as np
 
 from motrix_envs import registry
-from motrix_rl.registry import _rlcfgs
+from motrix_rl import registry as rl_registry
 
 
 def test_all_demos():
@@ -26,7 +26,7 @@ def test_all_demos():
     num_envs = [1, 2]
     sim_backends = ["np"]
 
-    all_envs = list(_rlcfgs.keys())
+    all_envs = rl_registry.list_registered_envs()
 
     total_count = 0
     failed_count = 0
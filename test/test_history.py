@@ -0,0 +1,58 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+
+from motrix_envs.np.history import HistoryBuffer
+from motrix_envs.np.info import InfoSchema
+
+
+def test_history_buffer_matches_rolling_buffer():
+    rng = np.random.default_rng(0)
+    num_envs, length = 5, 4
+    first = rng.standard_normal((num_envs, 2)).astype(np.float32)
+    rolled = np.repeat(first[:, None], length, axis=1)
+    history = HistoryBuffer.allocate(num_envs, length, (2,))
+    history.fill(first)
+
+    for step in range(11):
+        value = rng.standard_normal((num_envs, 2)).astype(np.float32)
+        rolled = np.roll(rolled, 1, axis=1)
+        rolled[:, 0] = value
+        history.push(value)
+        if step == 5:
+            mask = np.array([True, False, True, False, False])
+            rolled[mask] = value[mask][:, None]
+            history.fill(value[mask], mask)
+
+        np.testing.assert_array_equal(history.ordered(), rolled)
+        delay = rng.integers(0, length + 2, size=num_envs)
+        np.testing.assert_array_equal(history.get(delay), rolled[np.arange(num_envs), np.minimum(delay, length - 1)])
+        out = np.empty((num_envs, length * 2), dtype=np.float32)
+        assert history.ordered(out) is out
+        np.testing.assert_array_equal(out, rolled.reshape(num_envs, -1))
+
+
+def test_history_buffer_lives_in_info():
+    info = InfoSchema(HistoryBuffer.fields("actions", 3, (2,))).allocate(4)
+    history = HistoryBuffer.from_info(info, "actions")
+    history.push(np.ones((4, 2), dtype=np.float32))
+    # the buffer writes through to the info arrays, which reset like any other field
+    np.testing.assert_array_equal(info["actions_head"], 1)
+    reset = HistoryBuffer.allocate(2, 3, (2,))
+    reset.fill(np.full((2, 2), 7.0, dtype=np.float32))
+    info.reset(np.array([1, 3]), reset.to_info("actions"))
+    np.testing.assert_array_equal(history.get(0), [[1, 1], [7, 7], [1, 1], [7, 7]])
+    assert HistoryBuffer.from_info({}, "actions") is None
@@ -0,0 +1,99 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import numpy as np
+import pytest
+
+from motrix_envs.basic.cartpole.cartpole_np import CartPoleEnv
+from motrix_envs.basic.cartpole.cfg import CartPoleEnvCfg
+from motrix_envs.np.info import InfoField, InfoGroup, InfoSchema, InfoStore
+
+SCHEMA = InfoSchema(
+    [
+        InfoField("actions", (2,)),
+        InfoField("grasped", dtype=bool),
+        InfoField("counter", dtype=np.int32, default=7),
+        InfoGroup("Reward", (InfoField("dist"), InfoField("quat"))),
+    ]
+)
+
+
+def test_info_store_access_and_reset():
+    info = SCHEMA.allocate(4)
+    assert isinstance(info, InfoStore)
+    assert list(info) == ["actions", "grasped", "counter", "Reward"]
+    assert info.actions.shape == (4, 2) and info.actions.dtype == np.float32
+    assert info["counter"] is info.counter
+    np.testing.assert_array_equal(info.counter, 7)
+    assert not hasattr(info, "__dict__")
+
+    actions = info.actions
+    info["actions"] = np.ones((4, 2))
+    assert info.actions is actions
+    np.testing.assert_array_equal(actions, 1.0)
+    info["Reward"] = {"dist": np.arange(4), "quat": 2.0}
+    np.testing.assert_array_equal(info.Reward.dist, np.arange(4))
+    assert dict(info["Reward"].items()).keys() == {"dist", "quat"}
+    with pytest.raises(KeyError):
+        info["unknown"] = 1.0
+    assert "unknown" not in info and info.get("unknown") is None
+
+    snapshot = info.snapshot()
+    info.counter += 1
+    info.reset(np.array([1, 3]), {"actions": np.full((2, 2), 5.0), "Reward": {"dist": -1.0}})
+    np.testing.assert_array_equal(info.actions[:, 0], [1.0, 5.0, 1.0, 5.0])
+    np.testing.assert_array_equal(info.counter, [8, 7, 8, 7])
+    np.testing.assert_array_equal(info.Reward.dist, [0.0, -1.0, 2.0, -1.0])
+    np.testing.assert_array_equal(info.Reward.quat, [2.0, 0.0, 2.0, 0.0])
+    np.testing.assert_array_equal(snapshot.counter, 7)
+    np.testing.assert_array_equal(snapshot.Reward.dist, np.arange(4))
+
+
+class _CartPoleWithInfo(CartPoleEnv):
+    def info_schema(self):
+        return InfoSchema([InfoField("episode_pos", (2,)), InfoField("flag", dtype=bool, default=True)])
+
+    def update_state(self, state):
+        state = super().update_state(state)
+        state.info["episode_pos"] = state.data.dof_pos
+        return state
+
+    def reset(self, data):
+        obs, info = super().reset(data)
+        info["episode_pos"] = data.dof_pos
+        return obs, info
+
+
+def test_np_env_uses_info_store():
+    env = _CartPoleWithInfo(CartPoleEnvCfg(), num_envs=4)
+    state = env.init_state()
+    info = state.info
+    assert isinstance(info, InfoStore)
+    assert info.steps.dtype == np.uint64
+    np.testing.assert_array_equal(info.flag, True)
+
+    action = np.zeros((4, 1), dtype=np.float32)
+    for _ in range(3):
+        state = env.step(action)
+    assert state.info is info
+    np.testing.assert_array_equal(info.steps, 3)
+
+    info.flag[:] = False
+    state.terminated[:] = [True, False, False, True]
+    env._reset_done_envs()
+    np.testing.assert_array_equal(info.steps, [0, 3, 3, 0])
+    np.testing.assert_array_equal(info.flag, [True, False, False, True])
+    np.testing.assert_allclose(info.episode_pos, state.data.dof_pos)
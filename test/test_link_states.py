@@ -0,0 +1,75 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+import pytest
+
+from motrix_envs import registry
+from motrix_envs.np.link_states import LinkStateReader
+
+
+def test_link_state_reader_matches_link_reads():
+    env = registry.make("cartpole", num_envs=3)
+    state = env.init_state()
+    model = env.model
+    sim = LinkStateReader(model, [1, 0], env.cfg.ctrl_dt)
+    fd = LinkStateReader(model, [1, 0], env.cfg.ctrl_dt, velocity="finite_difference")
+    action = np.full((3, 1), 0.5, dtype=np.float32)
+    for _ in range(20):
+        state = env.step(action)
+    np.testing.assert_array_equal(fd.read(state.data)[..., 7:], 0.0)
+
+    state = env.step(action)
+    states = sim.read(state.data)
+    assert states.shape == (3, 2, 13)
+    for j, link_id in enumerate([1, 0]):
+        link = model.get_link(link_id)
+        np.testing.assert_allclose(states[:, j, :7], link.get_pose(state.data), rtol=1e-6)
+        np.testing.assert_allclose(states[:, j, 7:10], link.get_linear_velocity(state.data), rtol=1e-6)
+        np.testing.assert_allclose(states[:, j, 10:], link.get_angular_velocity(state.data), rtol=1e-6)
+
+    # finite differences follow the simulated velocities, except for the restarted envs
+    restart = np.array([False, True, False])
+    differentiated = fd.read(state.data, restart=restart)
+    assert np.abs(states[..., 7:]).max() > 0.5
+    np.testing.assert_allclose(differentiated[~restart, :, 7:], states[~restart, :, 7:], rtol=0.1, atol=0.02)
+    np.testing.assert_array_equal(differentiated[restart, :, 7:], 0.0)
+
+    with pytest.raises(ValueError, match="Unknown link velocity mode"):
+        LinkStateReader(model, [0], env.cfg.ctrl_dt, velocity="jacobian")
+
+
+def test_finite_difference_velocities_restart_on_full_batch_reset():
+    env = registry.make(
+        "shadow-hand-repose",
+        num_envs=4,
+        env_cfg_override={"fingertip_velocity": "finite_difference", "max_episode_steps": 3},
+    )
+    env.init_state()
+    rng = np.random.default_rng(0)
+    # obs: hand pos and vel (48), cube (13), goal (7), relative quat (4), then the fingertip states whose last 30
+    # entries are the velocities
+    velocities = slice(107, 137)
+    moved = False
+    for _ in range(3):
+        state = env.step(rng.uniform(-1.0, 1.0, (4, env.action_space.shape[0])).astype(np.float32))
+        moved |= np.abs(state.obs[:, velocities]).max() > 0.0
+    # the third step truncates all the envs, reset as a full batch
+    assert moved
+    np.testing.assert_array_equal(state.info["steps"], 0)
+    np.testing.assert_array_equal(state.obs[:, velocities], 0.0)
+
+    state = env.step(np.zeros((4, env.action_space.shape[0]), dtype=np.float32))
+    assert np.abs(state.obs[:, velocities]).max() < 10.0
@@ -0,0 +1,244 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import json
+
+import numpy as np
+import pytest
+
+from motrix_envs import registry
+from motrix_envs.np import model_cache
+from motrix_envs.np.pipeline import double_buffered
+
+
+def _zero_action(env):
+    return np.zeros((env.num_envs, *env.action_space.shape), dtype=env.action_space.dtype)
+
+
+@pytest.mark.parametrize("env_name", ["cartpole", "go2-flat-terrain-walk"])
+def test_inplace_state_returns_same_buffers(env_name):
+    env = registry.make(env_name, num_envs=4, env_cfg_override={"inplace_state": True})
+    state = env.init_state()
+    buffers = (state.obs, state.reward, state.terminated, state.truncated)
+
+    action = _zero_action(env)
+    for _ in range(5):
+        state = env.step(action)
+        assert all(a is b for a, b in zip((state.obs, state.reward, state.terminated, state.truncated), buffers))
+    assert state.obs.dtype == np.float32
+
+
+@pytest.mark.parametrize("env_name", ["cartpole", "go2-flat-terrain-walk"])
+def test_default_mode_returns_new_arrays(env_name):
+    env = registry.make(env_name, num_envs=4)
+    state = env.init_state()
+    action = _zero_action(env)
+    previous = [(state.obs, state.obs.copy()), (state.reward, state.reward.copy())]
+    for _ in range(5):
+        state = env.step(action)
+        for array, values in previous:
+            assert array is not state.obs and array is not state.reward
+            np.testing.assert_array_equal(array, values)
+        previous = [(state.obs, state.obs.copy()), (state.reward, state.reward.copy())]
+
+
+def test_inplace_state_matches_default_mode():
+    np.random.seed(0)
+    env = registry.make("cartpole", num_envs=8)
+    np.random.seed(0)
+    inplace_env = registry.make("cartpole", num_envs=8, env_cfg_override={"inplace_state": True})
+
+    np.random.seed(0)
+    env.init_state()
+    np.random.seed(0)
+    inplace_env.init_state()
+
+    action = np.full((8, 1), 0.5, dtype=np.float32)
+    for _ in range(20):
+        np.random.seed(1)
+        state = env.step(action)
+        np.random.seed(1)
+        inplace_state = inplace_env.step(action)
+        np.testing.assert_allclose(state.obs, inplace_state.obs)
+        np.testing.assert_array_equal(state.reward, inplace_state.reward)
+        np.testing.assert_array_equal(state.done, inplace_state.done)
+
+
+def test_assign_keeps_buffer_identity():
+    env = registry.make("cartpole", num_envs=3)
+    state = env.init_state()
+    obs = state.obs
+    state.assign(obs=np.ones((3, 4)), reward=2.0)
+    assert state.obs is obs
+    assert state.obs.dtype == np.float32
+    np.testing.assert_array_equal(state.obs, 1.0)
+    np.testing.assert_array_equal(state.reward, 2.0)
+    with pytest.raises(KeyError):
+        state.assign(data=None)
+
+
+def test_step_view_memoizes_until_physics_step():
+    env = registry.make("go2-flat-terrain-walk", num_envs=2)
+    state = env.init_state()
+    data = state.data
+    view = env.step_view
+
+    dof_vel = env.get_dof_vel(data)
+    assert env.get_dof_vel(data) is dof_vel
+    np.testing.assert_array_equal(dof_vel, env._body.get_joint_dof_vel(data))
+    assert view.sensor(env.model, env.cfg.sensor.gyro, data) is env.get_gyro(data)
+
+    env.physics_step()
+    assert env.get_dof_vel(data) is not dof_vel
+    np.testing.assert_array_equal(env.get_dof_vel(data), env._body.get_joint_dof_vel(data))
+
+    # reading through another SceneData drops the cache
+    pose = view.pose(env._body, data)
+    view.pose(env._body, data[np.array([True, False])])
+    assert view.pose(env._body, data) is not pose
+
+
+def test_contact_service_matches_direct_query():
+    env = registry.make("go2-flat-terrain-walk", num_envs=3)
+    state = env.step(_zero_action(env))
+    data = state.data
+    contacts = env.contacts
+
+    result = contacts.query(data)
+    assert result.shape == (3, contacts.pairs.shape[0])
+    assert contacts.query(data) is result
+    cquery = env.model.get_contact_query(data)
+    np.testing.assert_array_equal(contacts.get("feet", data), cquery.is_colliding(env.foot_check))
+    np.testing.assert_array_equal(
+        contacts.any("termination", data), cquery.is_colliding(env.termination_check).any(axis=1)
+    )
+
+    env.physics_step()
+    assert contacts.query(data) is not result
+    with pytest.raises(ValueError):
+        contacts.register("feet", env.foot_check)
+
+
+@pytest.mark.parametrize("done_ids", [[], [3], [0, 2, 5], list(range(6))])
+def test_reset_done_envs_only_touches_done(done_ids):
+    env = registry.make("go2-flat-terrain-walk", num_envs=6)
+    action = np.full((6, *env.action_space.shape), 0.3, dtype=np.float32)
+    for _ in range(3):
+        state = env.step(action)
+    obs = state.obs.copy()
+    dof_pos = state.data.dof_pos.copy()
+    state.info["feet_air_time"][:] = 1.0
+
+    done = np.zeros(6, dtype=bool)
+    done[done_ids] = True
+    state.terminated[:] = done
+    env._reset_done_envs()
+
+    np.testing.assert_array_equal(state.info["steps"], np.where(done, 0, 3))
+    np.testing.assert_array_equal(state.info["feet_air_time"][done], 0.0)
+    np.testing.assert_array_equal(state.info["feet_air_time"][~done], 1.0)
+    np.testing.assert_array_equal(state.obs[~done], obs[~done])
+    np.testing.assert_array_equal(state.data.dof_pos[~done], dof_pos[~done])
+    np.testing.assert_allclose(state.data.dof_pos[done], np.tile(env._init_dof_pos, (len(done_ids), 1)), atol=1e-6)
+
+
+def test_step_async_matches_step():
+    env = registry.make("cartpole", num_envs=4)
+    state = env.init_state()
+    action = np.full((4, 1), 0.3, dtype=np.float32)
+    env.step_async(action)
+    with pytest.raises(RuntimeError):
+        env.step_async(action)
+    assert env.step_wait() is env.state
+    np.testing.assert_array_equal(env.state.info["steps"], 1)
+    with pytest.raises(RuntimeError):
+        env.step_wait()
+    assert state.obs.shape == env.state.obs.shape
+
+
+def test_double_buffered_matches_serial_loop():
+    def policy(obs):
+        return np.clip(obs[:, :1] * 3.0, -1.0, 1.0)
+
+    np.random.seed(0)
+    envs = [registry.make("cartpole", num_envs=3) for _ in range(2)]
+    order, obs = [], []
+    for index, state in double_buffered(envs, policy, num_steps=50):
+        order.append(index)
+        obs.append(state.obs.copy())
+    assert order == [0, 1] * 50
+
+    np.random.seed(0)
+    serial_envs = [registry.make("cartpole", num_envs=3) for _ in range(2)]
+    states = [env.init_state() for env in serial_envs]
+    for step, index in enumerate(order):
+        states[index] = serial_envs[index].step(policy(states[index].obs))
+        np.testing.assert_array_equal(states[index].obs, obs[step])
+
+
+def test_profiler_records_phases_and_task_methods():
+    env = registry.make("go2-flat-terrain-walk", num_envs=4)
+    profiler = env.enable_profiler()
+    action = _zero_action(env)
+    for _ in range(5):
+        env.step(action)
+
+    stats = profiler.to_dict()
+    for name in ("init_state", "apply_action", "physics_step", "update_state", "reset_done_envs", "step"):
+        assert name in stats
+    assert stats["step"]["count"] == 5
+    assert stats["physics_step/substep"]["count"] == 5 * env.cfg.sim_substeps
+    assert stats["update_state/update_reward"]["count"] == 5
+    assert stats["step"]["share"] == pytest.approx(1.0)
+    assert json.loads(profiler.to_json()).keys() == stats.keys()
+
+    scalars = {}
+
+    class _Writer:
+        def add_scalar(self, tag, value, global_step):
+            scalars[tag] = value
+
+    profiler.write_tensorboard(_Writer(), global_step=5)
+    assert scalars["Profiler / step (mean_ms)"] == stats["step"]["mean_ms"]
+
+    env.disable_profiler()
+    assert env.profiler is None and not {"step", "physics_step", "update_reward"} & vars(env).keys()
+    env.step(action)
+    assert profiler.to_dict()["step"]["count"] == 5
+
+
+def test_model_cache_shares_models():
+    model_cache.clear_model_cache()
+    env = registry.make("cartpole", num_envs=2)
+    other = registry.make("cartpole", num_envs=3)
+    assert other.model is env.model
+    assert model_cache.model_cache_info().hits == 1
+
+    finer = registry.make("cartpole", num_envs=2, env_cfg_override={"sim_dt": env.cfg.sim_dt / 2})
+    assert finer.model is not env.model
+    assert finer.model.options.timestep == pytest.approx(env.cfg.sim_dt / 2)
+    private = registry.make("cartpole", num_envs=2, env_cfg_override={"cache_model": False})
+    assert private.model is not env.model
+
+    # stepping an env sharing the model does not affect the others
+    env.seed(0)
+    env.init_state()
+    private.seed(0)
+    private.init_state()
+    other.init_state()
+    for _ in range(5):
+        other.step(np.ones_like(_zero_action(other)))
+        np.testing.assert_array_equal(env.step(_zero_action(env)).obs, private.step(_zero_action(private)).obs)
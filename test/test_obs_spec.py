@@ -0,0 +1,67 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import numpy as np
+import pytest
+
+from motrix_envs.np.obs import ObsSpec, ObsTerm
+
+
+def test_obs_spec_layout_and_values():
+    spec = ObsSpec(
+        [
+            ObsTerm("linvel", 3, scale=2.0),
+            ObsTerm("dof_pos", 2, scale=np.array([1.0, 0.5]), offset=np.array([1.0, 2.0])),
+            ObsTerm("flag", 1),
+            ObsTerm("history", 4),
+        ]
+    )
+    assert spec.size == 10
+    assert spec.names == ("linvel", "dof_pos", "flag", "history")
+    assert spec.slices["flag"] == slice(5, 6)
+
+    num_envs = 5
+    out = spec.allocate(num_envs)
+    linvel = np.random.uniform(size=(num_envs, 3))
+    dof_pos = np.random.uniform(size=(num_envs, 2))
+    flag = np.arange(num_envs) > 2
+    history = np.random.uniform(size=(num_envs, 2, 2))
+    obs = spec.build(out, linvel=linvel, dof_pos=dof_pos, flag=flag, history=history)
+
+    expected = np.concatenate(
+        [
+            linvel * 2.0,
+            (dof_pos - [1.0, 2.0]) * [1.0, 0.5],
+            flag[:, None],
+            history.reshape(num_envs, -1),
+        ],
+        axis=-1,
+    )
+    assert obs is out
+    assert obs.dtype == np.float32
+    np.testing.assert_allclose(obs, expected, rtol=1e-6)
+    np.testing.assert_allclose(spec.split(obs)["dof_pos"], expected[:, 3:5], rtol=1e-6)
+
+    # allocates when no buffer is given
+    np.testing.assert_allclose(spec.build(linvel=linvel, dof_pos=dof_pos, flag=flag, history=history), obs)
+
+
+def test_obs_spec_rejects_missing_terms():
+    spec = ObsSpec([ObsTerm("a", 1), ObsTerm("b", 2)])
+    with pytest.raises(KeyError):
+        spec.build(spec.allocate(1), a=np.zeros(1))
+    with pytest.raises(ValueError):
+        ObsSpec([ObsTerm("a", 1), ObsTerm("a", 2)])
@@ -0,0 +1,50 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import importlib
+import subprocess
+import sys
+
+from motrix_envs import registry
+from motrix_rl import registry as rl_registry
+
+
+def test_list_registered_envs_does_not_import_envs():
+    code = (
+        "import sys\n"
+        "from motrix_envs import registry\n"
+        "from motrix_rl import registry as rl_registry\n"
+        "assert 'cartpole' in registry.list_registered_envs()\n"
+        "assert 'cartpole' in rl_registry.list_registered_envs()\n"
+        "assert registry.contains('cartpole')\n"
+        "loaded = [m for m in sys.modules if m.startswith(('motrix_envs.basic', 'motrix_rl.tasks.', 'motrixsim'))]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_manifests_match_registrations():
+    listed = registry.list_registered_envs()
+    for entry in registry._manifest.values():
+        importlib.import_module(entry.module)
+    assert registry.list_registered_envs() == listed
+    assert set(registry._envs) == set(registry._manifest)
+
+    for module in set(rl_registry._manifest.values()):
+        importlib.import_module(module)
+    assert set(rl_registry._rlcfgs) == set(rl_registry._manifest)
+    for env_name, module in rl_registry._manifest.items():
+        modules = {cls.__module__ for cfgs in rl_registry._rlcfgs[env_name].cfgs.values() for cls in cfgs.values()}
+        assert modules == {module}
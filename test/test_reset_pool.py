@@ -0,0 +1,106 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import threading
+
+import numpy as np
+import pytest
+
+from motrix_envs import registry
+from motrix_envs.np.reset_pool import ResetPool
+from motrix_envs.np.rng import EnvRng
+
+
+def _make_pool(size: int, max_uses: int, refill_async: bool):
+    model = registry.make("cartpole").model
+    calls = []
+
+    def generate(data, rng):
+        calls.append(data.shape[0])
+        dof_pos = rng.uniform(-0.1, 0.1, size=(data.shape[0], model.num_dof_pos)).astype(np.float32)
+        data.set_dof_pos(dof_pos, model)
+        return {"dof_pos": data.dof_pos.copy()}
+
+    pool = ResetPool(model, generate, size=size, max_uses=max_uses, refill_async=refill_async, rng=EnvRng(size, 3))
+    return pool, calls
+
+
+def test_reset_pool_serves_each_state_max_uses_times():
+    pool, calls = _make_pool(size=4, max_uses=2, refill_async=False)
+    assert calls == [4]
+    first = pool.sample(4)["dof_pos"]
+    assert first.shape == (4, 2)
+    assert len(np.unique(first[:, 0])) == 4
+    # the second use of every state leaves the whole pool stale, so it is regenerated
+    np.testing.assert_array_equal(pool.sample(4)["dof_pos"], first)
+    assert calls == [4, 4]
+    assert pool.num_fresh == 4
+    assert not np.isin(pool.sample(2)["dof_pos"][:, 0], first[:, 0]).any()
+
+    with pytest.raises(ValueError, match="Cannot sample 5"):
+        pool.sample(5)
+
+    # the slots draw from their own streams, so a pool seeded alike hands out the same states
+    again, _ = _make_pool(size=4, max_uses=2, refill_async=False)
+    np.testing.assert_array_equal(again.sample(4)["dof_pos"], first)
+
+
+def test_reset_pool_refills_in_the_background():
+    pool, calls = _make_pool(size=8, max_uses=1, refill_async=True)
+    for _ in range(10):
+        states = pool.sample(3)["dof_pos"]
+        assert states.shape == (3, 2)
+    pool.close()
+    assert sum(calls) >= 30
+
+
+def test_async_refill_does_not_disturb_the_stepping_env():
+    def make(refill_async: bool):
+        override = {"reset_pool_size": 8, "reset_pool_async": refill_async, "settle_steps": 4}
+        env = registry.make("dm-manipulator-bring-ball", num_envs=4, env_cfg_override=override)
+        env.seed(5)
+        return env
+
+    env, reference = make(True), make(False)
+    pool = env._get_reset_pool()
+    assert pool is not reference._get_reset_pool()
+    # the background refill generates with a task and a model of its own
+    assert pool._generate.__self__ is not env
+    assert pool._generate.__self__.model is not env.model
+
+    # hold the refill started by the first reset until the env stepped
+    release = threading.Event()
+    generate = pool._generate
+
+    def held_generate(data, rng):
+        release.wait()
+        return generate(data, rng)
+
+    pool._generate = held_generate
+    state = env.init_state()
+    expected = reference.init_state()
+    np.testing.assert_array_equal(state.obs, expected.obs)
+    actions = np.full((4, env.action_space.shape[0]), 0.5, dtype=np.float32)
+    for _ in range(3):
+        state = env.step(actions)
+        expected = reference.step(actions)
+        assert pool._pending is not None and not pool._pending.done()
+        np.testing.assert_array_equal(state.obs, expected.obs)
+    release.set()
+    pool.close()
+
+    # the refill generated what a synchronous one did
+    for name, values in reference._get_reset_pool()._states.items():
+        np.testing.assert_allclose(pool._states[name], values, rtol=1e-6, atol=1e-6)
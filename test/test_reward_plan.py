@@ -0,0 +1,58 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import numpy as np
+
+from motrix_envs import registry
+from motrix_envs.locomotion.go2.cfg import RewardConfig
+from motrix_envs.np.reward import RewardPlan
+
+
+def test_reward_plan_drops_zero_scales():
+    calls = []
+
+    def term(name, value):
+        def fn(x):
+            calls.append(name)
+            return np.full_like(x, value)
+
+        return fn
+
+    terms = {"a": term("a", 1.0), "b": term("b", 2.0), "c": term("c", 3.0), "d": term("d", 4.0)}
+    plan = RewardPlan(terms, {"a": 1.0, "b": -0.0, "c": 0.5})
+    assert plan.names == ("a", "c")
+
+    out = np.full(4, 100.0, dtype=np.float32)
+    plan.compute(np.zeros(4), out=out)
+    np.testing.assert_allclose(out, 2.5)
+    assert calls == ["a", "c"]
+    assert plan.values == {}
+
+    logging_plan = RewardPlan(terms, {"a": 1.0, "c": 0.5}, log_terms=True)
+    logging_plan.compute(np.zeros(4), out=out)
+    assert logging_plan.values.keys() == {"a", "c"}
+    np.testing.assert_allclose(logging_plan.values["c"], 1.5)
+
+
+def test_go2_reward_terms_logging():
+    env = registry.make(
+        "go2-flat-terrain-walk", num_envs=2, env_cfg_override={"reward_config": RewardConfig(log_terms=True)}
+    )
+    action = np.zeros((2, *env.action_space.shape), dtype=np.float32)
+    state = env.step(action)
+    rewards = state.info["Reward"]
+    assert set(rewards) == set(env._reward_plan.names)
+    assert "orientation" not in rewards
@@ -0,0 +1,55 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+import pytest
+
+from motrix_envs.np.rng import EnvRng, philox4x32
+
+
+def test_philox4x32_known_answers():
+    # Random123 known-answer vectors of philox4x32_10
+    counters = np.array([[0, 0, 0, 0], [0xFFFFFFFF] * 4], dtype=np.uint32)
+    np.testing.assert_array_equal(philox4x32(counters[:1], (0, 0)), [[0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8]])
+    np.testing.assert_array_equal(
+        philox4x32(counters[1:], (0xFFFFFFFF, 0xFFFFFFFF)), [[0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD]]
+    )
+
+
+def test_env_rng_streams_are_keyed_by_env():
+    batch = EnvRng(4, seed=7)
+    values = batch.uniform(-1.0, 1.0, size=(4, 3))
+    assert values.shape == (4, 3)
+    assert ((values >= -1.0) & (values < 1.0)).all()
+
+    # a shard of the batch draws the values of its global envs
+    shard = EnvRng(2, seed=7, env_offset=2)
+    np.testing.assert_array_equal(shard.uniform(-1.0, 1.0, size=(2, 3)), values[2:])
+
+    # resetting some envs draws their rows of a new episode, leaving the others' streams alone
+    batch.new_episode([1])
+    with batch.active([1]):
+        assert batch.num_active == 1
+        reset = batch.random()
+    assert reset.shape == (1,)
+    again = EnvRng(4, seed=7)
+    again.uniform(size=(4, 3))
+    again.new_episode([1])
+    with again.active([1]):
+        np.testing.assert_array_equal(again.random(), reset)
+    np.testing.assert_array_equal(batch.random(rows=[0, 3]), again.random(rows=[0, 3]))
+
+    with pytest.raises(ValueError, match="number of drawing envs"):
+        batch.random((3,))
@@ -0,0 +1,68 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import numpy as np
+import pytest
+
+from motrix_envs.math import quaternion, rotation
+
+
+def _random_quats(num: int, seed: int) -> np.ndarray:
+    samples = np.random.default_rng(seed).random((num, 3))
+    return quaternion.generate_random_shoemake(num, samples).astype(np.float32)
+
+
+def _check_kernels():
+    q1, q2 = _random_quats(64, 0), _random_quats(64, 1)
+    v = np.random.default_rng(2).normal(size=(64, 3)).astype(np.float32)
+
+    np.testing.assert_allclose(rotation.mul(q1, q2), quaternion.mul(q1, q2), atol=1e-6)
+    np.testing.assert_allclose(rotation.conjugate(q1), quaternion.conjugate(q1), atol=1e-6)
+    np.testing.assert_allclose(rotation.rotate(q1, v), quaternion.rotate_vector(q1, v), atol=1e-5)
+    np.testing.assert_allclose(rotation.rotate_inverse(q1, v), quaternion.rotate_inverse(q1, v), atol=1e-5)
+    gravity = quaternion.rotate_inverse(q1, np.array([0.0, 0.0, -1.0], dtype=np.float32))
+    np.testing.assert_allclose(rotation.projected_gravity(q1), gravity, atol=1e-6)
+    np.testing.assert_allclose(rotation.yaw(q1), quaternion.get_yaw(q1), atol=1e-6)
+    np.testing.assert_allclose(rotation.similarity(q1, q2[0]), quaternion.similarity(q1, q2[0]), atol=1e-5)
+
+    q_rel = quaternion.mul(q1, quaternion.conjugate(q2))
+    q_rel *= np.where(q_rel[:, 3:] < 0.0, -1.0, 1.0).astype(np.float32)
+    relative = rotation.relative(q1, q2)
+    np.testing.assert_allclose(relative, q_rel, atol=1e-6)
+    assert np.all(relative[:, 3] >= 0.0)
+
+    # float32 results, written into an output aliasing an input
+    out = q1.astype(np.float64)
+    assert rotation.mul(out, q2).dtype == np.float32
+    out = q1.copy()
+    assert rotation.mul(out, q2, out=out) is out
+    np.testing.assert_allclose(out, quaternion.mul(q1, q2), atol=1e-6)
+
+
+def test_numpy_kernels_match_quaternion():
+    _check_kernels()
+    with pytest.raises(ValueError, match="float32 output"):
+        rotation.yaw(_random_quats(4, 0), out=np.empty((4,), dtype=np.float64))
+
+
+def test_numba_kernels_match_quaternion():
+    pytest.importorskip("numba")
+    rotation.set_backend("numba")
+    try:
+        assert rotation.get_backend() == "numba"
+        _check_kernels()
+    finally:
+        rotation.set_backend("numpy")
@@ -0,0 +1,45 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import numpy as np
+import pytest
+
+from motrix_envs import registry
+
+
+def test_sensor_group_reads_sensors_in_order():
+    env = registry.make("dm-humanoid-walk", num_envs=3)
+    state = env.init_state()
+    for _ in range(5):
+        state = env.step(np.zeros((3, env.action_space.shape[0]), dtype=np.float32))
+    model, data = env.model, state.data
+
+    names = ["torso_gyro", "torso_subtreelinvel", "torso_vel"]
+    group = env.sensor_group(names)
+    assert env.sensor_group(tuple(names)) is group
+    assert group.dim == 9
+    assert group.slice("torso_subtreelinvel") == slice(3, 6)
+
+    expected = np.concatenate([model.get_sensor_value(name, data) for name in names], axis=-1)
+    np.testing.assert_array_equal(group.read(data), expected)
+
+    obs = np.zeros((3, 12), dtype=np.float32)
+    group.read(data, out=obs[:, 2:11])
+    np.testing.assert_array_equal(obs[:, 2:11], expected)
+    np.testing.assert_array_equal(obs[:, [0, 1, 11]], 0.0)
+
+    with pytest.raises(ValueError, match="shape"):
+        group.read(data, out=obs)
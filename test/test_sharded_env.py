@@ -0,0 +1,116 @@
+# Copyright (C) 2020-2025 Motphys Technology Co., Ltd. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+
+import numpy as np
+import pytest
+
+from motrix_envs import registry
+from motrix_envs.base import ABEnv
+from motrix_envs.np.sharded import ShardedNpEnv
+
+
+def _rollout(seed: int) -> list[np.ndarray]:
+    env = ShardedNpEnv("cartpole", num_envs=5, num_workers=2, seed=seed)
+    try:
+        assert isinstance(env, ABEnv)
+        assert env.num_workers == 2
+        state = env.init_state()
+        assert state.obs.shape == (5, env.observation_space.shape[0])
+        np.testing.assert_array_equal(state.info["steps"], 0)
+        actions = np.linspace(-1, 1, 5 * env.action_space.shape[0]).reshape(5, -1)
+        obs = []
+        for _ in range(2):
+            assert env.step(actions) is state
+            obs.append(state.obs.copy())
+        env.step_async(actions)
+        with pytest.raises(RuntimeError, match="pending"):
+            env.step(actions)
+        assert env.step_wait() is state
+        obs.append(state.obs.copy())
+        np.testing.assert_array_equal(state.info["steps"], 3)
+        assert not state.done.any()
+        return obs
+    finally:
+        env.close()
+
+
+def test_sharded_env_steps_in_shared_buffers():
+    obs = _rollout(seed=1)
+    np.testing.assert_array_equal(obs, _rollout(seed=1))
+    # the first env of each shard would match if the workers shared their random state
+    assert not np.array_equal(obs[0][0], obs[0][2])
+
+    # the per-env streams make the shards draw what a single batch seeded alike does
+    env = registry.make("cartpole", num_envs=5)
+    env.seed(1)
+    state = env.init_state()
+    actions = np.linspace(-1, 1, 5 * env.action_space.shape[0]).reshape(5, -1)
+    for expected in obs:
+        state = env.step(actions)
+        np.testing.assert_allclose(state.obs, expected, rtol=1e-6, atol=1e-6)
+
+
+def test_sharded_env_shares_dict_info_and_forwards_seed():
+    env = ShardedNpEnv("dm-lqr-2-1", num_envs=4, num_workers=2, seed=3)
+    single = registry.make("dm-lqr-2-1", num_envs=4)
+    try:
+        actions = np.linspace(-1, 1, 4 * env.action_space.shape[0]).reshape(4, -1)
+        for seed in (5, 7):
+            env.seed(seed)
+            single.seed(seed)
+            state = env.init_state()
+            expected = single.init_state()
+            np.testing.assert_allclose(state.obs, expected.obs, rtol=1e-6, atol=1e-6)
+            for _ in range(2):
+                state = env.step(actions)
+                expected = single.step(actions)
+            np.testing.assert_allclose(state.obs, expected.obs, rtol=1e-6, atol=1e-6)
+            for group in ("Reward", "metrics"):
+                assert set(state.info[group]) == set(expected.info[group])
+                for key, value in expected.info[group].items():
+                    np.testing.assert_allclose(state.info[group][key], value, rtol=1e-5, atol=1e-6)
+    finally:
+        env.close()
+
+
+def test_sharded_env_reports_worker_errors():
+    with pytest.raises(RuntimeError, match="no attribute 'no_such_field'"):
+        ShardedNpEnv("cartpole", num_envs=2, num_workers=2, env_cfg_override={"no_such_field": 1})
+
+    env = ShardedNpEnv("cartpole", num_envs=2, num_workers=1)
+    env.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        env.step(np.zeros((2, 1)))
+
+
+def test_sharded_env_matches_single_process_with_kept_actions():
+    # go2 keeps the actions of the last two steps in its info, for the action rate reward and the observations
+    env = ShardedNpEnv("go2-flat-terrain-walk", num_envs=4, num_workers=2, seed=2)
+    single = registry.make("go2-flat-terrain-walk", num_envs=4)
+    single.seed(2)
+    try:
+        state = env.init_state()
+        expected = single.init_state()
+        rng = np.random.default_rng(0)
+        for _ in range(3):
+            actions = rng.uniform(-1, 1, (4, env.action_space.shape[0])).astype(np.float32)
+            state = env.step(actions)
+            expected = single.step(actions)
+            np.testing.assert_allclose(state.obs, expected.obs, rtol=1e-5, atol=1e-5)
+            np.testing.assert_allclose(state.reward, expected.reward, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(state.info["current_actions"], actions)
+    finally:
+        env.close()